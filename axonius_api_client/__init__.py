@@ -2,7 +2,7 @@
 """Python API Client for Axonius."""
 from __future__ import absolute_import, division, print_function, unicode_literals
 
-from . import api, auth, cli, constants, exceptions, http, logs, tools, version
+from . import api, auth, cache, cli, constants, exceptions, http, logs, tools, version
 from .api import Adapters, Devices, Enforcements, Users, System
 from .auth import ApiKey
 from .connect import Connect
@@ -27,6 +27,7 @@ __all__ = (
     # modules
     "api",
     "auth",
+    "cache",
     "http",
     "exceptions",
     "version",
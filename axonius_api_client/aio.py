@@ -0,0 +1,1325 @@
+# -*- coding: utf-8 -*-
+"""Asyncio API client for Axonius, built on :obj:`httpx.AsyncClient`.
+
+Requires python 3.6+ and httpx: pip install axonius_api_client[async]
+"""
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import asyncio
+import collections
+import ssl
+
+from . import auth, connect, constants, exceptions, http, logs, tools, version
+from .api import assets, routers
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover
+    httpx = None
+
+HTTP_ARGS_UNSUPPORTED = {
+    "retries": constants.RETRIES,
+    "pool_connections": constants.POOL_CONNECTIONS,
+    "pool_maxsize": constants.POOL_MAXSIZE,
+    "pool_block": False,
+    "tcp_keepalive": False,
+    "http_adapter": None,
+    "compress": False,
+}
+""":obj:`dict`: Arguments of :obj:`axonius_api_client.http.Http` that
+:obj:`AsyncHttp` does not support -> the value that means they are not used."""
+
+
+class AsyncHttp(object):
+    """HTTP client for sending requests using :obj:`httpx.AsyncClient`.
+
+    Attributes:
+        session (:obj:`httpx.AsyncClient`): Client object for sending requests.
+        url (:obj:`str`): URL of Axonius instance.
+
+    """
+
+    def __init__(
+        self,
+        url,
+        connect_timeout=5,
+        response_timeout=60,
+        certpath=None,
+        certwarn=True,
+        certverify=False,
+        cert_client_both=None,
+        cert_client_cert=None,
+        cert_client_key=None,
+        http_proxy=None,
+        https_proxy=None,
+        save_last=True,
+        save_history=False,
+        history_size=constants.HISTORY_SIZE,
+        history_meta=False,
+        history_sample=1,
+        max_connections=constants.ASYNC_MAX_CONNECTIONS,
+        max_keepalive=constants.ASYNC_MAX_KEEPALIVE,
+        # fmt: off
+        **kwargs
+        # fmt: on
+    ):
+        """HTTP client for sending requests using :obj:`httpx.AsyncClient`.
+
+        Args:
+            url (:obj:`str` or :obj:`axonius_api_client.http.ParserUrl`):
+                Axonius API URL.
+            max_connections (:obj:`int`, optional):
+                Maximum number of connections in the shared connection pool.
+
+                Defaults to: :data:`constants.ASYNC_MAX_CONNECTIONS`.
+            max_keepalive (:obj:`int`, optional):
+                Maximum number of idle connections to keep open in the pool.
+
+                Defaults to: :data:`constants.ASYNC_MAX_KEEPALIVE`.
+            **kwargs:
+                All other arguments are the same as :obj:`axonius_api_client.http.Http`.
+                certwarn is accepted but not used, httpx does not emit
+                InsecureRequestWarning. The arguments in
+                :data:`HTTP_ARGS_UNSUPPORTED` are only accepted if they are not used,
+                use max_connections and max_keepalive to size the pool.
+
+        Raises:
+            :exc:`exceptions.HttpError`: If httpx is not installed, or an argument
+                in :data:`HTTP_ARGS_UNSUPPORTED` is used.
+
+        """
+        if httpx is None:
+            error = "httpx is required for {c}, install it with: {cmd}"
+            error = error.format(
+                c=self.__class__.__name__, cmd="pip install axonius_api_client[async]"
+            )
+            raise exceptions.HttpError(error)
+
+        unsupported = [
+            "{}={!r}".format(k, kwargs[k])
+            for k, v in HTTP_ARGS_UNSUPPORTED.items()
+            if kwargs.get(k, v) != v
+        ]
+        if unsupported:
+            error = "Arguments not supported by {c}: {u}"
+            error = error.format(c=self.__class__.__name__, u=", ".join(unsupported))
+            raise exceptions.HttpError(error)
+
+        log_level = kwargs.get("log_level", constants.LOG_LEVEL_HTTP)
+        self._log = logs.get_obj_log(obj=self, level=log_level)
+        """:obj:`logging.Logger`: Logger for this object."""
+
+        if isinstance(url, http.ParserUrl):
+            self._URLPARSED = url
+        else:
+            self._URLPARSED = http.ParserUrl(url=url, default_scheme="https")
+
+        self.url = self._URLPARSED.url
+        """:obj:`str`: URL of Axonius API."""
+
+        self._LAST_REQUEST = None
+        """:obj:`httpx.Request`: Last request sent."""
+
+        self._LAST_RESPONSE = None
+        """:obj:`httpx.Response`: Last response received."""
+
+        self._SAVE_LAST = save_last
+        """:obj:`bool`: Save requests to last_request and responses to last_response."""
+
+        self._HISTORY = collections.deque(maxlen=history_size)
+        """:obj:`collections.deque` of :obj:`httpx.Response` or :obj:`dict`:
+        History of responses."""
+
+        self._SAVE_HISTORY = save_history
+        """:obj:`bool`: Append responses to history."""
+
+        self._HISTORY_META = history_meta
+        """:obj:`bool`: Append response metadata to history instead of responses."""
+
+        self._HISTORY_SAMPLE = max(history_sample or 1, 1)
+        """:obj:`int`: Append 1 out of every N responses to history."""
+
+        self._HISTORY_SEEN = 0
+        """:obj:`int`: Number of responses seen while save_history is True."""
+
+        self._CONNECT_TIMEOUT = connect_timeout
+        """:obj:`int`: Seconds to wait for connection to url to open."""
+
+        self._RESPONSE_TIMEOUT = response_timeout
+        """:obj:`int`: Seconds to wait for response from url."""
+
+        if self._URLPARSED.scheme == "https":
+            proxy = https_proxy or None
+        else:
+            proxy = http_proxy or None
+
+        self.session = httpx.AsyncClient(
+            verify=self._ssl_context(
+                certpath=certpath,
+                certverify=certverify,
+                cert_client_both=cert_client_both,
+                cert_client_cert=cert_client_cert,
+                cert_client_key=cert_client_key,
+            ),
+            proxy=proxy,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive,
+            ),
+            timeout=httpx.Timeout(response_timeout, connect=connect_timeout),
+        )
+        """:obj:`httpx.AsyncClient`: Client object to use."""
+
+        self._LOG_REQUEST_BODY = kwargs.get("log_request_body", False)
+        """:obj:`bool`: Log the full request body."""
+
+        self._LOG_RESPONSE_BODY = kwargs.get("log_response_body", False)
+        """:obj:`bool`: Log the full response body."""
+
+        self._LOG_RESPONSE_ATTRS = []
+        """:obj:`list` of :obj:`str`: Request attributes to log."""
+
+        self._LOG_REQUEST_ATTRS = []
+        """:obj:`list` of :obj:`str`: Response attributes to log."""
+
+        log_response_attrs = kwargs.get("log_response_attrs", None)
+        if log_response_attrs is True:
+            self._LOG_RESPONSE_ATTRS = constants.LOG_RESPONSE_ATTRS_VERBOSE
+        elif log_response_attrs is False:
+            self._LOG_RESPONSE_ATTRS = constants.LOG_RESPONSE_ATTRS_BRIEF
+
+        log_request_attrs = kwargs.get("log_request_attrs", None)
+        if log_request_attrs is True:
+            self._LOG_REQUEST_ATTRS = constants.LOG_REQUEST_ATTRS_VERBOSE
+        elif log_request_attrs is False:
+            self._LOG_REQUEST_ATTRS = constants.LOG_REQUEST_ATTRS_BRIEF
+
+    def _ssl_context(
+        self,
+        certpath=None,
+        certverify=False,
+        cert_client_both=None,
+        cert_client_cert=None,
+        cert_client_key=None,
+    ):
+        """Build the SSL context used to verify the server and supply client certs.
+
+        Returns:
+            :obj:`ssl.SSLContext`
+
+        """
+        if certpath:
+            tools.path_read(obj=certpath)
+            context = ssl.create_default_context(cafile=format(certpath))
+        else:
+            context = ssl.create_default_context()
+
+            if not certverify:
+                context.check_hostname = False
+                context.verify_mode = ssl.CERT_NONE
+
+        if cert_client_both:
+            tools.path_read(obj=cert_client_both)
+            context.load_cert_chain(certfile=format(cert_client_both))
+        elif cert_client_cert or cert_client_key:
+            if not all([cert_client_cert, cert_client_key]):
+                error = (
+                    "You must supply both a 'cert_client_cert' and 'cert_client_key'"
+                    " or use 'cert_client_both'!"
+                )
+                raise exceptions.HttpError(error)
+
+            tools.path_read(obj=cert_client_cert)
+            tools.path_read(obj=cert_client_key)
+            context.load_cert_chain(
+                certfile=format(cert_client_cert), keyfile=format(cert_client_key)
+            )
+
+        return context
+
+    async def __call__(
+        self,
+        path=None,
+        route=None,
+        method="get",
+        data=None,
+        params=None,
+        headers=None,
+        json=None,
+        files=None,
+        # fmt: off
+        **kwargs
+        # fmt: on
+    ):
+        """Create and then send a request using :attr:`session`.
+
+        Args:
+            **kwargs:
+                Same as :meth:`axonius_api_client.http.Http.__call__`.
+
+        Returns:
+            :obj:`httpx.Response`
+
+        """
+        url = tools.join_url(self.url, path, route)
+
+        headers = headers or {}
+        headers.setdefault("User-Agent", self.user_agent)
+
+        body = {}
+        if isinstance(data, (tools.BYTES,) + tuple(tools.STR)):
+            body["content"] = data
+        elif data is not None:
+            body["data"] = data
+
+        request = self.session.build_request(
+            method=method.upper(),
+            url=url,
+            params=params,
+            headers=headers,
+            json=json,
+            files=files or None,
+            timeout=httpx.Timeout(
+                kwargs.get("response_timeout", self._RESPONSE_TIMEOUT),
+                connect=kwargs.get("connect_timeout", self._CONNECT_TIMEOUT),
+            ),
+            # fmt: off
+            **body
+            # fmt: on
+        )
+        request.body = self._request_body(request=request)
+        request.size = request.size_wire = len(request.body or b"")
+
+        if self._SAVE_LAST:
+            self._LAST_REQUEST = request
+
+        if self._LOG_REQUEST_ATTRS:
+            msg = ", ".join(self._LOG_REQUEST_ATTRS)
+            msg = msg.format(
+                request=request, size=request.size, size_wire=request.size_wire
+            )
+            self._log.debug(msg)
+
+        if self._LOG_REQUEST_BODY:
+            msg = "request body:\n{body}"
+            msg = msg.format(body=tools.json_dump(obj=request.body, error=False))
+            self._log.debug(msg)
+
+        response = await self.session.send(request)
+
+        # requests compatible attribute names used by exceptions and log attrs
+        response.reason = response.reason_phrase
+        response.size = len(response.content or b"")
+        response.size_wire = response.num_bytes_downloaded or response.size
+
+        if self._SAVE_LAST:
+            self._LAST_RESPONSE = response
+
+        if self._SAVE_HISTORY:
+            self._add_history(response=response)
+
+        if self._LOG_RESPONSE_ATTRS:
+            msg = ", ".join(self._LOG_RESPONSE_ATTRS)
+            msg = msg.format(
+                response=response, size=response.size, size_wire=response.size_wire
+            )
+            self._log.debug(msg)
+
+        if self._LOG_RESPONSE_BODY:
+            msg = "response body:\n{body}"
+            msg = msg.format(body=tools.json_dump(obj=response.text, error=False))
+            self._log.debug(msg)
+
+        return response
+
+    _add_history = http.Http._add_history
+
+    def _request_body(self, request):
+        """Get the body of a request, or None if it is a stream.
+
+        Returns:
+            :obj:`bytes`
+
+        """
+        try:
+            return request.content or None
+        except httpx.RequestNotRead:
+            return None
+
+    async def close(self):
+        """Close all connections in the connection pool."""
+        await self.session.aclose()
+
+    def __str__(self):
+        """Show object info.
+
+        Returns:
+            :obj:`str`
+
+        """
+        return "{c.__module__}.{c.__name__}(url={url!r})".format(
+            c=self.__class__, url=self.url
+        )
+
+    def __repr__(self):
+        """Show object info.
+
+        Returns:
+            :obj:`str`
+
+        """
+        return self.__str__()
+
+    @property
+    def user_agent(self):
+        """Build a user agent string for use in User-Agent header.
+
+        Returns:
+            :obj:`str`
+
+        """
+        msg = "{name}.{clsname}/{ver}"
+        return msg.format(
+            name=__name__, clsname=self.__class__.__name__, ver=version.__version__
+        )
+
+
+class AsyncApiKey(auth.ApiKey):
+    """Authentication method using API key & API secret with :obj:`AsyncHttp`."""
+
+    async def _validate(self):
+        """Validate credentials."""
+        response = await self.http(method="get", path=routers.ApiV1.devices.count)
+
+        try:
+            response.raise_for_status()
+        except Exception as exc:
+            self._logged_in = False
+            raise exceptions.InvalidCredentials(auth=self, exc=exc)
+
+        self._logged_in = True
+
+    async def login(self):
+        """Login to API."""
+        if self.is_logged_in:
+            raise exceptions.AlreadyLoggedIn(auth=self)
+
+        self.http.session.headers["api-key"] = self._creds["key"]
+        self.http.session.headers["api-secret"] = self._creds["secret"]
+
+        await self._validate()
+
+        self._logged_in = True
+
+        msg = "Successfully logged in using {}".format(self._cred_fields)
+        self._log.debug(msg)
+
+
+class NotAsync(object):
+    """Attribute of a sync API object that is not available in its asyncio version.
+
+    Notes:
+        Getting the attribute raises :exc:`exceptions.ApiError`, and setting it,
+        as the __init__ of the sync API object does, is ignored.
+    """
+
+    def __init__(self, instead):
+        """Pass.
+
+        Args:
+            instead (:obj:`str`):
+                What to use instead, added to the error.
+
+        """
+        self.instead = instead
+        self.name = None
+
+    def __set_name__(self, owner, name):
+        """Pass."""
+        self.name = name
+
+    def __get__(self, obj, cls=None):
+        """Pass."""
+        if obj is None:
+            return self
+
+        error = "{n!r} is not available in {c}, {i}"
+        error = error.format(n=self.name, c=obj.__class__.__name__, i=self.instead)
+        raise exceptions.ApiError(error)
+
+    def __set__(self, obj, value):
+        """Pass."""
+        pass
+
+
+class AsyncAssetMixin(object):
+    """Asyncio versions of the methods in :obj:`assets.AssetMixin`.
+
+    Notes:
+        Methods that only return the result of :meth:`_request`, such as count,
+        labels.get and get_by_hostname, are inherited as is and return awaitables.
+        Methods that run requests in threads, such as get_by_values, and the
+        adapters API object are :obj:`NotAsync` and raise
+        :exc:`exceptions.ApiError`, use asyncio.gather instead.
+
+    """
+
+    adapters = NotAsync(instead="use Connect instead")
+    counts = NotAsync(instead="use asyncio.gather with count for each query instead")
+    get_dataframe = NotAsync(
+        instead="build a DataFrame from the rows of await get instead"
+    )
+    get_by_values = NotAsync(
+        instead="use asyncio.gather with get_by_value for each value instead"
+    )
+    get_by_values_generator = NotAsync(
+        instead="use asyncio.gather with get_by_value for each value instead"
+    )
+    get_by_ids = NotAsync(
+        instead="use asyncio.gather with get_by_id for each id instead"
+    )
+    get_by_ids_generator = NotAsync(
+        instead="use asyncio.gather with get_by_id for each id instead"
+    )
+
+    def _init(self, auth, **kwargs):
+        """Pass."""
+        super(AsyncAssetMixin, self)._init(auth=auth, **kwargs)
+
+        # counts and pages are awaitables here, so cache=True is ignored
+        self.result_cache = None
+        self.labels = AsyncLabels(parent=self)
+        self.saved_query = AsyncSavedQuery(parent=self)
+        self.fields = AsyncFields(parent=self)
+
+    async def _request(
+        self,
+        path,
+        method="get",
+        raw=False,
+        is_json=True,
+        error_status=True,
+        error_json_bad_status=True,
+        error_json_invalid=True,
+        # fmt: off
+        **kwargs
+        # fmt: on
+    ):
+        """Perform a REST API request.
+
+        Args:
+            **kwargs:
+                Same as :meth:`axonius_api_client.api.mixins.Mixins._request`.
+
+        Returns:
+            :obj:`object` if is_json, or :obj:`str` if not is_json, or
+            :obj:`httpx.Response` if raw
+
+        """
+        sargs = {}
+        sargs.update(kwargs)
+        sargs.update({"path": path, "method": method})
+
+        response = await self._auth.http(**sargs)
+
+        return self._handle_response(
+            response=response,
+            raw=raw,
+            is_json=is_json,
+            error_status=error_status,
+            error_json_bad_status=error_json_bad_status,
+            error_json_invalid=error_json_invalid,
+        )
+
+    async def count_by_saved_query(self, name):
+        """Get the number of matches for a given saved query.
+
+        Returns:
+            :obj:`int`
+
+        """
+        sq = await self.saved_query.get_by_name(
+            value=name, match_count=1, match_error=True
+        )
+        return await self._count(query=sq["view"]["query"]["filter"])
+
+    async def get(
+        self,
+        query=None,
+        fields=None,
+        fields_manual=None,
+        fields_regex=None,
+        fields_default=True,
+        fields_error=True,
+        max_rows=None,
+        max_pages=None,
+        page_size=None,
+        all_fields=None,
+        workers=None,
+        generator=False,
+    ):
+        """Get objects for a given query using paging.
+
+        Returns:
+            :obj:`list` of :obj:`dict`, or an async generator if generator=True
+
+        """
+        gen = self.get_generator(
+            query=query,
+            fields=fields,
+            fields_manual=fields_manual,
+            fields_regex=fields_regex,
+            fields_default=fields_default,
+            fields_error=fields_error,
+            max_rows=max_rows,
+            max_pages=max_pages,
+            page_size=page_size,
+            all_fields=all_fields,
+            workers=workers,
+        )
+
+        if generator:
+            return gen
+
+        return [row async for row in gen]
+
+    async def get_generator(
+        self,
+        query=None,
+        fields=None,
+        fields_manual=None,
+        fields_regex=None,
+        fields_default=True,
+        fields_error=True,
+        max_rows=None,
+        max_pages=None,
+        page_size=None,
+        all_fields=None,
+        workers=None,
+    ):
+        """Get objects for a given query using paging.
+
+        Args:
+            workers (:obj:`int`, optional):
+                If more than 1, get the count of the query first and then fetch
+                up to N pages at once. Rows are still yielded in order.
+
+                Defaults to: None.
+
+        Yields:
+            :obj:`dict`: Each row found in 'assets' from return.
+
+        """
+        all_fields = all_fields or await self.fields.get()
+
+        fields = self.fields.validate(
+            fields=fields,
+            fields_manual=fields_manual,
+            fields_regex=fields_regex,
+            error=fields_error,
+            default=fields_default,
+            all_fields=all_fields,
+        )
+
+        if not page_size or page_size > constants.MAX_PAGE_SIZE:
+            msg = "Changed page_size={ps} to max_page_size={mps}"
+            msg = msg.format(ps=page_size, mps=constants.MAX_PAGE_SIZE)
+            self._log.debug(msg)
+
+            page_size = constants.MAX_PAGE_SIZE
+
+        page_info = {}
+        rows_fetched = 0
+        fetch_start = tools.dt_now()
+
+        self._LAST_GET = self._get_params(
+            query=query, fields=fields, row_start=0, page_size=page_size
+        )
+
+        msg = [
+            "Starting get: page_size={}".format(page_size),
+            "workers={}".format(workers or 1),
+            "query={!r}".format(query or ""),
+            "fields={!r}".format(fields),
+        ]
+        self._log.debug(tools.join_comma(msg))
+
+        page_args = {
+            "query": query,
+            "fields": fields,
+            "page_size": page_size,
+            "max_rows": max_rows,
+            "max_pages": max_pages,
+        }
+
+        if workers and workers > 1:
+            pages = self._get_pages_workers(workers=workers, **page_args)
+        else:
+            pages = self._get_pages(**page_args)
+
+        async for page in pages:
+            page_info = page["page"]
+            rows_fetched += len(page["assets"])
+
+            for asset in page["assets"]:
+                yield asset
+
+        msg = [
+            "Finished get: rows_fetched={}".format(rows_fetched),
+            "total_rows={}".format(page_info.get("totalResources", 0)),
+            "fetch_took={}".format(tools.dt_sec_ago(obj=fetch_start)),
+            "query={!r}".format(query or ""),
+            "fields={!r}".format(fields),
+        ]
+        self._log.debug(tools.join_comma(obj=msg))
+
+    async def _get_page(self, query, fields, row_start, page_size, page_num):
+        """Get a single page and log how long it took.
+
+        Returns:
+            :obj:`dict`
+
+        """
+        page_start = tools.dt_now()
+
+        msg = [
+            "Fetching page_num={}".format(page_num),
+            "page_size={}".format(page_size),
+            "row_start={}".format(row_start),
+        ]
+        self._log.debug(tools.join_comma(obj=msg))
+
+        page = await self._get(
+            query=query, fields=fields, row_start=row_start, page_size=page_size
+        )
+
+        msg = [
+            "Fetched page_num={}".format(page_num),
+            "page_took={}".format(tools.dt_sec_ago(obj=page_start)),
+            "rows_fetched={}".format(len(page["assets"])),
+            "page_info={}".format(page["page"]),
+        ]
+        self._log.debug(tools.join_comma(obj=msg))
+
+        return page
+
+    async def _get_pages(self, query, fields, page_size, max_rows=None, max_pages=None):
+        """Get pages one at a time until no more rows are returned.
+
+        Yields:
+            :obj:`dict`: Each page returned from :meth:`_get`.
+
+        """
+        page_num = 0
+        rows_fetched = 0
+
+        while True:
+            page_num += 1
+            rows_left = max_rows - rows_fetched if max_rows else -1
+
+            if 0 < rows_left < page_size:
+                msg = "Changed page_size={ps} to rows_left={rl} (max_rows={mr})"
+                msg = msg.format(ps=page_size, rl=rows_left, mr=max_rows)
+                self._log.debug(msg)
+
+                page_size = rows_left
+
+            page = await self._get_page(
+                query=query,
+                fields=fields,
+                row_start=rows_fetched,
+                page_size=page_size,
+                page_num=page_num,
+            )
+
+            rows_fetched += len(page["assets"])
+
+            yield page
+
+            if not page["assets"]:
+                msg = "Stopped fetch loop, page with no assets returned"
+                self._log.debug(msg)
+                break
+
+            if max_pages and page_num >= max_pages:
+                msg = "Stopped fetch loop, hit max_pages={mp}"
+                msg = msg.format(mp=max_pages)
+                self._log.debug(msg)
+                break
+
+            if max_rows and rows_fetched >= max_rows:
+                msg = "Stopped fetch loop, hit max_rows={mr} with rows_fetched={rf}"
+                msg = msg.format(mr=max_rows, rf=rows_fetched)
+                self._log.debug(msg)
+                break
+
+    async def _get_pages_workers(
+        self, query, fields, page_size, workers, max_rows=None, max_pages=None
+    ):
+        """Get up to N pages at once, yielding them in order.
+
+        Yields:
+            :obj:`dict`: Each page returned from :meth:`_get`.
+
+        """
+        total = await self._count(query=query)
+
+        if max_rows:
+            total = min(total, max_rows)
+
+        windows = [
+            (row_start, min(page_size, total - row_start))
+            for row_start in range(0, total, page_size)
+        ]
+
+        if max_pages:
+            windows = windows[:max_pages]
+
+        windows = iter(enumerate(windows, 1))
+        pending = []
+
+        def submit():
+            window = next(windows, None)
+            if window:
+                page_num, (row_start, limit) = window
+                task = asyncio.ensure_future(
+                    self._get_page(
+                        query=query,
+                        fields=fields,
+                        row_start=row_start,
+                        page_size=limit,
+                        page_num=page_num,
+                    )
+                )
+                pending.append((page_num, limit, task))
+
+        try:
+            for _ in range(workers):
+                submit()
+
+            while pending:
+                page_num, limit, task = pending.pop(0)
+                page = await task
+
+                submit()
+
+                yield page
+
+                if len(page["assets"]) < limit:
+                    msg = "Stopped fetch loop, page_num={pn} had {n} of {ps} rows"
+                    msg = msg.format(pn=page_num, n=len(page["assets"]), ps=limit)
+                    self._log.debug(msg)
+                    break
+        finally:
+            for page_num, limit, task in pending:
+                task.cancel()
+
+    async def get_by_id(self, id):
+        """Get an object by internal_axon_id.
+
+        Returns:
+           :obj:`dict`
+
+        """
+        try:
+            return await self._get_by_id(id=id)
+        except exceptions.JsonError as exc:
+            msg = "Axonius ID for {t}".format(t=self._router._object_type)
+            raise exceptions.ValueNotFound(value=id, value_msg=msg, exc=exc)
+
+    async def get_by_saved_query(
+        self,
+        name,
+        fields=None,
+        fields_regex=None,
+        fields_default=False,
+        max_rows=None,
+        max_pages=None,
+        page_size=None,
+        workers=None,
+        generator=False,
+    ):
+        """Get objects using the query and fields from a saved query."""
+        sq = await self.saved_query.get_by_name(
+            value=name, match_count=1, match_error=True
+        )
+
+        return await self.get(
+            query=sq["view"]["query"]["filter"],
+            fields_manual=sq["view"]["fields"],
+            fields=fields,
+            fields_regex=fields_regex,
+            fields_default=fields_default,
+            max_rows=max_rows,
+            max_pages=max_pages,
+            page_size=page_size,
+            workers=workers,
+            generator=generator,
+        )
+
+    async def get_by_value(
+        self,
+        value,
+        field,
+        value_regex=False,
+        value_not=False,
+        query_pre="",
+        query_post="",
+        match_count=None,
+        match_error=True,
+        eq_single=True,
+        fields=None,
+        fields_manual=None,
+        fields_regex=None,
+        fields_default=True,
+        fields_error=True,
+        max_rows=None,
+        max_pages=None,
+        page_size=None,
+        all_fields=None,
+    ):
+        """Build query to perform equals or regex search."""
+        all_fields = all_fields or await self.fields.get()
+
+        field = self.fields.find_single(field=field, all_fields=all_fields)
+
+        query, is_single = self._build_value_query(
+            value=value,
+            field=field,
+            value_regex=value_regex,
+            value_not=value_not,
+            query_pre=query_pre,
+            query_post=query_post,
+        )
+
+        if eq_single and is_single:
+            max_rows = 1
+            match_count = 1
+            match_error = True
+
+        rows = await self.get(
+            query=query,
+            fields=fields,
+            fields_manual=fields_manual,
+            fields_regex=fields_regex,
+            fields_default=fields_default,
+            fields_error=fields_error,
+            max_rows=max_rows,
+            max_pages=max_pages,
+            page_size=page_size,
+            all_fields=all_fields,
+        )
+
+        return self._check_value_rows(
+            rows=rows,
+            query=query,
+            field=field,
+            value=value,
+            match_count=match_count,
+            match_error=match_error,
+        )
+
+
+class AsyncUsers(AsyncAssetMixin, assets.Users):
+    """Asyncio version of :obj:`assets.Users`."""
+
+
+class AsyncDevices(AsyncAssetMixin, assets.Devices):
+    """Asyncio version of :obj:`assets.Devices`."""
+
+    get_by_subnet = NotAsync(
+        instead="use asyncio.gather with get and a query for each subnet instead"
+    )
+
+
+class AsyncLabels(assets.Labels):
+    """Asyncio version of :obj:`assets.Labels`."""
+
+    async def add(self, rows, labels):
+        """Add labels to objects using rows returned from :meth:`get`.
+
+        Returns:
+            :obj:`int`: Number of objects that had labels added
+
+        """
+        ids = [row["internal_axon_id"] for row in rows]
+
+        processed = 0
+
+        # only do 100 labels at a time, more seems to break API
+        for group in tools.grouper(ids, 100):
+            group = [x for x in group if x is not None]
+            response = await self._add(labels=labels, ids=group)
+            processed += response
+
+        return processed
+
+    async def remove(self, rows, labels):
+        """Delete labels from objects using rows returned from :meth:`get`.
+
+        Returns:
+            :obj:`int`: Number of objects that had labels deleted.
+
+        """
+        ids = [row["internal_axon_id"] for row in rows]
+
+        processed = 0
+
+        # only do 100 labels at a time, more seems to break API
+        for group in tools.grouper(ids, 100):
+            group = [x for x in group if x is not None]
+            response = await self._remove(labels=labels, ids=group)
+            processed += response
+
+        return processed
+
+
+class AsyncSavedQuery(assets.SavedQuery):
+    """Asyncio version of :obj:`assets.SavedQuery`."""
+
+    async def add(
+        self,
+        name,
+        query,
+        fields=None,
+        fields_regex=None,
+        fields_manual=None,
+        fields_default=True,
+        fields_error=True,
+        sort=None,
+        sort_descending=True,
+        column_filters=None,
+        gui_page_size=None,
+    ):
+        """Create a saved query.
+
+        Returns:
+            :obj:`dict`: The new saved query.
+
+        """
+        all_fields = await self._parent.fields.get()
+
+        fields = self._parent.fields.validate(
+            fields=fields,
+            fields_manual=fields_manual,
+            fields_regex=fields_regex,
+            default=fields_default,
+            error=fields_error,
+            all_fields=all_fields,
+        )
+
+        find_single = self._parent.fields.find_single
+
+        if sort:
+            sort = find_single(field=sort, all_fields=all_fields)
+
+        if column_filters:
+            column_filters = {
+                find_single(field=k, all_fields=all_fields): v
+                for k, v in column_filters.items()
+            }
+
+        added = await self._add(
+            name=name,
+            query=query,
+            fields=fields,
+            column_filters=column_filters,
+            sort=sort,
+            sort_descending=sort_descending,
+            gui_page_size=gui_page_size,
+        )
+
+        return await self.get_by_id(value=added)
+
+    async def get(self, query=None, max_rows=None, max_pages=None, page_size=None):
+        """Get saved queries using paging.
+
+        Returns:
+            :obj:`list` of :obj:`dict`
+
+        """
+        if not page_size or page_size > constants.MAX_PAGE_SIZE:
+            page_size = constants.MAX_PAGE_SIZE
+
+        page_num = 0
+        rows = []
+
+        while True:
+            page_num += 1
+            rows_left = max_rows - len(rows) if max_rows else -1
+
+            if 0 < rows_left < page_size:
+                page_size = rows_left
+
+            page = await self._get(query=query, page_size=page_size, row_start=len(rows))
+            assets = page["assets"]
+            rows += assets
+
+            if not assets:
+                break
+
+            if max_pages and page_num >= max_pages:
+                break
+
+            if max_rows and len(rows) >= max_rows:
+                break
+
+        return rows
+
+    async def get_by_id(
+        self, value, match_error=True, max_rows=None, max_pages=None, page_size=None
+    ):
+        """Get a saved query by UUID."""
+        rows = await self.get(
+            max_rows=max_rows, max_pages=max_pages, page_size=page_size
+        )
+
+        for row in rows:
+            if row["uuid"] == value:
+                return row
+
+        if match_error:
+            ktmpl = "name: {name!r}, uuid: {uuid!r}".format
+            known = [ktmpl(**row) for row in rows]
+            known_msg = "Saved Queries"
+            value_msg = "Saved Query by UUID"
+            raise exceptions.ValueNotFound(
+                value=value, value_msg=value_msg, known=known, known_msg=known_msg
+            )
+
+        return None
+
+    async def get_by_name(
+        self,
+        value,
+        value_regex=False,
+        value_not=False,
+        match_count=None,
+        match_error=True,
+        eq_single=True,
+        max_rows=None,
+        max_pages=None,
+        page_size=None,
+    ):
+        """Get saved queries by name."""
+        if value_regex:
+            search = '== regex("{}", "i")'.format(value)
+        else:
+            search = '== "{}"'.format(value)
+
+            if eq_single and not value_not:
+                max_rows = 1
+                match_count = 1
+                match_error = True
+
+        field = "name"
+        not_flag = "not " if value_not else ""
+        query = "{not_flag}{field} {search}"
+        query = query.format(not_flag=not_flag, field=field, search=search).strip()
+
+        rows = await self.get(
+            query=query, max_rows=max_rows, max_pages=max_pages, page_size=page_size
+        )
+
+        if (match_count and len(rows) != match_count) and match_error:
+            ktmpl = "name: {name!r}, uuid: {uuid!r}".format
+            known = [ktmpl(**row) for row in await self.get()]
+            known_msg = "Saved Queries"
+            value_msg = "Saved Query by name using query {q}".format(q=query)
+            raise exceptions.ValueNotFound(
+                value=value, value_msg=value_msg, known=known, known_msg=known_msg
+            )
+
+        if match_count == 1 and len(rows) == 1:
+            return rows[0]
+
+        return rows
+
+
+class AsyncFields(assets.Fields):
+    """Asyncio version of :obj:`assets.Fields`.
+
+    Notes:
+        Only :meth:`get` does I/O and is awaitable, the find and validate methods are
+        the same as :obj:`assets.Fields` and require all_fields from :meth:`get`.
+
+    """
+
+    def _init(self, parent):
+        """Pass."""
+        self._fetch_lock = None
+        """:obj:`asyncio.Lock`: Lock so only one task fetches the fields at a time,
+        created on first use so it belongs to the running loop."""
+
+        super(AsyncFields, self)._init(parent=parent)
+
+    async def get(self, refresh=False):
+        """Get and parse the fields for this object type, using the cache.
+
+        Notes:
+            If the fields are not cached, only the first task fetches and parses
+            them, and other tasks wait for and use its result.
+
+        Args:
+            refresh (:obj:`bool`, optional):
+                Clear the cache and fetch the fields again.
+
+                Defaults to: False.
+
+        Returns:
+            :obj:`dict`
+
+        """
+        if refresh:
+            self.cache.clear()
+
+        fields = self.cache.get(key="fields")
+
+        if fields is not None:
+            return fields
+
+        if self._fetch_lock is None:
+            self._fetch_lock = asyncio.Lock()
+
+        async with self._fetch_lock:
+            fields = self.cache.get(key="fields")
+
+            if fields is None:
+                raw = await self._get()
+                parser = assets.ParserFields(raw=raw, parent=self)
+                fields = parser.parse()
+                self.cache.set(key="fields", value=fields)
+
+        return fields
+
+    def _check_all_fields(self, all_fields):
+        """Make sure all_fields was supplied, since it can not be fetched here.
+
+        Raises:
+            :exc:`exceptions.ApiError`: If all_fields is empty.
+
+        """
+        if not all_fields:
+            error = "Must supply all_fields to {c}, get it with: await fields.get()"
+            error = error.format(c=self.__class__.__name__)
+            raise exceptions.ApiError(error)
+
+    def find_adapter(self, adapter, error=True, all_fields=None):
+        """Find an adapter by name."""
+        self._check_all_fields(all_fields=all_fields)
+        return super(AsyncFields, self).find_adapter(
+            adapter=adapter, error=error, all_fields=all_fields
+        )
+
+    def find(self, field, error=True, all_fields=None):
+        """Find a field for a given adapter."""
+        self._check_all_fields(all_fields=all_fields)
+        return super(AsyncFields, self).find(
+            field=field, error=error, all_fields=all_fields
+        )
+
+    def find_regex(self, field, all_fields=None):
+        """Find a field for a given adapter using regexes."""
+        self._check_all_fields(all_fields=all_fields)
+        return super(AsyncFields, self).find_regex(field=field, all_fields=all_fields)
+
+    def validate(self, all_fields=None, **kwargs):
+        """Validate provided fields."""
+        self._check_all_fields(all_fields=all_fields)
+        return super(AsyncFields, self).validate(all_fields=all_fields, **kwargs)
+
+
+class AsyncConnect(connect.Connect):
+    """Asyncio version of :obj:`axonius_api_client.connect.Connect`.
+
+    Notes:
+        Only users and devices are available. Use as an async context manager, or
+        await :meth:`start` before use and :meth:`close` when done.
+
+    Examples:
+        >>> async with AsyncConnect(url=url, key=key, secret=secret) as client:
+        ...     rows = await asyncio.gather(
+        ...         *[client.devices.get_by_hostname(value=x) for x in hostnames]
+        ...     )
+
+    """
+
+    _HTTP_CLS = AsyncHttp
+    """:obj:`type`: HTTP client class to use."""
+
+    _AUTH_CLS = AsyncApiKey
+    """:obj:`type`: Authentication class to use."""
+
+    _HTTP_ARGS_EXTRA = ["max_connections", "max_keepalive"]
+    """:obj:`list` of :obj:`str`: Extra kwargs to pass to :attr:`_HTTP_CLS`."""
+
+    async def __aenter__(self):
+        """Pass."""
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc, value, traceback):
+        """Pass."""
+        await self.close()
+
+    @property
+    def users(self):
+        """Pass."""
+        self._check_started()
+        if not hasattr(self, "_users"):
+            self._users = AsyncUsers(**self._api_args)
+        return self._users
+
+    @property
+    def devices(self):
+        """Pass."""
+        self._check_started()
+        if not hasattr(self, "_devices"):
+            self._devices = AsyncDevices(**self._api_args)
+        return self._devices
+
+    adapters = NotAsync(instead="use Connect instead")
+    enforcements = NotAsync(instead="use Connect instead")
+    system = NotAsync(instead="use Connect instead")
+
+    def _check_started(self):
+        """Pass."""
+        if not self._started:
+            error = "Must await start() on {c} before use"
+            error = error.format(c=self.__class__.__name__)
+            raise exceptions.ConnectError(msg=error, exc=None)
+
+    async def start(self):
+        """Pass."""
+        if not self._started:
+            try:
+                await self._auth.login()
+            except Exception as exc:
+                if not self._wraperror:
+                    raise
+
+                msg_pre = "Unable to connect to {url!r}".format(url=self._http.url)
+
+                if isinstance(exc, httpx.TimeoutException):
+                    msg = "{pre}: connection timed out after {t} seconds"
+                    msg = msg.format(pre=msg_pre, t=self._http._CONNECT_TIMEOUT)
+                    raise exceptions.ConnectError(msg=msg, exc=exc)
+                elif isinstance(exc, httpx.TransportError):
+                    msg = "{pre}: {reason}"
+                    msg = msg.format(pre=msg_pre, reason=self._get_exc_reason(exc=exc))
+                    raise exceptions.ConnectError(msg=msg, exc=exc)
+                elif isinstance(exc, exceptions.InvalidCredentials):
+                    msg = "{pre}: Invalid Credentials supplied"
+                    msg = msg.format(pre=msg_pre, url=self._http.url)
+                    raise exceptions.ConnectError(msg=msg, exc=exc)
+
+                msg = "{pre}: {exc}"
+                msg = msg.format(pre=msg_pre, exc=exc)
+                raise exceptions.ConnectError(msg=msg, exc=exc)
+
+            self._started = True
+            self._start_dt = tools.dt_now()
+
+    async def close(self):
+        """Close all connections in the connection pool."""
+        await self._http.close()
@@ -2,18 +2,58 @@
 """Axonius API Client package."""
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+import bisect
+import collections
 import ipaddress
 import re
+import sys
+import threading
+from concurrent import futures
 
-from .. import constants, exceptions, tools
+import requests
+import six
+
+from .. import cache, constants, exceptions, tools
 from . import adapters, mixins, routers
 
+REGEX_CACHE = cache.Cache(max_size=constants.REGEX_CACHE_SIZE)
+""":obj:`axonius_api_client.cache.Cache`: Compiled regexes used by field searches."""
+
+REGEX_LITERAL = re.compile(r"^\^?[^.^$*+?{}\[\]\\|()]*$")
+""":obj:`re.Pattern`: Matches regexes that are a literal string, optionally
+anchored to the start."""
+
+
+def re_compile(pattern):
+    """Compile a case insensitive regex, using :data:`REGEX_CACHE`.
+
+    Returns:
+        :obj:`re.Pattern`
+
+    """
+    return REGEX_CACHE.get_or_set(key=pattern, func=lambda: re.compile(pattern, re.I))
+
 
 class AssetMixin(mixins.ModelAsset, mixins.Mixins):
     """Mixins for User & Device models."""
 
     def _init(self, auth, **kwargs):
         """Pass."""
+        self._fields_cache_ttl = kwargs.get(
+            "fields_cache_ttl", constants.FIELDS_CACHE_TTL
+        )
+        self._fields_disk_cache = kwargs.get("fields_disk_cache", False)
+        self._fields_disk_cache_max_age = kwargs.get(
+            "fields_disk_cache_max_age", constants.FIELDS_DISK_CACHE_MAX_AGE
+        )
+
+        self.result_cache = cache.Cache(
+            ttl=kwargs.get("result_cache_ttl", constants.RESULT_CACHE_TTL),
+            max_size=kwargs.get("result_cache_size", constants.RESULT_CACHE_SIZE),
+        )
+        """:obj:`axonius_api_client.cache.Cache`: Cache of counts and pages, used by
+        methods called with cache=True."""
+
         # cross reference
         self.adapters = adapters.Adapters(auth=auth, **kwargs)
 
@@ -25,15 +65,24 @@ class AssetMixin(mixins.ModelAsset, mixins.Mixins):
 
         super(AssetMixin, self)._init(auth=auth, **kwargs)
 
-    def _count(self, query=None):
+    def _count(self, query=None, cache=False):
         """Pass."""
         params = {}
         if query:
             params["filter"] = query
 
-        return self._request(method="post", path=self._router.count, json=params)
+        def count():
+            return self._request(
+                method="post", path=self._router.count, json=params, idempotent=True
+            )
+
+        if cache and self.result_cache is not None:
+            key = (self._router._object_type, "count", query or "")
+            return self.result_cache.get_or_set(key=key, func=count)
 
-    def _get(self, query=None, fields=None, row_start=0, page_size=0):
+        return count()
+
+    def _get(self, query=None, fields=None, row_start=0, page_size=0, raw=False):
         """Get a page for a given query.
 
         Args:
@@ -55,9 +104,13 @@ class AssetMixin(mixins.ModelAsset, mixins.Mixins):
                 If not 0, include N rows in the return.
 
                 Defaults to: 0.
+            raw (:obj:`bool`, optional):
+                Return the raw response instead of the JSON data.
+
+                Defaults to: False.
 
         Returns:
-            :obj:`dict`
+            :obj:`dict` or :obj:`requests.Response` if raw
 
         """
         if not page_size or page_size > constants.MAX_PAGE_SIZE:
@@ -67,6 +120,25 @@ class AssetMixin(mixins.ModelAsset, mixins.Mixins):
 
             page_size = constants.MAX_PAGE_SIZE
 
+        params = self._get_params(
+            query=query, fields=fields, row_start=row_start, page_size=page_size
+        )
+
+        return self._request(
+            method="post",
+            path=self._router.root,
+            json=params,
+            raw=raw,
+            idempotent=True,
+        )
+
+    def _get_params(self, query=None, fields=None, row_start=0, page_size=0):
+        """Build the body of a request for a page.
+
+        Returns:
+            :obj:`dict`
+
+        """
         params = {}
         params["skip"] = row_start
         params["limit"] = page_size
@@ -80,41 +152,132 @@ class AssetMixin(mixins.ModelAsset, mixins.Mixins):
 
             params["fields"] = fields
 
-        self._LAST_GET = params
-
-        return self._request(method="post", path=self._router.root, json=params)
+        return params
 
     def _get_by_id(self, id):
         """Pass."""
         path = self._router.by_id.format(id=id)
         return self._request(method="get", path=path)
 
-    def count(self, query=None):
+    def count(self, query=None, cache=False):
         """Get the number of matches for a given query.
 
         Args:
             query (:obj:`str`, optional):
                 Query built from Query Wizard in GUI.
+            cache (:obj:`bool`, optional):
+                Use the count from :attr:`result_cache` if it was fetched within
+                the TTL of the cache, otherwise fetch and store it there.
+
+                Defaults to: False.
 
         Returns:
             :obj:`int`
 
         """
-        return self._count(query=query)
+        return self._count(query=query, cache=cache)
 
-    def count_by_saved_query(self, name):
+    def count_by_saved_query(self, name, cache=False):
         """Get the number of matches for a given query.
 
         Args:
             query (:obj:`str`, optional):
                 Query built from Query Wizard in GUI.
+            cache (:obj:`bool`, optional):
+                See :meth:`count`.
+
+                Defaults to: False.
 
         Returns:
             :obj:`int`
 
         """
         sq = self.saved_query.get_by_name(value=name, match_count=1, match_error=True)
-        return self._count(query=sq["view"]["query"]["filter"])
+        return self._count(query=sq["view"]["query"]["filter"], cache=cache)
+
+    def counts(
+        self,
+        queries=None,
+        saved_queries=None,
+        workers=constants.LOOKUP_WORKERS,
+        cache=False,
+    ):
+        """Get the number of matches for many queries and saved queries at once.
+
+        Notes:
+            All saved queries are resolved from a single listing of saved queries,
+            and at most N counts are requested at once, where N is workers.
+
+        Args:
+            queries (:obj:`dict` or :obj:`list` of :obj:`str`, optional):
+                Queries to count, as a dict of name -> query, or a list of queries
+                that are also used as the names.
+
+                Defaults to: None.
+            saved_queries (:obj:`list` of :obj:`str`, optional):
+                Names of saved queries to count.
+
+                Defaults to: None.
+            workers (:obj:`int`, optional):
+                Number of counts to request at once.
+
+                Defaults to: :data:`constants.LOOKUP_WORKERS`.
+            cache (:obj:`bool`, optional):
+                See :meth:`count`.
+
+                Defaults to: False.
+
+        Raises:
+            :exc:`exceptions.ValueNotFound`: if a saved query does not exist.
+
+        Returns:
+            :obj:`dict`: name -> :obj:`dict` with the query, count, and seconds the
+            count took.
+
+        """
+        if isinstance(queries, dict):
+            queries = list(queries.items())
+        else:
+            queries = [(x, x) for x in tools.listify(obj=queries)]
+
+        saved_queries = tools.listify(obj=saved_queries)
+
+        if saved_queries:
+            sqs = {x["name"]: x for x in self.saved_query.get()}
+
+            for name in saved_queries:
+                if name not in sqs:
+                    raise exceptions.ValueNotFound(
+                        value=name,
+                        value_msg="saved query by name",
+                        known=list(sqs),
+                        known_msg="saved query names",
+                    )
+
+                queries.append((name, sqs[name]["view"]["query"]["filter"]))
+
+        def count(item):
+            count_start = tools.dt_now()
+            value = self._count(query=item[1], cache=cache)
+            return value, tools.dt_sec_ago(obj=count_start, exact=True)
+
+        counts = collections.OrderedDict((name, None) for name, _ in queries)
+        fetch_start = tools.dt_now()
+
+        for (name, query), ret, exc in self._run_chunks(
+            func=count, chunks=queries, workers=workers
+        ):
+            if exc is not None:
+                raise exc
+
+            value, took = ret
+            counts[name] = {"query": query, "count": value, "took": took}
+
+        msg = "Counted {n} queries in {t} seconds"
+        msg = msg.format(n=len(counts), t=tools.dt_sec_ago(obj=fetch_start))
+        self._log.debug(msg)
+
+        return counts
 
     def get(
         self,
@@ -128,6 +291,12 @@ class AssetMixin(mixins.ModelAsset, mixins.Mixins):
         max_pages=None,
         page_size=None,
         all_fields=None,
+        workers=None,
+        prefetch=None,
+        page_adaptive=False,
+        page_target=constants.PAGE_TARGET,
+        checkpoint=None,
+        cache=False,
         generator=False,
     ):
         """Get objects for a given query using paging."""
@@ -142,12 +311,72 @@ class AssetMixin(mixins.ModelAsset, mixins.Mixins):
             max_pages=max_pages,
             page_size=page_size,
             all_fields=all_fields,
+            workers=workers,
+            prefetch=prefetch,
+            page_adaptive=page_adaptive,
+            page_target=page_target,
+            checkpoint=checkpoint,
+            cache=cache,
         )
         if generator:
             return gen
         else:
             return list(gen)
 
+    def get_dataframe(
+        self,
+        query=None,
+        fields=None,
+        fields_manual=None,
+        fields_regex=None,
+        fields_default=True,
+        fields_error=True,
+        explode=None,
+        max_rows=None,
+        max_pages=None,
+        page_size=None,
+        all_fields=None,
+        # fmt: off
+        **kwargs
+        # fmt: on
+    ):
+        """Get objects for a given query as a pandas DataFrame.
+
+        Notes:
+            Requires pandas, see :func:`axonius_api_client.dataframe.get_dataframe`
+            for how the columns are typed.
+
+        Args:
+            explode (:obj:`str` or :obj:`list` of :obj:`str`, optional):
+                Fields to give a row for each item of their values, instead of a
+                column of lists.
+
+                Defaults to: None.
+            **kwargs:
+                Passed to :meth:`get_generator`.
+
+        Returns:
+            :obj:`pandas.DataFrame`
+
+        """
+        from .. import dataframe
+
+        return dataframe.get_dataframe(
+            apiobj=self,
+            explode=explode,
+            query=query,
+            fields=fields,
+            fields_manual=fields_manual,
+            fields_regex=fields_regex,
+            fields_default=fields_default,
+            fields_error=fields_error,
+            max_rows=max_rows,
+            max_pages=max_pages,
+            page_size=page_size,
+            all_fields=all_fields,
+            **kwargs
+        )
+
     def get_generator(
         self,
         query=None,
@@ -160,8 +389,57 @@ class AssetMixin(mixins.ModelAsset, mixins.Mixins):
         max_pages=None,
         page_size=None,
         all_fields=None,
+        workers=None,
+        prefetch=None,
+        page_adaptive=False,
+        page_target=constants.PAGE_TARGET,
+        checkpoint=None,
+        cache=False,
     ):
-        """Get objects for a given query using paging."""
+        """Get objects for a given query using paging.
+
+        Args:
+            workers (:obj:`int`, optional):
+                If more than 1, get the count of the query first and then fetch
+                the pages using a pool of N threads that share the same session.
+                Rows are still yielded in order.
+
+                Defaults to: None.
+            prefetch (:obj:`int`, optional):
+                If not 0, fetch up to N pages in a background thread while the rows
+                from the current page are being yielded.
+
+                Defaults to: None.
+            page_adaptive (:obj:`bool`, optional):
+                Change the page size after each page based on how long it took and
+                how big it was, and retry pages that time out at half the size.
+                Not used if workers is more than 1.
+
+                Defaults to: False.
+            page_target (:obj:`int`, optional):
+                Seconds that page_adaptive tries to make each page take.
+
+                Defaults to: :data:`constants.PAGE_TARGET`.
+            checkpoint (:obj:`str` or :obj:`Checkpoint`, optional):
+                Path to a state file, or a :obj:`Checkpoint`, that is saved after
+                the rows of each page have been yielded. If the state file already
+                exists, resume from the last page that was finished, and max_rows
+                and max_pages count only the rows and pages of the resumed run. The
+                state file is removed once all rows have been yielded, and kept if
+                the run is stopped by max_rows or max_pages.
+
+                Defaults to: None.
+            cache (:obj:`bool`, optional):
+                Use pages from :attr:`result_cache` if they were fetched with the
+                same query, fields, row_start, and page_size within the TTL of the
+                cache, otherwise fetch and store them there.
+
+                Defaults to: False.
+
+        Yields:
+            :obj:`dict`: Each row found in 'assets' from return.
+
+        """
         fields = self.fields.validate(
             fields=fields,
             fields_manual=fields_manual,
@@ -178,23 +456,188 @@ class AssetMixin(mixins.ModelAsset, mixins.Mixins):
 
             page_size = constants.MAX_PAGE_SIZE
 
+        if checkpoint is not None:
+            if not isinstance(checkpoint, Checkpoint):
+                checkpoint = Checkpoint(path=checkpoint)
+            checkpoint.start(query=query, fields=fields)
+
         page_info = {}
-        page_num = 0
+        row_start = checkpoint.skip if checkpoint is not None else 0
+
+        # pages may be fetched by worker threads, so only set this here
+        self._LAST_GET = self._get_params(
+            query=query, fields=fields, row_start=row_start, page_size=page_size
+        )
         rows_fetched = 0
-        rows = []
+        pages_fetched = 0
         fetch_start = tools.dt_now()
 
         msg = [
             "Starting get: page_size={}".format(page_size),
+            "workers={}".format(workers or 1),
+            "prefetch={}".format(prefetch or 0),
+            "page_adaptive={}".format(page_adaptive),
+            "row_start={}".format(row_start),
             "query={!r}".format(query or ""),
             "fields={!r}".format(fields),
         ]
         self._log.debug(tools.join_comma(msg))
 
+        page_args = {
+            "query": query,
+            "fields": fields,
+            "page_size": page_size,
+            "max_rows": max_rows,
+            "max_pages": max_pages,
+            "row_start": row_start,
+            "cache": cache,
+        }
+
+        if workers and workers > 1:
+            pages = self._get_pages_workers(workers=workers, **page_args)
+        else:
+            pages = self._get_pages(
+                page_target=page_target if page_adaptive else None, **page_args
+            )
+
+        if prefetch:
+            pages = self._prefetch_pages(pages=pages, prefetch=prefetch)
+
+        for page in pages:
+            page_info = page["page"]
+            rows_fetched += len(page["assets"])
+            pages_fetched += 1
+
+            for asset in page["assets"]:
+                yield asset
+
+            if checkpoint is not None and page["assets"]:
+                checkpoint.skip = row_start + rows_fetched
+                checkpoint.save()
+
+        stopped = (max_rows and rows_fetched >= max_rows) or (
+            max_pages and pages_fetched >= max_pages
+        )
+
+        # a run stopped by max_rows or max_pages may not have reached the last row
+        if checkpoint is not None and not stopped:
+            checkpoint.clear()
+
+        msg = [
+            "Finished get: rows_fetched={}".format(rows_fetched),
+            "total_rows={}".format(page_info.get("totalResources", 0)),
+            "fetch_took={}".format(tools.dt_sec_ago(obj=fetch_start)),
+            "query={!r}".format(query or ""),
+            "fields={!r}".format(fields),
+        ]
+        self._log.debug(tools.join_comma(obj=msg))
+
+    def _get_page(self, query, fields, row_start, page_size, page_num, cache=False):
+        """Get a single page and log how long it took.
+
+        Notes:
+            If cache is True, the body of the response is stored in
+            :attr:`result_cache` and decoded again for each hit, so callers can
+            not change the rows of other callers.
+
+        Returns:
+            :obj:`dict`
+
+        """
+        page_start = tools.dt_now()
+
+        msg = [
+            "Fetching page_num={}".format(page_num),
+            "page_size={}".format(page_size),
+            "row_start={}".format(row_start),
+            "cache={}".format(cache),
+        ]
+        self._log.debug(tools.join_comma(obj=msg))
+
+        def fetch():
+            response = self._get(
+                query=query,
+                fields=fields,
+                row_start=row_start,
+                page_size=page_size,
+                raw=True,
+            )
+            page = self._handle_response(response=response)
+            took = tools.dt_sec_ago(obj=page_start, exact=True)
+            return page, response.content or b"", took
+
+        if cache and self.result_cache is not None:
+            key = (
+                self._router._object_type,
+                "page",
+                query or "",
+                tools.join_comma(obj=fields, indent=None),
+                row_start,
+                page_size,
+            )
+            fetched = {}
+
+            def fetch_cached():
+                fetched["page"], content, took = fetch()
+                return content, took
+
+            content, took = self.result_cache.get_or_set(key=key, func=fetch_cached)
+
+            if "page" in fetched:
+                page = fetched["page"]
+            else:
+                page = tools.json_load(obj=content)
+        else:
+            page, content, took = fetch()
+
+        page["page_took"] = took
+        page["page_bytes"] = len(content)
+
+        msg = [
+            "Fetched page_num={}".format(page_num),
+            "page_took={}".format(round(page["page_took"])),
+            "page_bytes={}".format(page["page_bytes"]),
+            "rows_fetched={}".format(len(page["assets"])),
+            "page_info={}".format(page["page"]),
+        ]
+        self._log.debug(tools.join_comma(obj=msg))
+
+        return page
+
+    def _get_pages(
+        self,
+        query,
+        fields,
+        page_size,
+        max_rows=None,
+        max_pages=None,
+        page_target=None,
+        row_start=0,
+        cache=False,
+    ):
+        """Get pages one at a time until no more rows are returned.
+
+        Args:
+            row_start (:obj:`int`, optional):
+                Row to start fetching from, max_rows counts the rows after it.
+
+                Defaults to: 0.
+            page_target (:obj:`int`, optional):
+                If not None, adapt the page size using :meth:`_adapt_page_size`
+                and retry pages that time out using :meth:`_shrink_page_size`.
+
+                Defaults to: None.
+
+        Yields:
+            :obj:`dict`: Each page returned from :meth:`_get`.
+
+        """
+        page_num = 0
+        rows_fetched = row_start
+
         while True:
-            page_start = tools.dt_now()
             page_num += 1
-            rows_left = max_rows - len(rows) if max_rows else -1
+            rows_left = max_rows - (rows_fetched - row_start) if max_rows else -1
 
             if 0 < rows_left < page_size:
                 msg = "Changed page_size={ps} to rows_left={rl} (max_rows={mr})"
@@ -203,34 +646,36 @@ class AssetMixin(mixins.ModelAsset, mixins.Mixins):
 
                 page_size = rows_left
 
-            msg = [
-                "Fetching page_num={}".format(page_num),
-                "page_size={}".format(page_size),
-                "rows_fetched={}".format(rows_fetched),
-            ]
-            self._log.debug(tools.join_comma(obj=msg))
-            page = self._get(
-                query=query, fields=fields, row_start=rows_fetched, page_size=page_size,
-            )
-
-            assets = page["assets"]
-            page_info = page["page"]
-
-            this_rows_fetched = len(assets)
-            rows_fetched += this_rows_fetched
-
-            msg = [
-                "Fetched page_num={}".format(page_num),
-                "page_took={}".format(tools.dt_sec_ago(obj=page_start)),
-                "rows_fetched={}".format(rows_fetched),
-                "page_info={}".format(page_info),
-            ]
-            self._log.debug(tools.join_comma(obj=msg))
-
-            for asset in assets:
-                yield asset
-
-            if not assets:
+            try:
+                page = self._get_page(
+                    query=query,
+                    fields=fields,
+                    row_start=rows_fetched,
+                    page_size=page_size,
+                    page_num=page_num,
+                    cache=cache,
+                )
+            except Exception as exc:
+                if page_target is None or not self._is_page_timeout(exc=exc):
+                    raise
+
+                page_size = self._shrink_page_size(page_size=page_size, exc=exc)
+                page_num -= 1
+                continue
+
+            rows_fetched += len(page["assets"])
+
+            if page_target is not None and len(page["assets"]) == page_size:
+                page_size = self._adapt_page_size(
+                    page_size=page_size,
+                    page_took=page["page_took"],
+                    page_bytes=page["page_bytes"],
+                    page_target=page_target,
+                )
+
+            yield page
+
+            if not page["assets"]:
                 msg = "Stopped fetch loop, page with no assets returned"
                 self._log.debug(msg)
                 break
@@ -241,20 +686,240 @@ class AssetMixin(mixins.ModelAsset, mixins.Mixins):
                 self._log.debug(msg)
                 break
 
-            if max_rows and rows_fetched >= max_rows:
-                msg = "Stopped fetch loop, hit max_rows={mr} with rows_fetched={rf}"
-                msg = msg.format(mr=max_rows, rf=rows_fetched)
-                self._log.debug(msg)
-                break
+            if max_rows and rows_fetched - row_start >= max_rows:
+                msg = "Stopped fetch loop, hit max_rows={mr} with rows_fetched={rf}"
+                msg = msg.format(mr=max_rows, rf=rows_fetched - row_start)
+                self._log.debug(msg)
+                break
+
+    def _is_page_timeout(self, exc):
+        """Check if an exception thrown while fetching a page is a timeout.
+
+        Returns:
+            :obj:`bool`
+
+        """
+        if isinstance(exc, requests.exceptions.Timeout):
+            return True
+
+        if isinstance(exc, exceptions.ResponseNotOk):
+            status = getattr(exc.response, "status_code", None)
+            return status in constants.PAGE_TIMEOUT_STATUS
+
+        return False
+
+    def _shrink_page_size(self, page_size, exc):
+        """Halve the page size after a page timed out.
+
+        Raises:
+            :exc:`Exception`: exc if page_size is already at the minimum.
+
+        Returns:
+            :obj:`int`
+
+        """
+        if page_size <= constants.PAGE_SIZE_MIN:
+            msg = "Page with page_size={ps} timed out at minimum page size {mps}"
+            msg = msg.format(ps=page_size, mps=constants.PAGE_SIZE_MIN)
+            self._log.error(msg)
+            raise exc
+
+        new_page_size = max(page_size // 2, constants.PAGE_SIZE_MIN)
+
+        msg = "Retrying page with page_size={nps} after page_size={ps} timed out: {e}"
+        msg = msg.format(nps=new_page_size, ps=page_size, e=exc)
+        self._log.warning(msg)
+
+        return new_page_size
+
+    def _adapt_page_size(self, page_size, page_took, page_bytes, page_target):
+        """Scale the page size so the next page takes about page_target seconds.
+
+        Notes:
+            The page size will at most be halved or doubled, will not go above the
+            size that would make the response bigger than
+            :data:`constants.PAGE_MAX_BYTES`, and stays between
+            :data:`constants.PAGE_SIZE_MIN` and :data:`constants.MAX_PAGE_SIZE`.
+
+        Returns:
+            :obj:`int`
+
+        """
+        ratio = page_target / page_took if page_took > 0 else 2
+        ratio = min(max(ratio, 0.5), 2)
+
+        new_page_size = int(page_size * ratio)
+
+        if page_bytes:
+            row_bytes = float(page_bytes) / page_size
+            max_by_bytes = int(constants.PAGE_MAX_BYTES / row_bytes)
+            new_page_size = min(new_page_size, max_by_bytes)
+
+        new_page_size = min(new_page_size, constants.MAX_PAGE_SIZE)
+        new_page_size = max(new_page_size, constants.PAGE_SIZE_MIN)
+
+        if new_page_size != page_size:
+            msg = [
+                "Changed page_size={} to {}".format(page_size, new_page_size),
+                "page_took={:.2f}".format(page_took),
+                "page_bytes={}".format(page_bytes),
+                "page_target={}".format(page_target),
+            ]
+            self._log.debug(tools.join_comma(obj=msg))
+
+        return new_page_size
+
+    def _get_windows(self, query, page_size, max_rows=None, max_pages=None, row_start=0):
+        """Build the skip/limit windows needed to fetch all rows for a query.
+
+        Returns:
+            :obj:`list` of :obj:`tuple` of (:obj:`int`, :obj:`int`)
+
+        """
+        total = self._count(query=query)
+
+        if max_rows:
+            total = min(total, row_start + max_rows)
+
+        windows = [
+            (start, min(page_size, total - start))
+            for start in range(row_start, total, page_size)
+        ]
+
+        if max_pages:
+            windows = windows[:max_pages]
+
+        msg = "Built {n} page windows for total={t} (max_rows={mr}, max_pages={mp})"
+        msg = msg.format(n=len(windows), t=total, mr=max_rows, mp=max_pages)
+        self._log.debug(msg)
+
+        return windows
+
+    def _get_pages_workers(
+        self,
+        query,
+        fields,
+        page_size,
+        workers,
+        max_rows=None,
+        max_pages=None,
+        row_start=0,
+        cache=False,
+    ):
+        """Get pages using a pool of threads, yielding them in order.
+
+        Notes:
+            The number of rows to fetch is taken from :meth:`_count` before any
+            pages are requested, so rows added after that are not returned. At
+            most N pages are requested at once, where N is workers.
+
+        Yields:
+            :obj:`dict`: Each page returned from :meth:`_get`.
+
+        """
+        windows = self._get_windows(
+            query=query,
+            page_size=page_size,
+            max_rows=max_rows,
+            max_pages=max_pages,
+            row_start=row_start,
+        )
+        windows = iter(enumerate(windows, 1))
+        pending = collections.deque()
+
+        def submit(pool):
+            window = next(windows, None)
+            if window:
+                page_num, (row_start, limit) = window
+                future = pool.submit(
+                    self._get_page,
+                    query=query,
+                    fields=fields,
+                    row_start=row_start,
+                    page_size=limit,
+                    page_num=page_num,
+                    cache=cache,
+                )
+                pending.append((page_num, limit, future))
+
+        with futures.ThreadPoolExecutor(max_workers=workers) as pool:
+            try:
+                for _ in range(workers):
+                    submit(pool=pool)
+
+                while pending:
+                    page_num, limit, future = pending.popleft()
+                    page = future.result()
+
+                    submit(pool=pool)
+
+                    yield page
+
+                    if len(page["assets"]) < limit:
+                        msg = "Stopped fetch loop, page_num={pn} had {n} of {ps} rows"
+                        msg = msg.format(pn=page_num, n=len(page["assets"]), ps=limit)
+                        self._log.debug(msg)
+                        break
+            finally:
+                for page_num, limit, future in pending:
+                    future.cancel()
+
+    def _prefetch_pages(self, pages, prefetch):
+        """Fetch pages in a background thread ahead of the consumer.
+
+        Notes:
+            Pages are put into a queue that holds at most N pages, where N is
+            prefetch, so the background thread blocks once it is N pages ahead.
+
+        Yields:
+            :obj:`dict`: Each page from pages.
+
+        """
+        fetched = six.moves.queue.Queue(maxsize=prefetch)
+        stop = threading.Event()
+
+        def put(item):
+            while not stop.is_set():
+                try:
+                    fetched.put(item, timeout=constants.PREFETCH_WAIT)
+                    return True
+                except six.moves.queue.Full:
+                    continue
+            return False
+
+        def produce():
+            try:
+                for page in pages:
+                    if not put((page, None)):
+                        break
+                else:
+                    put((None, None))
+            except Exception:
+                put((None, sys.exc_info()))
+            finally:
+                pages.close()
+
+        thread = threading.Thread(target=produce, name="prefetch_pages")
+        thread.daemon = True
+        thread.start()
+
+        msg = "Started prefetch thread with prefetch={p}"
+        msg = msg.format(p=prefetch)
+        self._log.debug(msg)
+
+        try:
+            while True:
+                page, exc_info = fetched.get()
+
+                if exc_info:
+                    six.reraise(*exc_info)
+
+                if page is None:
+                    break
 
-        msg = [
-            "Finished get: rows_fetched={}".format(rows_fetched),
-            "total_rows={}".format(page_info.get("totalResources", 0)),
-            "fetch_took={}".format(tools.dt_sec_ago(obj=fetch_start)),
-            "query={!r}".format(query or ""),
-            "fields={!r}".format(fields),
-        ]
-        self._log.debug(tools.join_comma(obj=msg))
+                yield page
+        finally:
+            stop.set()
 
     def get_by_id(self, id):
         """Get an object by internal_axon_id.
@@ -273,6 +938,128 @@ class AssetMixin(mixins.ModelAsset, mixins.Mixins):
             msg = "Axonius ID for {t}".format(t=self._router._object_type)
             raise exceptions.ValueNotFound(value=id, value_msg=msg, exc=exc)
 
+    def get_by_ids(self, ids, **kwargs):
+        """Get many objects by internal_axon_id.
+
+        Notes:
+            See :meth:`get_by_ids_generator` for the arguments.
+
+        Returns:
+            :obj:`BatchResult`: with the objects found in rows.
+
+        """
+        result = BatchResult()
+        generator = self.get_by_ids_generator(ids=ids, result=result, **kwargs)
+        result.rows = list(generator)
+        return result
+
+    def get_by_ids_generator(
+        self,
+        ids,
+        workers=constants.LOOKUP_WORKERS,
+        ordered=False,
+        fields=None,
+        fields_manual=None,
+        fields_regex=None,
+        fields_default=True,
+        chunk_size=constants.LOOKUP_CHUNK_SIZE,
+        result=None,
+    ):
+        """Get many objects by internal_axon_id.
+
+        Notes:
+            If no fields are supplied, the full record of each object is fetched
+            with :meth:`get_by_id`, with at most N requests at once where N is
+            workers. If fields are supplied, the objects are fetched with
+            "internal_axon_id in [...]" queries using :meth:`get_by_values_generator`
+            instead, which is one request per chunk_size ids instead of one per id.
+
+        Args:
+            ids (:obj:`list` of :obj:`str`):
+                internal_axon_id of objects to get.
+            workers (:obj:`int`, optional):
+                Number of requests to run at once.
+
+                Defaults to: :data:`constants.LOOKUP_WORKERS`.
+            ordered (:obj:`bool`, optional):
+                Yield objects in the order of ids instead of the order they are
+                fetched in.
+
+                Defaults to: False.
+            result (:obj:`BatchResult`, optional):
+                Object to record which ids were found, missing, or failed. If None,
+                the error of a failed request is raised.
+
+                Defaults to: None.
+
+        Yields:
+            :obj:`dict`: Each object found.
+
+        """
+        ids = [x.strip() for x in tools.listify(obj=ids)]
+        ids = list(collections.OrderedDict.fromkeys(x for x in ids if x))
+
+        if fields or fields_manual or fields_regex:
+            rows = self.get_by_values_generator(
+                values=ids,
+                field="MANUAL:internal_axon_id",
+                chunk_size=chunk_size,
+                workers=workers,
+                fields=fields,
+                fields_manual=fields_manual,
+                fields_regex=fields_regex,
+                fields_default=fields_default,
+                result=result,
+            )
+
+            if ordered:
+                positions = {x: idx for idx, x in enumerate(ids)}
+                rows = sorted(rows, key=lambda x: positions[x["internal_axon_id"]])
+
+            for row in rows:
+                yield row
+            return
+
+        if result is not None:
+            result.requested += ids
+
+        buffered = {}
+        next_idx = 0
+
+        def get_id(chunk):
+            try:
+                return self.get_by_id(id=chunk[1])
+            except exceptions.ValueNotFound:
+                return None
+
+        for (idx, id), row, exc in self._run_chunks(
+            func=get_id, chunks=list(enumerate(ids)), workers=workers
+        ):
+            if exc is not None:
+                if result is None:
+                    raise exc
+
+                msg = "Failed to get {o} by internal_axon_id {i!r}: {e}"
+                msg = msg.format(o=self._router._object_type, i=id, e=exc)
+                self._log.warning(msg)
+
+                result.errors[id] = exc
+            elif result is not None and row is not None:
+                result.found[id] = [id]
+
+            if not ordered:
+                if row is not None:
+                    yield row
+                continue
+
+            buffered[idx] = row
+
+            while next_idx in buffered:
+                row = buffered.pop(next_idx)
+                next_idx += 1
+                if row is not None:
+                    yield row
+
     def get_by_saved_query(
         self,
         name,
@@ -282,6 +1069,12 @@ class AssetMixin(mixins.ModelAsset, mixins.Mixins):
         max_rows=None,
         max_pages=None,
         page_size=None,
+        workers=None,
+        prefetch=None,
+        page_adaptive=False,
+        page_target=constants.PAGE_TARGET,
+        checkpoint=None,
+        cache=False,
         generator=False,
     ):
         """Pass."""
@@ -296,6 +1089,12 @@ class AssetMixin(mixins.ModelAsset, mixins.Mixins):
             max_rows=max_rows,
             max_pages=max_pages,
             page_size=page_size,
+            workers=workers,
+            prefetch=prefetch,
+            page_adaptive=page_adaptive,
+            page_target=page_target,
+            checkpoint=checkpoint,
+            cache=cache,
             generator=generator,
         )
 
@@ -325,6 +1124,60 @@ class AssetMixin(mixins.ModelAsset, mixins.Mixins):
 
         field = self.fields.find_single(field=field, all_fields=all_fields)
 
+        query, is_single = self._build_value_query(
+            value=value,
+            field=field,
+            value_regex=value_regex,
+            value_not=value_not,
+            query_pre=query_pre,
+            query_post=query_post,
+        )
+
+        if eq_single and is_single:
+            max_rows = 1
+            match_count = 1
+            match_error = True
+
+        rows = self.get(
+            query=query,
+            fields=fields,
+            fields_manual=fields_manual,
+            fields_regex=fields_regex,
+            fields_default=fields_default,
+            fields_error=fields_error,
+            max_rows=max_rows,
+            max_pages=max_pages,
+            page_size=page_size,
+            all_fields=all_fields,
+        )
+
+        return self._check_value_rows(
+            rows=rows,
+            query=query,
+            field=field,
+            value=value,
+            match_count=match_count,
+            match_error=match_error,
+        )
+
+    def _build_value_query(
+        self,
+        value,
+        field,
+        value_regex=False,
+        value_not=False,
+        query_pre="",
+        query_post="",
+    ):
+        """Build query to perform equals or regex search.
+
+        Returns:
+            :obj:`tuple` of (:obj:`str`, :obj:`bool`): query and if the query is a
+            single equals search that can only match one row
+
+        """
+        is_single = False
+
         if isinstance(value, tools.LIST):
             value = ", ".join(["'{}'".format(v.strip()) for v in value])
             search = "in [{}]".format(value)
@@ -333,11 +1186,7 @@ class AssetMixin(mixins.ModelAsset, mixins.Mixins):
                 search = '== regex("{}", "i")'.format(value)
             else:
                 search = '== "{}"'.format(value)
-
-                if eq_single and (not query_post and not value_not):
-                    max_rows = 1
-                    match_count = 1
-                    match_error = True
+                is_single = not query_post and not value_not
 
         not_flag = "not " if value_not else ""
         query = "{query_pre} {not_flag}({field} {search}) {query_post}"
@@ -349,19 +1198,15 @@ class AssetMixin(mixins.ModelAsset, mixins.Mixins):
             query_post=query_post,
         ).strip()
 
-        rows = self.get(
-            query=query,
-            fields=fields,
-            fields_manual=fields_manual,
-            fields_regex=fields_regex,
-            fields_default=fields_default,
-            fields_error=fields_error,
-            max_rows=max_rows,
-            max_pages=max_pages,
-            page_size=page_size,
-            all_fields=all_fields,
-        )
+        return query, is_single
+
+    def _check_value_rows(self, rows, query, field, value, match_count, match_error):
+        """Check the rows returned from a query built by :meth:`_build_value_query`.
+
+        Returns:
+            :obj:`list` of :obj:`dict` or :obj:`dict` if match_count is 1
 
+        """
         if (match_count and len(rows) != match_count) and match_error:
             value_msg = "{o} by field {f!r} value {v!r}"
             value_msg = value_msg.format(o=self._router._object_type, f=field, v=value)
@@ -372,6 +1217,204 @@ class AssetMixin(mixins.ModelAsset, mixins.Mixins):
 
         return rows
 
+    def get_by_values(self, values, field, **kwargs):
+        """Get objects that match any of a large number of values for a field.
+
+        Notes:
+            See :meth:`get_by_values_generator` for the arguments.
+
+        Returns:
+            :obj:`BatchResult`: with the rows found in rows.
+
+        """
+        result = BatchResult()
+        generator = self.get_by_values_generator(
+            values=values, field=field, result=result, **kwargs
+        )
+        result.rows = list(generator)
+        return result
+
+    def get_by_values_generator(
+        self,
+        values,
+        field,
+        chunk_size=constants.LOOKUP_CHUNK_SIZE,
+        workers=constants.LOOKUP_WORKERS,
+        query_pre="",
+        query_post="",
+        fields=None,
+        fields_manual=None,
+        fields_regex=None,
+        fields_default=True,
+        fields_error=True,
+        page_size=None,
+        all_fields=None,
+        result=None,
+    ):
+        """Get objects that match any of a large number of values for a field.
+
+        Notes:
+            Values are split into chunks of chunk_size and an "in [...]" query is
+            run for each chunk, with at most N queries running at once where N is
+            workers. Rows are yielded as each query finishes, and rows that were
+            already yielded by another chunk (same internal_axon_id) are skipped.
+
+        Args:
+            values (:obj:`list` of :obj:`str`):
+                Values to search for.
+            field (:obj:`str`):
+                Field to search, the field is always added to the fields returned.
+            chunk_size (:obj:`int`, optional):
+                Number of values to put in each query.
+
+                Defaults to: :data:`constants.LOOKUP_CHUNK_SIZE`.
+            workers (:obj:`int`, optional):
+                Number of queries to run at once.
+
+                Defaults to: :data:`constants.LOOKUP_WORKERS`.
+            result (:obj:`BatchResult`, optional):
+                Object to record which values were found, missing, or in a query
+                that failed. If None, the error of a failed query is raised.
+
+                Defaults to: None.
+
+        Yields:
+            :obj:`dict`: Each row found.
+
+        """
+        all_fields = all_fields or self.fields.get()
+        field = self.fields.find_single(field=field, all_fields=all_fields)
+
+        fields = self.fields.validate(
+            fields=fields,
+            fields_manual=tools.listify(obj=fields_manual) + [field],
+            fields_regex=fields_regex,
+            error=fields_error,
+            default=fields_default,
+            all_fields=all_fields,
+        )
+
+        values = [x.strip() for x in tools.listify(obj=values)]
+        values = list(collections.OrderedDict.fromkeys(x for x in values if x))
+        chunks = [
+            [x for x in chunk if x is not None]
+            for chunk in tools.grouper(iterable=values, n=chunk_size)
+        ]
+
+        msg = "Starting lookup of {n} values for field {f!r} in {c} chunks"
+        msg = msg.format(n=len(values), f=field, c=len(chunks))
+        self._log.debug(msg)
+
+        if result is not None:
+            result.requested += values
+
+        def get_chunk(chunk):
+            query, _ = self._build_value_query(
+                value=chunk, field=field, query_pre=query_pre, query_post=query_post
+            )
+            return self.get(
+                query=query,
+                fields_manual=fields,
+                fields_default=False,
+                page_size=page_size,
+                all_fields=all_fields,
+            )
+
+        seen = set()
+
+        for chunk, rows, exc in self._run_chunks(
+            func=get_chunk, chunks=chunks, workers=workers
+        ):
+            if exc is not None:
+                if result is None:
+                    raise exc
+
+                msg = "Lookup of {n} values for field {f!r} failed: {e}"
+                msg = msg.format(n=len(chunk), f=field, e=exc)
+                self._log.warning(msg)
+
+                result.errors.update({x: exc for x in chunk})
+                continue
+
+            chunk_values = set(chunk)
+
+            for row in rows:
+                row_id = row.get("internal_axon_id")
+
+                if result is not None:
+                    for value in self._row_values(row=row, field=field):
+                        if value in chunk_values:
+                            result.found.setdefault(value, []).append(row_id)
+
+                if row_id is not None:
+                    if row_id in seen:
+                        continue
+                    seen.add(row_id)
+
+                yield row
+
+    @staticmethod
+    def _row_values(row, field):
+        """Get the values of a field in a row as a flat list of str.
+
+        Returns:
+            :obj:`list` of :obj:`str`
+
+        """
+        values = []
+
+        for value in tools.listify(obj=row.get(field)):
+            if isinstance(value, tools.LIST):
+                values += [format(x) for x in value]
+            elif value is not None:
+                values.append(format(value))
+
+        return values
+
+    def _run_chunks(self, func, chunks, workers):
+        """Call func for each chunk using a pool of threads.
+
+        Notes:
+            At most N chunks are submitted at once, where N is workers, so the
+            results of finished chunks are not held while others are still queued.
+
+        Yields:
+            :obj:`tuple` of (chunk, return of func, exception) in the order the
+            chunks finish, with exception set instead of the return if func raised.
+
+        """
+        chunks = iter(chunks)
+        pending = {}
+
+        def submit(pool):
+            chunk = next(chunks, None)
+            if chunk is not None:
+                pending[pool.submit(func, chunk)] = chunk
+
+        with futures.ThreadPoolExecutor(max_workers=max(workers or 1, 1)) as pool:
+            try:
+                for _ in range(max(workers or 1, 1)):
+                    submit(pool=pool)
+
+                while pending:
+                    done, _ = futures.wait(
+                        list(pending), return_when=futures.FIRST_COMPLETED
+                    )
+
+                    for future in done:
+                        chunk = pending.pop(future)
+                        submit(pool=pool)
+
+                        try:
+                            ret = future.result()
+                        except Exception as exc:
+                            yield chunk, None, exc
+                        else:
+                            yield chunk, ret, None
+            finally:
+                for future in pending:
+                    future.cancel()
+
 
 class Users(AssetMixin):
     """User related API methods."""
@@ -518,42 +1561,161 @@ class Devices(AssetMixin):
         )
 
     def get_by_subnet(
-        self, value, value_not=False, query_pre="", query_post="", **kwargs
+        self,
+        value,
+        value_not=False,
+        query_pre="",
+        query_post="",
+        chunk_size=constants.SUBNET_CHUNK_SIZE,
+        chunk_workers=constants.LOOKUP_WORKERS,
+        # fmt: off
+        **kwargs
+        # fmt: on
     ):
-        """Get objects by MAC using paging.
+        """Get objects by subnet using paging.
+
+        Notes:
+            Overlapping and adjacent subnets are merged into as few IP ranges as
+            possible. If there are more than chunk_size ranges, they are split
+            over several queries that are run at once, and rows found by more
+            than one query (same internal_axon_id) are only returned once.
 
         Args:
-            value (:obj:`int`):
-                Value to find using field "network_interfaces.mac".
-            **kwargs: Passed thru to :meth:`UserDeviceModel.get_by_value`
+            value (:obj:`str` or :obj:`list` of :obj:`str`):
+                Subnet or subnets to find using field "network_interfaces.ips_raw".
+            chunk_size (:obj:`int`, optional):
+                Number of IP ranges to OR together in each query.
+
+                Defaults to: :data:`constants.SUBNET_CHUNK_SIZE`.
+            chunk_workers (:obj:`int`, optional):
+                Number of queries to run at once.
+
+                Defaults to: :data:`constants.LOOKUP_WORKERS`.
+            **kwargs: Passed thru to :meth:`AssetMixin.get`
 
         Returns:
-            :obj:`list` of :obj:`dict`: Each row matching email or :obj:`dict` if only1.
+            :obj:`list` of :obj:`dict`: Each row matching any of the subnets, or a
+            generator of them if generator=True.
 
         """
-        network = ipaddress.ip_network(value)
+        field = "specific_data.data.network_interfaces.ips_raw"
 
-        begin = int(network.network_address)
-        end = int(network.broadcast_address)
+        ranges = self._subnet_ranges(value=value)
+        searches = []
 
-        field = "specific_data.data.network_interfaces.ips_raw"
+        for begin, end in ranges:
+            search = '{field} == match({{"$gte": {begin}, "$lte": {end}}})'
+            searches.append(search.format(field=field, begin=begin, end=end))
 
-        search = '== match({{"$gte": {begin}, "$lte": {end}}})'
-        search = search.format(begin=begin, end=end)
+        # a row outside the ranges of one query may be inside those of another
+        if value_not or len(searches) <= chunk_size:
+            chunks = [searches]
+        else:
+            chunks = [
+                [x for x in chunk if x is not None]
+                for chunk in tools.grouper(iterable=searches, n=chunk_size)
+            ]
 
-        not_flag = "not " if value_not else ""
-        query = "{query_pre} {not_flag}{field} {search} {query_post}"
-        query = query.format(
-            not_flag=not_flag,
-            field=field,
-            search=search,
-            query_pre=query_pre,
-            query_post=query_post,
-        ).strip()
+        def build_query(chunk):
+            if len(chunk) == 1:
+                search = chunk[0]
+            else:
+                search = "({})".format(" or ".join("({})".format(x) for x in chunk))
+
+            not_flag = "not " if value_not else ""
+            query = "{query_pre} {not_flag}{search} {query_post}"
+            return query.format(
+                not_flag=not_flag,
+                search=search,
+                query_pre=query_pre,
+                query_post=query_post,
+            ).strip()
 
         kwargs.pop("query", None)
         kwargs.pop("value_regex", None)
-        return self.get(query=query, **kwargs)
+
+        msg = "Merged {v} subnets into {r} ranges in {c} queries"
+        msg = msg.format(v=len(tools.listify(obj=value)), r=len(ranges), c=len(chunks))
+        self._log.debug(msg)
+
+        generator = kwargs.pop("generator", False)
+        rows = self._get_by_queries(
+            queries=[build_query(x) for x in chunks], workers=chunk_workers, **kwargs
+        )
+
+        if generator:
+            return rows
+        return list(rows)
+
+    def _get_by_queries(self, queries, workers, **kwargs):
+        """Get the rows of many queries at once.
+
+        Notes:
+            Rows found by more than one query (same internal_axon_id) are only
+            yielded once.
+
+        Yields:
+            :obj:`dict`: Each row matching any of the queries.
+
+        """
+        if len(queries) == 1:
+            for row in self.get_generator(query=queries[0], **kwargs):
+                yield row
+            return
+
+        def get_query(query):
+            return self.get(query=query, **kwargs)
+
+        seen = set()
+
+        for query, query_rows, exc in self._run_chunks(
+            func=get_query, chunks=queries, workers=workers
+        ):
+            if exc is not None:
+                raise exc
+
+            for row in query_rows:
+                row_id = row.get("internal_axon_id")
+
+                if row_id is not None:
+                    if row_id in seen:
+                        continue
+                    seen.add(row_id)
+
+                yield row
+
+    @staticmethod
+    def _subnet_ranges(value):
+        """Merge subnets into the fewest ranges of IP addresses.
+
+        Returns:
+            :obj:`list` of :obj:`tuple` of (:obj:`int`, :obj:`int`): first and last
+            address of each range, as numbers.
+
+        """
+        networks = {}
+
+        for item in tools.listify(obj=value):
+            network = ipaddress.ip_network(six.text_type(item).strip())
+            networks.setdefault(network.version, []).append(network)
+
+        ranges = []
+
+        for version in sorted(networks):
+            merged = []
+
+            for network in ipaddress.collapse_addresses(networks[version]):
+                begin = int(network.network_address)
+                end = int(network.broadcast_address)
+
+                if merged and begin <= merged[-1][1] + 1:
+                    merged[-1] = (merged[-1][0], max(end, merged[-1][1]))
+                else:
+                    merged.append((begin, end))
+
+            ranges += merged
+
+        return ranges
 
 
 class SavedQuery(mixins.Child):
@@ -1085,6 +2247,27 @@ class Fields(mixins.Child):
     _GENERIC_ALTS = ["generic", "general", "specific"]
     _ALL_ALTS = ["all", "*", "specific_data"]
 
+    def _init(self, parent):
+        """Pass."""
+        self.cache = cache.Cache(ttl=parent._fields_cache_ttl, max_size=1)
+        """:obj:`axonius_api_client.cache.Cache`: Cache for the parsed fields."""
+
+        self.disk_cache = None
+        """:obj:`axonius_api_client.cache.DiskCache`: Disk cache for the raw field
+        schema, parsed when it is loaded, if fields_disk_cache was True or a path."""
+
+        disk_cache = getattr(parent, "_fields_disk_cache", False)
+        if disk_cache:
+            self.disk_cache = cache.DiskCache(
+                path=constants.CACHE_PATH if disk_cache is True else disk_cache,
+                max_age=parent._fields_disk_cache_max_age,
+            )
+
+        self._INDEX = (None, None)
+        """:obj:`tuple`: all_fields and the :obj:`FieldIndex` built from it."""
+
+        super(Fields, self)._init(parent=parent)
+
     def _get(self):
         """Get the fields.
 
@@ -1094,22 +2277,52 @@ class Fields(mixins.Child):
         """
         return self._parent._request(method="get", path=self._parent._router.fields)
 
-    def find_adapter(self, adapter, error=True, all_fields=None):
-        """Find an adapter by name."""
+    def get_index(self, all_fields=None):
+        """Get the lookup index for the parsed fields.
+
+        Notes:
+            The index is built once and reused for as long as the same all_fields
+            is supplied (or returned from the cache by :meth:`get`).
+
+        Args:
+            all_fields (:obj:`dict`, optional):
+                Parsed fields to index. If None, uses :meth:`get`.
+
+                Defaults to: None.
+
+        Returns:
+            :obj:`FieldIndex`
+
+        """
         all_fields = all_fields or self.get()
+        indexed, index = self._INDEX
 
-        check = tools.strip_right(obj=adapter.lower().strip(), fix="_adapter")
+        if indexed is not all_fields:
+            index = FieldIndex(
+                all_fields=all_fields,
+                generic_alts=self._GENERIC_ALTS,
+                all_alts=self._ALL_ALTS,
+            )
+            self._INDEX = (all_fields, index)
 
-        if check in self._GENERIC_ALTS:
-            check = "generic"
+        return index
 
-        if check in all_fields:
+    def find_adapter(self, adapter, error=True, all_fields=None):
+        """Find an adapter by name."""
+        index = self.get_index(all_fields=all_fields)
+        all_fields = index.all_fields
+
+        check = index.find_adapter(adapter=adapter)
+
+        if check:
             vmsg = "Validated adapter name {cn!r} (supplied {n!r})"
             vmsg = vmsg.format(n=adapter, cn=check)
             self._log.debug(vmsg)
 
             return check, all_fields[check]
 
+        check = index.adapter_name(adapter=adapter)
+
         if error:
             raise exceptions.ValueNotFound(
                 value=adapter,
@@ -1132,15 +2345,13 @@ class Fields(mixins.Child):
     def find(self, field, error=True, all_fields=None):
         """Find a field for a given adapter."""
         if field.startswith("MANUAL:"):
-            return [tools.strip_left(obj=field, fix="MANUAL:").strip()]
-
-        all_fields = all_fields or self.get()
+            return [tools.strip_left(obj=field, fix="MANUAL:").strip()]
 
-        all_fq = [f["name"] for af in all_fields.values() for f in af.values()]
+        index = self.get_index(all_fields=all_fields)
 
         check = field.strip()
 
-        if check in all_fq:
+        if index.has_name(name=check):
             fqmsg = "Validated field {sf!r} as already fully qualified"
             fqmsg = fqmsg.format(sf=field)
             self._log.debug(fqmsg)
@@ -1158,7 +2369,7 @@ class Fields(mixins.Child):
         ]
 
         real_adapter, real_fields = self.find_adapter(
-            adapter=search_adapter, error=error, all_fields=all_fields
+            adapter=search_adapter, error=error, all_fields=index.all_fields
         )
 
         found = []
@@ -1167,14 +2378,7 @@ class Fields(mixins.Child):
             return found
 
         for search_field in search_fields:
-            found_field = None
-
-            if search_field in self._ALL_ALTS:
-                found_field = real_fields["all"]["name"]
-            elif search_field in all_fq:
-                found_field = search_field
-            elif search_field in real_fields:
-                found_field = real_fields[search_field]["name"]
+            found_field = index.find_field(adapter=real_adapter, field=search_field)
 
             if not found_field:
                 if error:
@@ -1210,7 +2414,7 @@ class Fields(mixins.Child):
 
     def find_regex(self, field, all_fields=None):
         """Find a field for a given adapter using regexes."""
-        all_fields = all_fields or self.get()
+        index = self.get_index(all_fields=all_fields)
 
         check = field.strip()
 
@@ -1223,32 +2427,95 @@ class Fields(mixins.Child):
             obj=search_adapter.lower().strip(), fix="_adapter"
         )
 
-        search_adapter_re = re.compile(search_adapter_fix, re.I)
-        found_adapters = {
-            k: v for k, v in all_fields.items() if search_adapter_re.search(k)
-        }
-
-        search_fields_re = [
-            re.compile(x.strip().lower(), re.I)
-            for x in search_fields.split(",")
-            if x.strip()
+        search_fields = [
+            x.strip().lower() for x in search_fields.split(",") if x.strip()
         ]
 
-        found_fields = []
+        return index.find_regex(adapter=search_adapter_fix, fields=search_fields)
 
-        for field_re in search_fields_re:
-            for adapter, adapter_fields in found_adapters.items():
-                for adapter_field, adapter_field_info in adapter_fields.items():
-                    if field_re.search(adapter_field):
-                        found_fields.append(adapter_field_info["name"])
+    def get(self, refresh=False):
+        """Get the parsed fields, using the cache if they have been fetched already.
 
-        return found_fields
+        Notes:
+            The same dict is returned to every caller until the cache entry
+            expires, so it should not be modified.
 
-    def get(self):
-        """Pass."""
-        raw = self._get()
-        parser = ParserFields(raw=raw, parent=self)
-        return parser.parse()
+        Args:
+            refresh (:obj:`bool`, optional):
+                Clear the cache and fetch the fields again.
+
+                Defaults to: False.
+
+        Returns:
+            :obj:`dict`
+
+        """
+        if refresh:
+            self.cache.clear()
+
+        def load():
+            raw = self._get_disk_cached(refresh=refresh)
+            parser = ParserFields(raw=raw, parent=self)
+            return parser.parse()
+
+        return self.cache.get_or_set(key="fields", func=load)
+
+    def _get_disk_cached(self, refresh=False):
+        """Get the raw fields from the disk cache, if enabled.
+
+        Notes:
+            Entries are keyed by the URL of the instance and the fields route, and
+            are only used if the build of the instance has not changed. If the build
+            can not be fetched, the disk cache is not used.
+
+        Args:
+            refresh (:obj:`bool`, optional):
+                Ignore the disk cache entry and replace it.
+
+                Defaults to: False.
+
+        Returns:
+            :obj:`dict`
+
+        """
+        if self.disk_cache is None:
+            return self._get()
+
+        key = tools.join_url(self._parent._auth.http.url, self._parent._router.fields)
+        build = self._get_build()
+        if build is None:
+            return self._get()
+
+        fields = None if refresh else self.disk_cache.get(key=key, version=build)
+
+        if fields is None:
+            fields = self._get()
+            self.disk_cache.set(key=key, value=fields, version=build)
+        else:
+            msg = "Loaded fields from {dc} for {k!r} with build {b!r}"
+            msg = msg.format(dc=self.disk_cache, k=key, b=build)
+            self._log.debug(msg)
+
+        return fields
+
+    def _get_build(self):
+        """Get the build of the instance from the about page.
+
+        Returns:
+            :obj:`str`: or None if the about page could not be fetched
+
+        """
+        try:
+            about = self._parent._request(
+                method="get", path=routers.ApiV1.system.meta_about
+            )
+        except Exception as exc:
+            msg = "Not using {dc}, unable to get build: {exc}"
+            self._log.warning(msg.format(dc=self.disk_cache, exc=exc))
+            return None
+
+        keys = ["Version", "Build Date", "Commit Hash"]
+        return tools.join_comma(obj=["{}={}".format(k, about.get(k)) for k in keys])
 
     def validate(
         self,
@@ -1267,7 +2534,7 @@ class Fields(mixins.Child):
         fields = listify(obj=fields)
         fields_manual = listify(obj=fields_manual)
         fields_regex = listify(obj=fields_regex)
-        all_fields = all_fields or self.get()
+        all_fields = self.get_index(all_fields=all_fields).all_fields
 
         val_fields = []
 
@@ -1287,6 +2554,239 @@ class Fields(mixins.Child):
         return val_fields
 
 
+class FieldIndex(object):
+    """Lookup tables for parsed fields, so each name is resolved with a dict lookup.
+
+    Notes:
+        Built by :meth:`Fields.get_index`, should not be modified after creation.
+        The tables for an adapter are built the first time it is searched, so
+        the fields of adapters that are never searched are not parsed.
+    """
+
+    def __init__(self, all_fields, generic_alts, all_alts):
+        """Pass.
+
+        Args:
+            all_fields (:obj:`dict`):
+                Parsed fields from :meth:`Fields.get`.
+            generic_alts (:obj:`list` of :obj:`str`):
+                Alternative names for the generic adapter.
+            all_alts (:obj:`list` of :obj:`str`):
+                Alternative names for the field of all data for an adapter.
+
+        """
+        self.all_fields = all_fields
+        """:obj:`dict`: Parsed fields this index was built from."""
+
+        self.adapter_alts = {x: "generic" for x in generic_alts}
+        """:obj:`dict`: alternative adapter name -> adapter name."""
+
+        self.all_alts = set(all_alts)
+        """:obj:`set`: Alternative names for the field of all data for an adapter."""
+
+        self.lookups = {}
+        """:obj:`dict`: adapter name -> field name or lowercase alias -> fully
+        qualified name."""
+
+        self.names = {}
+        """:obj:`dict`: adapter name -> fully qualified name -> field."""
+
+        self.ordered = {}
+        """:obj:`dict`: adapter name -> :obj:`list` of (field name, fully qualified
+        name) in schema order."""
+
+        self.sorted = {}
+        """:obj:`dict`: adapter name -> :obj:`list` of (lowercase field name,
+        position in :attr:`ordered`) sorted by name."""
+
+        self.regex_cache = cache.Cache(max_size=constants.FIELDS_REGEX_CACHE_SIZE)
+        """:obj:`axonius_api_client.cache.Cache`: Results of :meth:`find_regex`."""
+
+    def __str__(self):
+        """Pass."""
+        return "{c}(adapters={a}, indexed={i})".format(
+            c=self.__class__.__name__, a=len(self.all_fields), i=len(self.lookups)
+        )
+
+    def __repr__(self):
+        """Pass."""
+        return self.__str__()
+
+    def _index(self, adapter):
+        """Build the tables for an adapter, if not already built.
+
+        Returns:
+            :obj:`dict`: field name or lowercase alias -> fully qualified name.
+
+        """
+        if adapter in self.lookups:
+            return self.lookups[adapter]
+
+        lookup = {}
+        aliases = {}
+        ordered = []
+        names = {}
+
+        for field_name, field in self.all_fields[adapter].items():
+            lookup[field_name] = field["name"]
+            aliases.setdefault(field_name.lower(), field["name"])
+            ordered.append((field_name, field["name"]))
+            names.setdefault(field["name"], field)
+
+        for alias, name in aliases.items():
+            lookup.setdefault(alias, name)
+
+        self.names[adapter] = names
+        self.ordered[adapter] = ordered
+        self.sorted[adapter] = sorted(
+            (x[0].lower(), pos) for pos, x in enumerate(ordered)
+        )
+        self.lookups[adapter] = lookup
+        return lookup
+
+    def adapter_name(self, adapter):
+        """Normalize an adapter name.
+
+        Returns:
+            :obj:`str`
+
+        """
+        check = tools.strip_right(obj=adapter.lower().strip(), fix="_adapter")
+        return self.adapter_alts.get(check, check)
+
+    def find_adapter(self, adapter):
+        """Find an adapter by name.
+
+        Returns:
+            :obj:`str`: the adapter name, or None if not found.
+
+        """
+        check = self.adapter_name(adapter=adapter)
+        return check if check in self.all_fields else None
+
+    def has_name(self, name):
+        """Check if a name is the fully qualified name of a field.
+
+        Returns:
+            :obj:`bool`
+
+        """
+        return self.get_field(name=name) is not None
+
+    def get_field(self, name):
+        """Get a field by its fully qualified name.
+
+        Notes:
+            Only the generic adapter and the adapter in the prefix of name
+            (adapters_data.NAME_adapter) are checked.
+
+        Returns:
+            :obj:`dict`: the field, or None if not found.
+
+        """
+        adapters = ["generic"]
+
+        if name.startswith("adapters_data."):
+            adapter = tools.strip_right(obj=name.split(".")[1], fix="_adapter")
+            if adapter in self.all_fields:
+                adapters.insert(0, adapter)
+
+        for adapter in adapters:
+            self._index(adapter=adapter)
+            field = self.names[adapter].get(name, None)
+            if field is not None:
+                return field
+        return None
+
+    def find_field(self, adapter, field):
+        """Find a field of an adapter by name, alias, or fully qualified name.
+
+        Args:
+            adapter (:obj:`str`):
+                Adapter name returned from :meth:`find_adapter`.
+            field (:obj:`str`):
+                Field name to find.
+
+        Returns:
+            :obj:`str`: the fully qualified name, or None if not found.
+
+        """
+        lookup = self._index(adapter=adapter)
+
+        if field in self.all_alts:
+            return lookup["all"]
+
+        if self.has_name(name=field):
+            return field
+
+        return lookup.get(field, None)
+
+    def find_regex(self, adapter, fields):
+        """Find fields of adapters using regexes.
+
+        Notes:
+            Results are cached in :attr:`regex_cache` by the regexes supplied.
+
+        Args:
+            adapter (:obj:`str`):
+                Regex to search adapter names with.
+            fields (:obj:`list` of :obj:`str`):
+                Regexes to search field names of matching adapters with.
+
+        Returns:
+            :obj:`list` of :obj:`str`: fully qualified names of matching fields.
+
+        """
+        key = (adapter, tuple(fields))
+
+        def search():
+            adapter_re = re_compile(pattern=adapter)
+            adapters = [x for x in self.all_fields if adapter_re.search(x)]
+            found = []
+
+            for field in fields:
+                for name in adapters:
+                    found += self._search_fields(adapter=name, pattern=field)
+
+            return found
+
+        return list(self.regex_cache.get_or_set(key=key, func=search))
+
+    def _search_fields(self, adapter, pattern):
+        """Find fields of an adapter using a regex.
+
+        Notes:
+            Regexes that are a literal string are matched with a substring check,
+            or with a binary search of :attr:`sorted` if anchored to the start,
+            instead of running the regex on every field name.
+
+        Returns:
+            :obj:`list` of :obj:`str`: fully qualified names in schema order.
+
+        """
+        self._index(adapter=adapter)
+        ordered = self.ordered[adapter]
+
+        if not REGEX_LITERAL.match(pattern):
+            regex = re_compile(pattern=pattern)
+            return [name for field, name in ordered if regex.search(field)]
+
+        if not pattern.startswith("^"):
+            return [name for field, name in ordered if pattern in field.lower()]
+
+        prefix = pattern[1:]
+        fields = self.sorted[adapter]
+        positions = []
+
+        for idx in range(bisect.bisect_left(fields, (prefix,)), len(fields)):
+            field, pos = fields[idx]
+            if not field.startswith(prefix):
+                break
+            positions.append(pos)
+
+        return [ordered[pos][1] for pos in sorted(positions)]
+
+
 class Reports(mixins.Child):
     """Pass."""
 
@@ -1387,14 +2887,323 @@ class ParserFields(mixins.Parser):
 
         return short_name, fields
 
+    def parse_adapter(self, name, raw_name=None):
+        """Parse the fields of one adapter.
+
+        Args:
+            name (:obj:`str`):
+                Adapter name, or "generic".
+            raw_name (:obj:`str`, optional):
+                Name of the adapter in the raw fields, if not generic.
+
+                Defaults to: None.
+
+        Returns:
+            :obj:`dict`
+
+        """
+        if raw_name is None:
+            return self._generic()
+
+        raw_fields = self._raw["specific"][raw_name]
+        _, fields = self._adapter(name=raw_name, raw_fields=raw_fields)
+        return fields
+
     def parse(self):
+        """Parse the raw fields.
+
+        Notes:
+            Only the adapter names are parsed here, the fields of each adapter are
+            parsed the first time they are accessed, see :obj:`ParsedFields`.
+
+        Returns:
+            :obj:`ParsedFields`
+
+        """
+        raw_names = {"generic": None}
+
+        for name in self._raw["specific"]:
+            short_name = tools.strip_right(obj=name, fix="_adapter")
+            self._exists(short_name, raw_names, "Adapter {}".format(name))
+            raw_names[short_name] = name
+
+        return ParsedFields(parser=self, raw_names=raw_names)
+
+
+class ParsedFields(dict):
+    """Parsed fields of each adapter, with the fields parsed on first access.
+
+    Notes:
+        The adapter names are the keys and are known up front, the fields of an
+        adapter are parsed by :meth:`ParserFields.parse_adapter` when its value
+        is first accessed. Anything that needs every value, such as
+        :meth:`items`, :meth:`values`, comparisons, copies, or JSON encoding,
+        parses all of the adapters first.
+    """
+
+    _UNPARSED = object()
+
+    def __init__(self, parser, raw_names):
+        """Pass.
+
+        Args:
+            parser (:obj:`ParserFields`):
+                Parser of the raw fields.
+            raw_names (:obj:`dict`):
+                adapter name -> name of the adapter in the raw fields, or None for
+                the generic adapter.
+
+        """
+        super(ParsedFields, self).__init__()
+
+        self._PARSER = parser
+        self._RAW_NAMES = raw_names
+        self._LOCK = threading.RLock()
+
+        for name in raw_names:
+            dict.__setitem__(self, name, self._UNPARSED)
+
+    def _parse(self, name):
+        """Get the fields of an adapter, parsing them if not parsed yet."""
+        value = dict.__getitem__(self, name)
+
+        if value is self._UNPARSED:
+            with self._LOCK:
+                value = dict.__getitem__(self, name)
+
+                if value is self._UNPARSED:
+                    value = self._PARSER.parse_adapter(
+                        name=name, raw_name=self._RAW_NAMES[name]
+                    )
+                    dict.__setitem__(self, name, value)
+
+        return value
+
+    def _parse_all(self):
+        """Parse the fields of all adapters."""
+        for name in list(dict.__iter__(self)):
+            self._parse(name=name)
+
+    @property
+    def parsed(self):
+        """Get the names of the adapters that have been parsed.
+
+        Returns:
+            :obj:`list` of :obj:`str`
+
+        """
+        return [k for k, v in dict.items(self) if v is not self._UNPARSED]
+
+    def __getitem__(self, key):
+        """Pass."""
+        return self._parse(name=key)
+
+    def __iter__(self):
+        """Pass."""
+        # makes dict(obj) and {**obj} use __getitem__ instead of copying values
+        return super(ParsedFields, self).__iter__()
+
+    def __eq__(self, other):
+        """Pass."""
+        self._parse_all()
+        if isinstance(other, ParsedFields):
+            other._parse_all()
+        return super(ParsedFields, self).__eq__(other)
+
+    def __ne__(self, other):
+        """Pass."""
+        return not self == other
+
+    __hash__ = None
+
+    def __repr__(self):
+        """Pass."""
+        self._parse_all()
+        return super(ParsedFields, self).__repr__()
+
+    def __reduce__(self):
+        """Pass."""
+        return (dict, (self.copy(),))
+
+    def get(self, key, default=None):
+        """Pass."""
+        return self._parse(name=key) if key in self else default
+
+    def items(self):
+        """Pass."""
+        self._parse_all()
+        return super(ParsedFields, self).items()
+
+    def values(self):
+        """Pass."""
+        self._parse_all()
+        return super(ParsedFields, self).values()
+
+    def copy(self):
         """Pass."""
-        ret = {}
-        ret["generic"] = self._generic()
+        return dict(self.items())
+
+    def pop(self, key, *args):
+        """Pass."""
+        if key in self:
+            self._parse(name=key)
+        return super(ParsedFields, self).pop(key, *args)
+
+    def popitem(self):
+        """Pass."""
+        self._parse_all()
+        return super(ParsedFields, self).popitem()
+
+    def setdefault(self, key, default=None):
+        """Pass."""
+        if key in self:
+            return self._parse(name=key)
+        return super(ParsedFields, self).setdefault(key, default)
+
+
+class BatchResult(object):
+    """Report of which values were found by a batch lookup.
+
+    Notes:
+        Returned from :meth:`AssetMixin.get_by_values`, or supplied to
+        :meth:`AssetMixin.get_by_values_generator` to be filled in as rows are
+        yielded.
+    """
+
+    def __init__(self):
+        """Pass."""
+        self.rows = []
+        """:obj:`list` of :obj:`dict`: Rows found, if not using a generator."""
+
+        self.requested = []
+        """:obj:`list` of :obj:`str`: Values that were searched for."""
+
+        self.found = {}
+        """:obj:`dict`: value -> :obj:`list` of internal_axon_id of rows that matched
+        the value."""
+
+        self.errors = {}
+        """:obj:`dict`: value -> exception of the query that failed for the value."""
+
+    def __str__(self):
+        """Pass."""
+        return "{c}(rows={r}, found={f}, missing={m}, errors={e})".format(
+            c=self.__class__.__name__,
+            r=len(self.rows),
+            f=len(self.found),
+            m=len(self.missing),
+            e=len(self.errors),
+        )
+
+    def __repr__(self):
+        """Pass."""
+        return self.__str__()
+
+    @property
+    def missing(self):
+        """Get the values that did not match any rows and did not fail.
+
+        Returns:
+            :obj:`list` of :obj:`str`
+
+        """
+        return [
+            x for x in self.requested if x not in self.found and x not in self.errors
+        ]
+
+
+class Checkpoint(object):
+    """State file used to resume :meth:`AssetMixin.get_generator`.
+
+    Notes:
+        The state file stores the query and fields being fetched and the number of
+        rows that have already been yielded (skip).
+    """
+
+    def __init__(self, path):
+        """Pass.
+
+        Args:
+            path (:obj:`str` or :obj:`pathlib.Path`):
+                Path to the state file.
+
+        """
+        self.path = tools.path(obj=path)
+        self.query = None
+        self.fields = None
+        self.skip = 0
+        self.load()
+
+    def __str__(self):
+        """Pass."""
+        return "{c.__name__}(path={p!r}, skip={s})".format(
+            c=self.__class__, p=format(self.path), s=self.skip
+        )
+
+    def __repr__(self):
+        """Pass."""
+        return self.__str__()
+
+    @property
+    def state(self):
+        """Get the state that will be saved to the state file.
+
+        Returns:
+            :obj:`dict`
+
+        """
+        return {
+            "query": self.query,
+            "fields": self.fields,
+            "skip": self.skip,
+        }
+
+    def load(self):
+        """Load the state from the state file, if it exists.
+
+        Returns:
+            :obj:`bool`: True if the state file existed.
+
+        """
+        if not self.path.is_file():
+            return False
+
+        _, state = tools.path_read(obj=self.path, is_json=True)
+        self.query = state.get("query")
+        self.fields = state.get("fields")
+        self.skip = state.get("skip") or 0
+        return True
+
+    def start(self, query, fields):
+        """Set the query and fields or make sure they match a resumed state.
+
+        Raises:
+            :exc:`exceptions.ApiError`:
+                if resuming and query or fields do not match the state file.
+
+        """
+        if self.skip and (self.query, self.fields) != (query, fields):
+            msg = "Checkpoint {c} was for query={q!r} fields={f!r}, not {nq!r} {nf!r}"
+            msg = msg.format(c=self, q=self.query, f=self.fields, nq=query, nf=fields)
+            raise exceptions.ApiError(msg)
+
+        self.query = query
+        self.fields = fields
+
+    def save(self):
+        """Write the state to the state file.
+
+        Notes:
+            The state is written to a temporary file that then replaces the state
+            file, so an interrupted save does not leave a truncated state file.
+        """
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        tools.path_write(obj=tmp, data=self.state, is_json=True, overwrite=True)
+        tmp.replace(self.path)
 
-        for name, raw_fields in self._raw["specific"].items():
-            short_name, fields = self._adapter(name=name, raw_fields=raw_fields)
-            self._exists(short_name, ret, "Adapter {}".format(name))
-            ret[short_name] = fields
+    def clear(self):
+        """Remove the state file and reset the state."""
+        if self.path.is_file():
+            self.path.unlink()
 
-        return ret
+        self.skip = 0
@@ -6,7 +6,7 @@ import abc
 
 import six
 
-from .. import constants, exceptions, logs
+from .. import constants, exceptions, logs, tools
 
 
 @six.add_metaclass(abc.ABCMeta)
@@ -135,10 +135,39 @@ class Mixins(object):
 
         response = self._auth.http(**sargs)
 
+        return self._handle_response(
+            response=response,
+            raw=raw,
+            is_json=is_json,
+            error_status=error_status,
+            error_json_bad_status=error_json_bad_status,
+            error_json_invalid=error_json_invalid,
+        )
+
+    def _handle_response(
+        self,
+        response,
+        raw=False,
+        is_json=True,
+        error_status=True,
+        error_json_bad_status=True,
+        error_json_invalid=True,
+    ):
+        """Check a response and get the data from it.
+
+        Args:
+            response (:obj:`requests.Response`):
+                Response to check.
+
+        Returns:
+            :obj:`object` if is_json, or :obj:`str` if not is_json, or
+            :obj:`requests.Response` if raw
+
+        """
         if raw:
             return response
 
-        if is_json and response.text:
+        if is_json and response.content:
             data = self._check_response_json(
                 response=response,
                 error_json_bad_status=error_json_bad_status,
@@ -176,7 +205,7 @@ class Mixins(object):
 
         """
         try:
-            data = response.json()
+            data = tools.json_load(obj=response.content)
         except Exception as exc:
             if error_json_invalid:
                 raise exceptions.JsonInvalid(response=response, exc=exc)
@@ -0,0 +1,450 @@
+# -*- coding: utf-8 -*-
+"""Apache Arrow and Parquet export of assets, built on :obj:`pyarrow`.
+
+Requires python 3.6+ and pyarrow: pip install axonius_api_client[arrow]
+"""
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import collections
+import functools
+
+import dateutil.tz
+
+from . import constants, exceptions, tools
+
+try:
+    import pyarrow
+    import pyarrow.ipc
+except ImportError:  # pragma: no cover
+    pyarrow = None
+
+try:
+    import pyarrow.parquet
+except ImportError:  # pragma: no cover
+    parquet = None
+else:
+    parquet = pyarrow.parquet
+
+FILE_FORMATS = ["arrow", "parquet"]
+""":obj:`list` of :obj:`str`: File formats :func:`export` can write."""
+
+AGGREGATED_PREFIXES = ("specific_data.", "adapters_data.")
+""":obj:`tuple` of :obj:`str`: Prefixes of fields that have a value per adapter."""
+
+FIELD_TYPES = ["string", "integer", "number", "bool"]
+""":obj:`list` of :obj:`str`: Field types that are simple values."""
+
+
+def check_installed(name="pyarrow"):
+    """Check that pyarrow, or the parquet module of pyarrow, is installed.
+
+    Raises:
+        :exc:`exceptions.ToolsError`: if not installed.
+
+    """
+    module = pyarrow if name == "pyarrow" else parquet
+
+    if module is None:
+        error = "{n} is required to export to Arrow or Parquet, install it with: {cmd}"
+        error = error.format(n=name, cmd="pip install axonius_api_client[arrow]")
+        raise exceptions.ToolsError(error)
+
+
+def get_type(name):
+    """Get the Arrow type of a simple field type.
+
+    Returns:
+        :obj:`pyarrow.DataType`
+
+    """
+    return {
+        "string": pyarrow.string(),
+        "integer": pyarrow.int64(),
+        "number": pyarrow.float64(),
+        "bool": pyarrow.bool_(),
+        "date-time": pyarrow.timestamp("us", tz="UTC"),
+    }[name]
+
+
+def simple_type(field):
+    """Get the type of a field of simple values, and if it is an array.
+
+    Notes:
+        Strings with a format of date-time have a type of "date-time".
+
+    Returns:
+        :obj:`tuple` of (:obj:`str`, :obj:`bool`): type name, or None if not
+        simple, and is array
+
+    """
+    is_list = field.get("type", None) == "array"
+    type_field = field.get("items", {}) if is_list else field
+    type_name = type_field.get("type", None)
+
+    if type_name not in FIELD_TYPES:
+        return None, is_list
+
+    if type_name == "string" and type_field.get("format", "") == "date-time":
+        type_name = "date-time"
+    return type_name, is_list
+
+
+def to_datetime(value):
+    """Parse a date, assuming UTC if it has no timezone.
+
+    Returns:
+        :obj:`datetime.datetime`
+
+    """
+    value = tools.dt_parse(obj=value)
+
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=dateutil.tz.tzutc())
+    return value
+
+
+class ArrowSchema(object):
+    """Arrow schema of the fields of an asset query, and converters for its rows.
+
+    Notes:
+        The type of each column comes from the type of its field:
+
+        * simple fields become a column of that type, or a list of that type if
+          they are arrays or have a value per adapter (generic and adapter
+          fields)
+        * arrays of objects with simple sub fields become a list of structs,
+          keys that are not sub fields of the field are not exported
+        * fields with a format of date-time become timestamps in UTC
+        * simple fields that are not arrays keep the first value of a row that
+          has more than one
+        * fields of any other type, and fields not in the index, become a
+          column of strings, with values that are not strings encoded as JSON
+
+        Keys of rows that are not columns are not exported.
+    """
+
+    def __init__(self, fields, index):
+        """Pass.
+
+        Args:
+            fields (:obj:`list` of :obj:`str`):
+                Fully qualified names of the fields of the query.
+            index (:obj:`axonius_api_client.api.assets.FieldIndex`):
+                Index of the fields of users or devices.
+
+        """
+        check_installed()
+
+        self.fields = list(collections.OrderedDict.fromkeys(fields))
+        """:obj:`list` of :obj:`str`: Names of the columns."""
+
+        self.index = index
+        """:obj:`axonius_api_client.api.assets.FieldIndex`: Index of fields."""
+
+        self._CONVERTERS = collections.OrderedDict()
+        """:obj:`collections.OrderedDict`: column -> converter of row values."""
+
+        columns = []
+
+        for name in self.fields:
+            arrow_type, converter = self._compile(
+                name=name, field=index.get_field(name=name)
+            )
+            columns.append(pyarrow.field(name, arrow_type))
+            self._CONVERTERS[name] = converter
+
+        self.schema = pyarrow.schema(columns)
+        """:obj:`pyarrow.Schema`: Arrow schema of the columns."""
+
+    def __str__(self):
+        """Pass."""
+        return "{c}(columns={n})".format(c=self.__class__.__name__, n=len(self.fields))
+
+    def __repr__(self):
+        """Pass."""
+        return self.__str__()
+
+    def _compile(self, name, field):
+        """Pick the Arrow type and value converter of a column.
+
+        Returns:
+            :obj:`tuple` of (:obj:`pyarrow.DataType`, :obj:`object`)
+
+        """
+        if not field:
+            return pyarrow.string(), to_json
+
+        type_name, is_list = simple_type(field=field)
+
+        if type_name:
+            is_list = is_list or name.startswith(AGGREGATED_PREFIXES)
+            return self._simple(type_name=type_name, is_list=is_list)
+
+        sub_fields = field.get("items", {}).get("items", None)
+
+        if not (is_list and isinstance(sub_fields, list) and sub_fields):
+            return pyarrow.string(), to_json
+
+        struct_fields = []
+        converters = collections.OrderedDict()
+
+        for sub_field in sub_fields:
+            sub_type, sub_list = simple_type(field=sub_field)
+
+            if not sub_type:
+                return pyarrow.string(), to_json
+
+            if sub_field["name"] in converters:
+                continue
+
+            arrow_type, converter = self._simple(type_name=sub_type, is_list=sub_list)
+            struct_fields.append(pyarrow.field(sub_field["name"], arrow_type))
+            converters[sub_field["name"]] = converter
+
+        arrow_type = pyarrow.list_(pyarrow.struct(struct_fields))
+        return arrow_type, functools.partial(to_structs, converters=converters)
+
+    def _simple(self, type_name, is_list):
+        """Get the Arrow type and value converter of simple values.
+
+        Returns:
+            :obj:`tuple` of (:obj:`pyarrow.DataType`, :obj:`object`)
+
+        """
+        arrow_type = get_type(name=type_name)
+        item = to_datetime if type_name == "date-time" else None
+
+        if is_list:
+            return pyarrow.list_(arrow_type), functools.partial(to_list, item=item)
+        return arrow_type, functools.partial(to_value, item=item)
+
+    def batch(self, rows):
+        """Convert rows to a record batch.
+
+        Returns:
+            :obj:`pyarrow.RecordBatch`
+
+        """
+        arrays = []
+
+        for column, arrow_field in zip(self._CONVERTERS.items(), self.schema):
+            name, converter = column
+            values = [converter(row.get(name, None)) for row in rows]
+            arrays.append(pyarrow.array(values, type=arrow_field.type))
+
+        return pyarrow.RecordBatch.from_arrays(arrays, schema=self.schema)
+
+
+def to_json(value):
+    """Pass."""
+    if value is None or isinstance(value, tools.STR):
+        return value
+    return tools.json_dump(obj=value, indent=None)
+
+
+def to_value(value, item=None):
+    """Pass."""
+    if isinstance(value, tools.LIST):
+        values = to_list(value=value)
+        value = values[0] if values else None
+
+    if value is None or item is None:
+        return value
+    return item(value)
+
+
+def to_list(value, item=None):
+    """Pass."""
+    if value is None:
+        return None
+
+    values = []
+
+    for x in tools.listify(obj=value):
+        if isinstance(x, tools.LIST):
+            values += x
+        elif x is not None:
+            values.append(x)
+
+    if item is not None:
+        values = [item(x) for x in values]
+    return values
+
+
+def to_structs(value, converters):
+    """Pass."""
+    if value is None:
+        return None
+
+    return [
+        {k: c(x.get(k, None)) for k, c in converters.items()}
+        for x in tools.listify(obj=value)
+        if isinstance(x, dict)
+    ]
+
+
+def get_schema(apiobj, **kwargs):
+    """Resolve the fields of a query and build the Arrow schema of them.
+
+    Args:
+        apiobj (:obj:`axonius_api_client.api.assets.AssetMixin`):
+            Users or devices API object.
+        **kwargs:
+            fields, fields_manual, fields_regex, fields_default, fields_error, and
+            all_fields as for :meth:`axonius_api_client.api.assets.AssetMixin.get`.
+
+    Returns:
+        :obj:`ArrowSchema`
+
+    """
+    check_installed()
+
+    fields = apiobj.fields.validate(
+        fields=kwargs.get("fields", None),
+        fields_manual=kwargs.get("fields_manual", None),
+        fields_regex=kwargs.get("fields_regex", None),
+        default=kwargs.get("fields_default", True),
+        error=kwargs.get("fields_error", True),
+        all_fields=kwargs.get("all_fields", None),
+    )
+    index = apiobj.fields.get_index(all_fields=kwargs.get("all_fields", None))
+    return ArrowSchema(fields=["internal_axon_id"] + fields, index=index)
+
+
+def get_batches(apiobj, schema=None, batch_size=None, **kwargs):
+    """Get the rows of a query as Arrow record batches.
+
+    Args:
+        apiobj (:obj:`axonius_api_client.api.assets.AssetMixin`):
+            Users or devices API object.
+        schema (:obj:`ArrowSchema`, optional):
+            Schema from :func:`get_schema`. If None, built from kwargs.
+
+            Defaults to: None.
+        batch_size (:obj:`int`, optional):
+            Rows in each batch. If None, uses page_size from kwargs, or
+            :data:`constants.MAX_PAGE_SIZE`, so there is a batch per page.
+
+            Defaults to: None.
+        **kwargs:
+            Passed to :meth:`axonius_api_client.api.assets.AssetMixin.get_generator`.
+
+    Yields:
+        :obj:`pyarrow.RecordBatch`
+
+    """
+    schema = schema or get_schema(apiobj=apiobj, **kwargs)
+    batch_size = batch_size or kwargs.get("page_size", None) or constants.MAX_PAGE_SIZE
+
+    for key in ["fields", "fields_regex", "all_fields"]:
+        kwargs.pop(key, None)
+
+    kwargs["fields_manual"] = schema.fields
+    kwargs["fields_default"] = False
+
+    rows = []
+
+    for row in apiobj.get_generator(**kwargs):
+        rows.append(row)
+
+        if len(rows) >= batch_size:
+            yield schema.batch(rows=rows)
+            rows = []
+
+    if rows:
+        yield schema.batch(rows=rows)
+
+
+def export(
+    apiobj,
+    path,
+    file_format="parquet",
+    batch_size=None,
+    compression="snappy",
+    overwrite=False,
+    # fmt: off
+    **kwargs
+    # fmt: on
+):
+    """Write the rows of a query to a Parquet or Arrow IPC file a batch at a time.
+
+    Args:
+        apiobj (:obj:`axonius_api_client.api.assets.AssetMixin`):
+            Users or devices API object.
+        path (:obj:`str` or :obj:`pathlib.Path`):
+            Path of the file to write. Batches are written to a temp file next to
+            it that replaces it once all rows are written.
+        file_format (:obj:`str`, optional):
+            One of :data:`FILE_FORMATS`.
+
+            Defaults to: "parquet".
+        batch_size (:obj:`int`, optional):
+            See :func:`get_batches`.
+
+            Defaults to: None.
+        compression (:obj:`str`, optional):
+            Compression codec of the Parquet file, or None. Not used for Arrow.
+
+            Defaults to: "snappy".
+        overwrite (:obj:`bool`, optional):
+            Overwrite path if it exists.
+
+            Defaults to: False.
+        **kwargs:
+            Passed to :func:`get_batches`.
+
+    Raises:
+        :exc:`exceptions.ToolsError`: if file_format is not supported, pyarrow is
+            not installed, or path exists and overwrite is False.
+
+    Returns:
+        :obj:`int`: number of rows written
+
+    """
+    if file_format not in FILE_FORMATS:
+        error = "File format {f!r} is not supported, must be one of {fs}"
+        error = error.format(f=file_format, fs=FILE_FORMATS)
+        raise exceptions.ToolsError(error)
+
+    check_installed(name="pyarrow" if file_format == "arrow" else "pyarrow.parquet")
+
+    path = tools.path(obj=path)
+
+    if path.exists() and not overwrite:
+        error = "File {p!r} already exists and overwrite is False"
+        error = error.format(p=format(path))
+        raise exceptions.ToolsError(error)
+
+    path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+
+    schema = get_schema(apiobj=apiobj, **kwargs)
+    batches = get_batches(apiobj=apiobj, schema=schema, batch_size=batch_size, **kwargs)
+    count = 0
+
+    # write to a temp file so a failed export does not leave a truncated file
+    tmp_path = path.with_name(path.name + ".tmp")
+
+    try:
+        if file_format == "arrow":
+            writer = pyarrow.ipc.new_file(format(tmp_path), schema.schema)
+        else:
+            writer = parquet.ParquetWriter(
+                format(tmp_path), schema.schema, compression=compression
+            )
+
+        try:
+            for batch in batches:
+                if file_format == "arrow":
+                    writer.write_batch(batch)
+                else:
+                    writer.write_table(pyarrow.Table.from_batches([batch]))
+                count += batch.num_rows
+        finally:
+            writer.close()
+
+        tmp_path.replace(path)
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+
+    return count
@@ -0,0 +1,321 @@
+# -*- coding: utf-8 -*-
+"""Axonius API Client caching module."""
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import collections
+import hashlib
+import threading
+import time
+
+from . import constants, tools
+
+now = getattr(time, "monotonic", time.time)
+MISSING = object()
+
+
+class Cache(object):
+    """Thread safe in memory cache with expiring entries and a size limit.
+
+    Notes:
+        When the cache has max_size entries, the least recently used entry is
+        removed to make room for a new one.
+    """
+
+    def __init__(self, ttl=None, max_size=None):
+        """Pass.
+
+        Args:
+            ttl (:obj:`int`, optional):
+                Seconds an entry is kept for. If None, entries do not expire.
+
+                Defaults to: None.
+            max_size (:obj:`int`, optional):
+                Most entries to keep. If None, no limit.
+
+                Defaults to: None.
+
+        """
+        self.ttl = ttl
+        """:obj:`int`: Seconds an entry is kept for."""
+
+        self.max_size = max_size
+        """:obj:`int`: Most entries to keep."""
+
+        self._ENTRIES = collections.OrderedDict()
+        """:obj:`collections.OrderedDict`: key -> (expires, value), oldest first."""
+
+        self._LOADING = {}
+        """:obj:`dict`: key -> :obj:`threading.Lock` for keys being loaded."""
+
+        self._LOCK = threading.RLock()
+        """:obj:`threading.RLock`: Lock for updating entries and counters."""
+
+        self._COUNTS = {"hits": 0, "misses": 0, "evictions": 0}
+        """:obj:`dict`: Counters of cache use, see :attr:`stats`."""
+
+    def __str__(self):
+        """Pass."""
+        return "{c}(ttl={t}, max_size={m}, size={s})".format(
+            c=self.__class__.__name__, t=self.ttl, m=self.max_size, s=len(self)
+        )
+
+    def __repr__(self):
+        """Pass."""
+        return self.__str__()
+
+    def __len__(self):
+        """Pass."""
+        with self._LOCK:
+            return len(self._ENTRIES)
+
+    def __contains__(self, key):
+        """Pass."""
+        with self._LOCK:
+            return self._lookup(key=key) is not MISSING
+
+    @property
+    def stats(self):
+        """Get the counters of cache use.
+
+        Returns:
+            :obj:`dict`
+
+        """
+        with self._LOCK:
+            stats = dict(self._COUNTS)
+            stats["size"] = len(self._ENTRIES)
+            return stats
+
+    def _lookup(self, key):
+        """Get the value of an entry, removing it if it has expired.
+
+        Notes:
+            Must be called while holding :attr:`_LOCK`.
+
+        Returns:
+            :obj:`object`: the value, or :data:`MISSING` if not found.
+
+        """
+        entry = self._ENTRIES.get(key, None)
+
+        if entry is None:
+            return MISSING
+
+        expires, value = entry
+
+        if expires is not None and expires <= now():
+            del self._ENTRIES[key]
+            return MISSING
+
+        self._ENTRIES.pop(key)
+        self._ENTRIES[key] = entry
+        return value
+
+    def get(self, key, default=None):
+        """Get the value of an entry.
+
+        Returns:
+            :obj:`object`: the value, or default if not found or expired.
+
+        """
+        with self._LOCK:
+            value = self._lookup(key=key)
+
+            if value is MISSING:
+                self._COUNTS["misses"] += 1
+                return default
+
+            self._COUNTS["hits"] += 1
+            return value
+
+    def set(self, key, value):
+        """Add or replace an entry."""
+        expires = None if self.ttl is None else now() + self.ttl
+
+        with self._LOCK:
+            self._ENTRIES.pop(key, None)
+            self._ENTRIES[key] = (expires, value)
+
+            while self.max_size is not None and len(self._ENTRIES) > self.max_size:
+                self._ENTRIES.popitem(last=False)
+                self._COUNTS["evictions"] += 1
+
+    def get_or_set(self, key, func):
+        """Get the value of an entry, or set it to the return of func if not found.
+
+        Notes:
+            If more than one thread misses the same key at once, only one of them
+            calls func and the others wait for and use its value.
+
+        Returns:
+            :obj:`object`
+
+        """
+        with self._LOCK:
+            value = self._lookup(key=key)
+
+            if value is not MISSING:
+                self._COUNTS["hits"] += 1
+                return value
+
+            loading = self._LOADING.setdefault(key, threading.Lock())
+
+        with loading:
+            with self._LOCK:
+                value = self._lookup(key=key)
+
+                if value is not MISSING:
+                    self._COUNTS["hits"] += 1
+                    return value
+
+                self._COUNTS["misses"] += 1
+
+            try:
+                value = func()
+                self.set(key=key, value=value)
+            finally:
+                with self._LOCK:
+                    self._LOADING.pop(key, None)
+
+        return value
+
+    def pop(self, key):
+        """Remove an entry.
+
+        Returns:
+            :obj:`bool`: True if the entry existed.
+
+        """
+        with self._LOCK:
+            return self._ENTRIES.pop(key, None) is not None
+
+    def clear(self):
+        """Remove all entries."""
+        with self._LOCK:
+            self._ENTRIES.clear()
+
+
+class DiskCache(object):
+    """Cache that stores entries as JSON files in a directory.
+
+    Notes:
+        Each entry is stored with a version, and is only used if the version
+        supplied to :meth:`get` matches and it is not older than max_age.
+    """
+
+    def __init__(self, path=constants.CACHE_PATH, max_age=None):
+        """Pass.
+
+        Args:
+            path (:obj:`str` or :obj:`pathlib.Path`, optional):
+                Directory to store entries in.
+
+                Defaults to: :data:`constants.CACHE_PATH`.
+            max_age (:obj:`int`, optional):
+                Seconds an entry is used for. If None, entries do not expire.
+
+                Defaults to: None.
+
+        """
+        self.path = tools.path(obj=path)
+        """:obj:`pathlib.Path`: Directory to store entries in."""
+
+        self.max_age = max_age
+        """:obj:`int`: Seconds an entry is used for."""
+
+        self._LOCK = threading.Lock()
+        """:obj:`threading.Lock`: Lock for updating counters."""
+
+        self._COUNTS = {"hits": 0, "misses": 0}
+        """:obj:`dict`: Counters of cache use, see :attr:`stats`."""
+
+    def __str__(self):
+        """Pass."""
+        return "{c}(path={p!r}, max_age={m})".format(
+            c=self.__class__.__name__, p=format(self.path), m=self.max_age
+        )
+
+    def __repr__(self):
+        """Pass."""
+        return self.__str__()
+
+    @property
+    def stats(self):
+        """Get the counters of cache use.
+
+        Returns:
+            :obj:`dict`
+
+        """
+        with self._LOCK:
+            return dict(self._COUNTS)
+
+    def _count(self, name):
+        """Pass."""
+        with self._LOCK:
+            self._COUNTS[name] += 1
+
+    def _entry_path(self, key):
+        """Get the path of the file for an entry.
+
+        Returns:
+            :obj:`pathlib.Path`
+
+        """
+        name = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return self.path / "{}.json".format(name)
+
+    def get(self, key, version=None, default=None):
+        """Get the value of an entry.
+
+        Returns:
+            :obj:`object`: the value, or default if not found, if the version does
+            not match, or if older than max_age.
+
+        """
+        path = self._entry_path(key=key)
+
+        try:
+            _, entry = tools.path_read(obj=path, is_json=True)
+            found = entry["key"] == key and entry["version"] == version
+            created = entry["created"]
+        except Exception:
+            found = False
+
+        if found and self.max_age is not None:
+            found = time.time() - created < self.max_age
+
+        if not found:
+            self._count(name="misses")
+            return default
+
+        self._count(name="hits")
+        return entry["value"]
+
+    def set(self, key, value, version=None):
+        """Add or replace an entry.
+
+        Notes:
+            The entry is written to a temporary file that then replaces the entry
+            file, so readers never see a partial entry.
+        """
+        path = self._entry_path(key=key)
+        tmp = "{}.{}.tmp".format(path.name, threading.current_thread().ident)
+        tmp = path.with_name(tmp)
+        entry = {"key": key, "version": version, "created": time.time(), "value": value}
+        tools.path_write(obj=tmp, data=entry, is_json=True, overwrite=True, indent=None)
+        tmp.replace(path)
+
+    def pop(self, key):
+        """Remove an entry.
+
+        Returns:
+            :obj:`bool`: True if the entry existed.
+
+        """
+        path = self._entry_path(key=key)
+
+        if path.is_file():
+            path.unlink()
+            return True
+        return False
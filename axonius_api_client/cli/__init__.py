@@ -248,6 +248,18 @@ All of the options listed above must be supplied BEFORE any commands or groups.
     is_flag=True,
     show_envvar=True,
 )
+@click.option(
+    "--fields-disk-cache",
+    "-fdc",
+    "fields_disk_cache",
+    default=False,
+    help=(
+        "Cache the fields of users and devices on disk for re-use until the build"
+        " of Axonius changes."
+    ),
+    is_flag=True,
+    show_envvar=True,
+)
 @click.version_option(version.__version__)
 @context.pass_context
 @click.pass_context
@@ -278,6 +290,7 @@ def cli(
     certverify,
     certwarn,
     wraperror,
+    fields_disk_cache,
 ):
     """Command line interface for the Axonius API Client."""
     ctx._click_ctx = click_ctx
@@ -305,6 +318,7 @@ def cli(
     ctx._connect_args["certverify"] = certverify
     ctx._connect_args["certwarn"] = certwarn
     ctx._connect_args["wraperror"] = wraperror
+    ctx._connect_args["fields_disk_cache"] = fields_disk_cache
 
 
 cli.add_command(grp_adapters.adapters)
@@ -106,4 +106,6 @@ SETTING_TYPE_MAP = {
     ),
 }
 
-EXPORT_FORMATS = ["csv", "json", "table"]
+EXPORT_FORMATS = ["csv", "json", "ndjson", "table", "arrow", "parquet"]
+
+ARROW_FORMATS = ["arrow", "parquet"]
@@ -50,6 +50,14 @@ class exc_wrapper(object):
             Context.echo_error(msg)
 
 
+class EchoStream(object):
+    """File like object that writes to STDOUT using click.echo."""
+
+    def write(self, data):
+        """Pass."""
+        click.echo(data, nl=False)
+
+
 class Context(object):
     """Pass."""
 
@@ -84,6 +92,87 @@ class Context(object):
             click.echo(data)
             return
 
+        full_path, mode = self.get_export_path(
+            export_file=export_file,
+            export_path=export_path,
+            export_overwrite=export_overwrite,
+        )
+
+        data = data.encode("utf-8")
+
+        with full_path.open(mode="wb") as fh:
+            fh.write(data)
+
+        msg = "Exported file {p!r} {mode}!"
+        msg = msg.format(p=format(full_path), mode=mode)
+        self.echo_ok(msg)
+
+    def export_stream(
+        self,
+        rows,
+        formatter,
+        export_file=None,
+        export_path=None,
+        export_overwrite=False,
+        ctx=None,
+        # fmt: off
+        **kwargs
+        # fmt: on
+    ):
+        """Write rows to STDOUT or export_file as they are produced.
+
+        Returns:
+            :obj:`int`: number of rows written
+
+        """
+        if not export_file:
+            with self.exc_wrap(wraperror=self.wraperror):
+                return formatter(
+                    ctx=ctx or self, rows=rows, stream=EchoStream(), **kwargs
+                )
+
+        full_path, mode = self.get_export_path(
+            export_file=export_file,
+            export_path=export_path,
+            export_overwrite=export_overwrite,
+            touch=False,
+        )
+
+        # write to a temp file so a failed export does not leave a partial file
+        tmp_path = full_path.with_name(full_path.name + ".tmp")
+        tmp_path.touch(mode=0o600)
+
+        try:
+            with tmp_path.open(mode="w", encoding="utf-8", newline="") as fh:
+                with self.exc_wrap(wraperror=self.wraperror):
+                    count = formatter(ctx=ctx or self, rows=rows, stream=fh, **kwargs)
+
+            tmp_path.replace(full_path)
+        finally:
+            if tmp_path.exists():
+                tmp_path.unlink()
+
+        msg = "Exported {n} rows to file {p!r} {mode}!"
+        msg = msg.format(n=count, p=format(full_path), mode=mode)
+        self.echo_ok(msg)
+        return count
+
+    def get_export_path(
+        self, export_file, export_path=None, export_overwrite=False, touch=True
+    ):
+        """Get the path to export to, making sure it can be written.
+
+        Args:
+            touch (:obj:`bool`, optional):
+                Create the file if it does not exist.
+
+                Defaults to: True.
+
+        Returns:
+            :obj:`tuple` of (:obj:`pathlib.Path`, :obj:`str`): path and if it will
+            be "created" or "overwritten"
+
+        """
         export_path = export_path or os.getcwd()
 
         path = tools.path(obj=export_path)
@@ -98,16 +187,9 @@ class Context(object):
             msg = msg.format(p=full_path)
             self.echo_error(msg=msg)
 
-        full_path.touch(mode=0o600)
-
-        data = data.encode("utf-8")
-
-        with full_path.open(mode="wb") as fh:
-            fh.write(data)
-
-        msg = "Exported file {p!r} {mode}!"
-        msg = msg.format(p=format(full_path), mode=mode)
-        self.echo_ok(msg)
+        if touch:
+            full_path.touch(mode=0o600)
+        return full_path, mode
 
     @staticmethod
     def echo_ok(msg, **kwargs):
@@ -189,5 +271,38 @@ class Context(object):
             export_overwrite=export_overwrite,
         )
 
+    def handle_export_stream(
+        self,
+        rows,
+        formatters,
+        export_format,
+        export_file,
+        export_path,
+        export_overwrite,
+        ctx=None,
+        reason=cli_constants.REASON,
+        # fmt: off
+        **kwargs
+        # fmt: on
+    ):
+        """Write rows using the streaming formatter for export_format.
+
+        Returns:
+            :obj:`int`: number of rows written
+
+        """
+        if export_format not in formatters:
+            self.echo_error(msg=reason.format(ef=export_format, sf=list(formatters)))
+
+        return self.export_stream(
+            rows=rows,
+            formatter=formatters[export_format],
+            export_file=export_file,
+            export_path=export_path,
+            export_overwrite=export_overwrite,
+            ctx=ctx,
+            **kwargs
+        )
+
 
 pass_context = click.make_pass_decorator(Context, ensure=True)
@@ -52,14 +52,47 @@ def cmd(
     client = ctx.obj.start_client(url=url, key=key, secret=secret)
     api = getattr(client, p_grp)
 
-    with ctx.obj.exc_wrap(wraperror=ctx.obj.wraperror):
-        raw_data = api.get(
-            query=query,
-            fields=fields,
-            fields_regex=fields_regex,
-            fields_default=fields_default,
-            max_rows=max_rows,
+    get_args = {
+        "query": query,
+        "fields": fields,
+        "fields_regex": fields_regex,
+        "fields_default": fields_default,
+        "max_rows": max_rows,
+    }
+
+    if export_format in cli_constants.ARROW_FORMATS:
+        grp_common.arrow_export(
+            ctx=ctx,
+            api=api,
+            export_format=export_format,
+            export_file=export_file,
+            export_path=export_path,
+            export_overwrite=export_overwrite,
+            **get_args
         )
+        return
+
+    if export_format in grp_common.STREAM_FORMATTERS:
+        with ctx.obj.exc_wrap(wraperror=ctx.obj.wraperror):
+            rows = api.get(generator=True, **get_args)
+            index = api.fields.get_index()
+
+        grp_common.stream_export(
+            ctx=ctx,
+            api=api,
+            rows=rows,
+            export_format=export_format,
+            export_file=export_file,
+            export_path=export_path,
+            export_overwrite=export_overwrite,
+            joiner=export_delim,
+            index=index,
+        )
+        return
+
+    with ctx.obj.exc_wrap(wraperror=ctx.obj.wraperror):
+        raw_data = api.get(**get_args)
+        index = api.fields.get_index()
 
     grp_common.echo_response(ctx=ctx, raw_data=raw_data, api=api)
 
@@ -74,4 +107,5 @@ def cmd(
         export_overwrite=export_overwrite,
         table_format=export_table_format,
         joiner=export_delim,
+        index=index,
     )
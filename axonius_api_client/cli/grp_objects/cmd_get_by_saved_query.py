@@ -53,10 +53,54 @@ def cmd(
     client = ctx.obj.start_client(url=url, key=key, secret=secret)
     api = getattr(client, p_grp)
 
-    with ctx.obj.exc_wrap(wraperror=ctx.obj.wraperror):
-        raw_data = api.get_by_saved_query(
-            name=name, fields=fields, fields_regex=fields_regex, max_rows=max_rows
+    get_args = {
+        "name": name,
+        "fields": fields,
+        "fields_regex": fields_regex,
+        "max_rows": max_rows,
+    }
+
+    if export_format in cli_constants.ARROW_FORMATS:
+        with ctx.obj.exc_wrap(wraperror=ctx.obj.wraperror):
+            sq = api.saved_query.get_by_name(value=name, match_count=1, match_error=True)
+
+        grp_common.arrow_export(
+            ctx=ctx,
+            api=api,
+            export_format=export_format,
+            export_file=export_file,
+            export_path=export_path,
+            export_overwrite=export_overwrite,
+            query=sq["view"]["query"]["filter"],
+            fields_manual=sq["view"]["fields"],
+            fields=fields,
+            fields_regex=fields_regex,
+            fields_default=False,
+            max_rows=max_rows,
+        )
+        return
+
+    if export_format in grp_common.STREAM_FORMATTERS:
+        with ctx.obj.exc_wrap(wraperror=ctx.obj.wraperror):
+            rows = api.get_by_saved_query(generator=True, **get_args)
+            index = api.fields.get_index()
+
+        grp_common.stream_export(
+            ctx=ctx,
+            api=api,
+            rows=rows,
+            export_format=export_format,
+            export_file=export_file,
+            export_path=export_path,
+            export_overwrite=export_overwrite,
+            joiner=export_delim,
+            index=index,
         )
+        return
+
+    with ctx.obj.exc_wrap(wraperror=ctx.obj.wraperror):
+        raw_data = api.get_by_saved_query(**get_args)
+        index = api.fields.get_index()
 
     grp_common.echo_response(ctx=ctx, raw_data=raw_data, api=api)
 
@@ -71,4 +115,5 @@ def cmd(
         export_overwrite=export_overwrite,
         export_table_format=export_table_format,
         joiner=export_delim,
+        index=index,
     )
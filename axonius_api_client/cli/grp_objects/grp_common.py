@@ -8,10 +8,17 @@ from .. import serial
 
 FORMATTERS = {
     "json": serial.to_json,
+    "ndjson": serial.to_ndjson,
     "csv": serial.obj_to_csv,
     "table": serial.obj_to_table,
 }
 
+STREAM_FORMATTERS = {
+    "json": serial.stream_json,
+    "csv": serial.stream_csv,
+    "ndjson": serial.stream_ndjson,
+}
+
 
 def get_by_cmd(
     ctx,
@@ -54,6 +61,7 @@ def get_by_cmd(
             fields_default=fields_default,
             max_rows=max_rows,
         )
+        index = api.fields.get_index()
 
     echo_response(ctx=ctx, raw_data=raw_data, api=api)
 
@@ -66,16 +74,83 @@ def get_by_cmd(
         export_overwrite=export_overwrite,
         table_format=export_table_format,
         joiner=joiner,
+        index=index,
+    )
+
+
+def stream_export(
+    ctx,
+    api,
+    rows,
+    export_format,
+    export_file,
+    export_path,
+    export_overwrite,
+    # fmt: off
+    **kwargs
+    # fmt: on
+):
+    """Write rows from a generator as they are fetched, then echo the response."""
+    count = ctx.obj.handle_export_stream(
+        rows=rows,
+        formatters=STREAM_FORMATTERS,
+        export_format=export_format,
+        export_file=export_file,
+        export_path=export_path,
+        export_overwrite=export_overwrite,
+        **kwargs
     )
 
+    echo_response(ctx=ctx, raw_data=None, api=api, count=count)
+
+
+def arrow_export(
+    ctx,
+    api,
+    export_format,
+    export_file,
+    export_path,
+    export_overwrite,
+    # fmt: off
+    **kwargs
+    # fmt: on
+):
+    """Write the rows of a query to an Arrow or Parquet file, then echo the response."""
+    if not export_file:
+        msg = "Export format {ef!r} must be written to a file, supply --export-file"
+        ctx.obj.echo_error(msg=msg.format(ef=export_format))
+
+    full_path, mode = ctx.obj.get_export_path(
+        export_file=export_file,
+        export_path=export_path,
+        export_overwrite=export_overwrite,
+        touch=False,
+    )
+
+    from ... import arrow
+
+    with ctx.obj.exc_wrap(wraperror=ctx.obj.wraperror):
+        count = arrow.export(
+            apiobj=api,
+            path=full_path,
+            file_format=export_format,
+            overwrite=True,
+            **kwargs
+        )
+
+    msg = "Exported {n} rows to file {p!r} {mode}!"
+    ctx.obj.echo_ok(msg.format(n=count, p=format(full_path), mode=mode))
+    echo_response(ctx=ctx, raw_data=None, api=api, count=count)
+
 
-def echo_response(ctx, raw_data, api):
+def echo_response(ctx, raw_data, api, count=None):
     """Pass."""
     last_get = getattr(api, "_LAST_GET", {})
     last_filter = last_get.get("filter", "")
     last_fields = "\n  ".join(last_get.get("fields", "").split(","))
+    count = len(raw_data) if count is None else count
 
-    ctx.obj.echo_ok("Returned {} rows".format(len(raw_data)))
+    ctx.obj.echo_ok("Returned {} rows".format(count))
     ctx.obj.echo_ok("Query: {!r}".format(last_filter))
     ctx.obj.echo_ok("Fields:\n  {}".format(last_fields))
 
@@ -2,7 +2,10 @@
 """Command line interface for Axonius API Client."""
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+import collections
 import csv
+import functools
+import tempfile
 
 import tabulate
 
@@ -140,11 +143,7 @@ def dictwriter(rows, stream=None, headers=None, quoting=cli_constants.QUOTING, *
     """Pass."""
     fh = stream or tools.six.StringIO()
 
-    headers = headers or []
-
-    if not headers:
-        for row in rows:
-            headers += [k for k in row if k not in headers]
+    headers = headers or list(row_headers(rows=rows))
 
     writer = csv.DictWriter(fh, fieldnames=headers, quoting=quoting, **kwargs)
 
@@ -156,11 +155,104 @@ def dictwriter(rows, stream=None, headers=None, quoting=cli_constants.QUOTING, *
     return fh.getvalue()
 
 
+def row_headers(rows, headers=None):
+    """Add the keys of rows to headers in the order they are first seen.
+
+    Returns:
+        :obj:`collections.OrderedDict`: the keys of headers are the headers
+
+    """
+    headers = collections.OrderedDict() if headers is None else headers
+
+    for row in rows:
+        for key in row:
+            if key not in headers:
+                headers[key] = None
+
+    return headers
+
+
+def spool_csv(rows, stream, quoting=cli_constants.QUOTING, **kwargs):
+    """Write rows to stream as CSV without keeping the rows in memory.
+
+    Notes:
+        The rows are spooled to a temporary file while the headers are collected,
+        then the headers and the spooled rows are written to stream.
+
+    Returns:
+        :obj:`int`: number of rows written
+
+    """
+    count = 0
+    found = collections.OrderedDict()
+
+    with tempfile.TemporaryFile(mode="w+b") as spool:
+        for row in rows:
+            row_headers(rows=[row], headers=found)
+            spool.write(tools.json_dump(obj=row, indent=None).encode("utf-8") + b"\n")
+            count += 1
+
+        spool.seek(0)
+
+        writer = csv.DictWriter(
+            stream, fieldnames=list(found), quoting=quoting, **kwargs
+        )
+        writer.writeheader()
+
+        for line in spool:
+            writer.writerow(tools.json_load(obj=line.decode("utf-8")))
+
+    return count
+
+
 def to_json(ctx, raw_data, **kwargs):
     """Pass."""
     return tools.json_dump(obj=raw_data)
 
 
+def to_ndjson(ctx, raw_data, **kwargs):
+    """Pass."""
+    rows = tools.listify(obj=raw_data, dictkeys=False)
+    return "\n".join([tools.json_dump(obj=row, indent=None) for row in rows])
+
+
+def stream_json(ctx, rows, stream, **kwargs):
+    """Write rows to stream as a JSON list one row at a time.
+
+    Notes:
+        The output is the same as :func:`to_json` with a newline added.
+
+    Returns:
+        :obj:`int`: number of rows written
+
+    """
+    count = 0
+
+    for row in rows:
+        data = tools.json_dump(obj=row).replace("\n", "\n  ")
+        stream.write("{}{}".format(",\n  " if count else "[\n  ", data))
+        count += 1
+
+    stream.write("\n]\n" if count else "[]\n")
+    return count
+
+
+def stream_ndjson(ctx, rows, stream, **kwargs):
+    """Write rows to stream as one line of JSON per row.
+
+    Returns:
+        :obj:`int`: number of rows written
+
+    """
+    count = 0
+
+    for row in rows:
+        stream.write(tools.json_dump(obj=row, indent=None) + "\n")
+        count += 1
+
+    return count
+
+
 def is_simple(o):
     """Is simple."""
     return isinstance(o, tools.SIMPLE) or o is None
@@ -181,40 +273,222 @@ def is_dos(o):
     return isinstance(o, dict) and all([is_los(v) for v in o.values()])
 
 
-def compress_rows(ctx, raw_data, joiner="\n", **kwargs):
+def compress_value(row, raw_key, raw_value, joiner="\n"):
+    """Add the cells for one value of a raw row to row."""
+    if is_los(raw_value):
+        row[raw_key] = join_cr(raw_value, is_cell=True, joiner=joiner)
+        return
+
+    if is_list(raw_value) and all([is_dos(x) for x in raw_value]):
+        values = {}
+
+        for raw_item in raw_value:
+            for k, v in raw_item.items():
+                new_key = "{}.{}".format(raw_key, k)
+
+                values[new_key] = values.get(new_key, [])
+
+                values[new_key] += tools.listify(v, dictkeys=False)
+
+        for k, v in values.items():
+            row[k] = join_cr(v, is_cell=True, joiner=joiner)
+
+        return
+
+    msg = "Data of type {t} is too complex for this export format"
+    msg = msg.format(t=type(raw_value).__name__)
+    row[raw_key] = msg
+
+
+def compress_row(raw_row, joiner="\n"):
     """Pass."""
-    raw_data = tools.listify(obj=raw_data, dictkeys=False)
-    rows = []
+    row = {}
+
+    for raw_key, raw_value in raw_row.items():
+        compress_value(row=row, raw_key=raw_key, raw_value=raw_value, joiner=joiner)
+    return row
+
 
-    for raw_row in raw_data:
+class RowFlattener(object):
+    """Flatten rows for csv and table exports using a plan compiled per field.
+
+    Notes:
+        The first time a key is seen, a plan is compiled from the type of its
+        field in index: an array of objects becomes a column per sub field, and
+        a simple value or array of simple values is joined into one column.
+        Every later row is flattened by running the plan of each key, without
+        checking how every value is nested. Keys with no field in index, with
+        fields of any other type, or with values that do not match the plan, use
+        :func:`compress_value`.
+
+        The rows produced are the same as those from :func:`compress_row`.
+    """
+
+    SIMPLE_TYPES = ["string", "integer", "number", "bool"]
+    """:obj:`list` of :obj:`str`: Field types that are simple values."""
+
+    def __init__(self, index=None, joiner="\n"):
+        """Pass.
+
+        Args:
+            index (:obj:`axonius_api_client.api.assets.FieldIndex`, optional):
+                Index of the fields the rows were fetched with. If None, every key
+                uses :func:`compress_value`.
+
+                Defaults to: None.
+            joiner (:obj:`str`, optional):
+                String to join the values of a cell with.
+
+                Defaults to: "\\n".
+
+        """
+        self.index = index
+        """:obj:`axonius_api_client.api.assets.FieldIndex`: Index of fields."""
+
+        self.joiner = joiner
+        """:obj:`str`: String to join the values of a cell with."""
+
+        self._PLANS = {}
+        """:obj:`dict`: key -> plan to add the cells of a value to a row."""
+
+    def __str__(self):
+        """Pass."""
+        return "{c}(index={i}, plans={p})".format(
+            c=self.__class__.__name__, i=self.index, p=len(self._PLANS)
+        )
+
+    def __repr__(self):
+        """Pass."""
+        return self.__str__()
+
+    def flatten(self, raw_row):
+        """Flatten a raw row.
+
+        Returns:
+            :obj:`dict`
+
+        """
+        plans = self._PLANS
         row = {}
-        rows.append(row)
+
         for raw_key, raw_value in raw_row.items():
+            plan = plans.get(raw_key, None)
+
+            if plan is None:
+                plan = plans[raw_key] = self._compile(key=raw_key)
+
+            plan(row, raw_key, raw_value)
+        return row
+
+    def _compile(self, key):
+        """Pick the plan for a key from the type of its field.
+
+        Returns:
+            :obj:`object`: callable of (row, raw_key, raw_value)
+
+        """
+        field = None if self.index is None else self.index.get_field(name=key)
+
+        if not field:
+            return self._flatten_any
+
+        items = field.get("items", {})
+
+        if field["type"] in self.SIMPLE_TYPES:
+            return self._flatten_simple
 
-            if is_los(raw_value):
-                row[raw_key] = join_cr(raw_value, is_cell=True, joiner=joiner)
-                continue
+        if field["type"] != "array":
+            return self._flatten_any
 
-            if is_list(raw_value) and all([is_dos(x) for x in raw_value]):
-                values = {}
+        if items.get("type", None) in self.SIMPLE_TYPES:
+            return self._flatten_simple
 
-                for raw_item in raw_value:
-                    for k, v in raw_item.items():
-                        new_key = "{}.{}".format(raw_key, k)
+        sub_fields = items.get("items", None)
 
-                        values[new_key] = values.get(new_key, [])
+        if items.get("type", None) != "array" or not isinstance(sub_fields, list):
+            return self._flatten_any
 
-                        values[new_key] += tools.listify(v, dictkeys=False)
+        for sub_field in sub_fields:
+            sub_type = sub_field.get("type", None)
 
-                for k, v in values.items():
-                    row[k] = join_cr(v, is_cell=True, joiner=joiner)
+            if sub_type == "array":
+                sub_type = sub_field.get("items", {}).get("type", None)
 
-                continue
+            if sub_type not in self.SIMPLE_TYPES:
+                return self._flatten_any
 
-            msg = "Data of type {t} is too complex for this export format"
-            msg = msg.format(t=type(raw_value).__name__)
-            row[raw_key] = msg
-    return rows
+        prefix = "{}.".format(key)
+        sub_keys = {x["name"]: prefix + x["name"] for x in sub_fields}
+        return functools.partial(self._flatten_complex, prefix=prefix, sub_keys=sub_keys)
+
+    def _cell(self, value):
+        """Join the values of a cell.
+
+        Returns:
+            :obj:`str`
+
+        """
+        values = value if isinstance(value, list) else tools.listify(obj=value)
+        joined = self.joiner.join([format(x) for x in values])
+
+        if len(joined) >= cli_constants.MAX_LEN:
+            return join_cr(value, is_cell=True, joiner=self.joiner)
+        return joined
+
+    def _flatten_any(self, row, raw_key, raw_value):
+        """Pass."""
+        compress_value(row=row, raw_key=raw_key, raw_value=raw_value, joiner=self.joiner)
+
+    def _flatten_simple(self, row, raw_key, raw_value):
+        """Pass."""
+        if not is_los(raw_value):
+            self._flatten_any(row=row, raw_key=raw_key, raw_value=raw_value)
+            return
+
+        row[raw_key] = self._cell(value=raw_value)
+
+    def _flatten_complex(self, row, raw_key, raw_value, prefix, sub_keys):
+        """Pass."""
+        if not (raw_value and isinstance(raw_value, list)):
+            self._flatten_any(row=row, raw_key=raw_key, raw_value=raw_value)
+            return
+
+        values = {}
+
+        for raw_item in raw_value:
+            if not isinstance(raw_item, dict):
+                self._flatten_any(row=row, raw_key=raw_key, raw_value=raw_value)
+                return
+
+            for k, v in raw_item.items():
+                new_key = sub_keys.get(k, None)
+
+                if new_key is None:
+                    new_key = sub_keys[k] = prefix + k
+
+                if not is_los(v):
+                    self._flatten_any(row=row, raw_key=raw_key, raw_value=raw_value)
+                    return
+
+                cell = values.get(new_key, None)
+
+                if cell is None:
+                    cell = values[new_key] = []
+
+                if isinstance(v, tools.LIST):
+                    cell.extend(v)
+                elif v is not None:
+                    cell.append(v)
+
+        for k, v in values.items():
+            row[k] = self._cell(value=v)
+
+
+def compress_rows(ctx, raw_data, joiner="\n", index=None, **kwargs):
+    """Pass."""
+    raw_data = tools.listify(obj=raw_data, dictkeys=False)
+    flattener = RowFlattener(index=index, joiner=joiner)
+    return [flattener.flatten(raw_row=raw_row) for raw_row in raw_data]
 
 
 def obj_to_csv(ctx, raw_data, joiner="\n", **kwargs):
@@ -224,6 +498,18 @@ def obj_to_csv(ctx, raw_data, joiner="\n", **kwargs):
     return data
 
 
+def stream_csv(ctx, rows, stream, joiner="\n", index=None, **kwargs):
+    """Write rows to stream as CSV, compressing each row as it comes in.
+
+    Returns:
+        :obj:`int`: number of rows written
+
+    """
+    flattener = RowFlattener(index=index, joiner=joiner)
+    rows = (flattener.flatten(raw_row=row) for row in rows)
+    return spool_csv(rows=rows, stream=stream)
+
+
 def obj_to_table(ctx, raw_data, joiner="\n", table_format="simple", **kwargs):
     """Pass."""
     if table_format not in tabulate.tabulate_formats:
@@ -21,6 +21,15 @@ class Connect(object):
 
     """
 
+    _HTTP_CLS = http.Http
+    """:obj:`type`: HTTP client class to use."""
+
+    _AUTH_CLS = auth.ApiKey
+    """:obj:`type`: Authentication class to use."""
+
+    _HTTP_ARGS_EXTRA = []
+    """:obj:`list` of :obj:`str`: Extra kwargs to pass to :attr:`_HTTP_CLS`."""
+
     _REASON_RES = [
         re.compile(r".*?object at.*?\>\: ([a-zA-Z0-9\]\[: ]+)"),
         re.compile(r".*?\] (.*) "),
@@ -48,7 +57,22 @@ class Connect(object):
         cert_client_both = kwargs.get("cert_client_both", None)
         cert_client_cert = kwargs.get("cert_client_cert", None)
         cert_client_key = kwargs.get("cert_client_key", None)
+        save_last = kwargs.get("save_last", True)
         save_history = kwargs.get("save_history", False)
+        history_size = kwargs.get("history_size", constants.HISTORY_SIZE)
+        history_meta = kwargs.get("history_meta", False)
+        history_sample = kwargs.get("history_sample", 1)
+        retries = kwargs.get("retries", constants.RETRIES)
+        retry_backoff = kwargs.get("retry_backoff", constants.RETRY_BACKOFF)
+        retry_backoff_max = kwargs.get("retry_backoff_max", constants.RETRY_BACKOFF_MAX)
+        retry_budget = kwargs.get("retry_budget", constants.RETRY_BUDGET)
+        pool_connections = kwargs.get("pool_connections", constants.POOL_CONNECTIONS)
+        pool_maxsize = kwargs.get("pool_maxsize", constants.POOL_MAXSIZE)
+        pool_block = kwargs.get("pool_block", False)
+        tcp_keepalive = kwargs.get("tcp_keepalive", False)
+        http_adapter = kwargs.get("http_adapter", None)
+        compress = kwargs.get("compress", False)
+        compress_min_size = kwargs.get("compress_min_size", constants.COMPRESS_MIN_SIZE)
         log_request_attrs = kwargs.get("log_request_attrs", False)
         log_response_attrs = kwargs.get("log_response_attrs", False)
         log_request_body = kwargs.get("log_request_body", False)
@@ -105,16 +129,51 @@ class Connect(object):
             "log_response_attrs": log_response_attrs,
             "log_request_body": log_request_body,
             "log_response_body": log_response_body,
+            "save_last": save_last,
             "save_history": save_history,
+            "history_size": history_size,
+            "history_meta": history_meta,
+            "history_sample": history_sample,
+            "retries": retries,
+            "retry_backoff": retry_backoff,
+            "retry_backoff_max": retry_backoff_max,
+            "retry_budget": retry_budget,
+            "pool_connections": pool_connections,
+            "pool_maxsize": pool_maxsize,
+            "pool_block": pool_block,
+            "tcp_keepalive": tcp_keepalive,
+            "http_adapter": http_adapter,
+            "compress": compress,
+            "compress_min_size": compress_min_size,
         }
 
-        self._auth_args = {"key": key, "secret": secret, "log_level": log_level_auth}
+        for arg in self._HTTP_ARGS_EXTRA:
+            if arg in kwargs:
+                self._http_args[arg] = kwargs[arg]
 
-        self._http = http.Http(**self._http_args)
-
-        self._auth = auth.ApiKey(http=self._http, **self._auth_args)
+        self._auth_args = {"key": key, "secret": secret, "log_level": log_level_auth}
 
-        self._api_args = {"auth": self._auth, "log_level": log_level_api}
+        self._http = self._HTTP_CLS(**self._http_args)
+
+        self._auth = self._AUTH_CLS(http=self._http, **self._auth_args)
+
+        self._api_args = {
+            "auth": self._auth,
+            "log_level": log_level_api,
+            "fields_cache_ttl": kwargs.get(
+                "fields_cache_ttl", constants.FIELDS_CACHE_TTL
+            ),
+            "fields_disk_cache": kwargs.get("fields_disk_cache", False),
+            "fields_disk_cache_max_age": kwargs.get(
+                "fields_disk_cache_max_age", constants.FIELDS_DISK_CACHE_MAX_AGE
+            ),
+            "result_cache_ttl": kwargs.get(
+                "result_cache_ttl", constants.RESULT_CACHE_TTL
+            ),
+            "result_cache_size": kwargs.get(
+                "result_cache_size", constants.RESULT_CACHE_SIZE
+            ),
+        }
 
     @property
     def users(self):
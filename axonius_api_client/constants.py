@@ -10,6 +10,105 @@ from . import __package__ as PACKAGE_ROOT
 MAX_PAGE_SIZE = 2000
 """:obj:`int`: Maximum page size that REST API allows."""
 
+COMPRESS_MIN_SIZE = 1024
+""":obj:`int`: Smallest request body in bytes to compress when compress is True."""
+
+COMPRESS_LEVEL = 6
+""":obj:`int`: Compression level to use for request bodies."""
+
+COMPRESS_CONTENT_TYPES = ["application/json", "application/x-www-form-urlencoded"]
+""":obj:`list` of :obj:`str`: Content types of request bodies to compress."""
+
+POOL_CONNECTIONS = 10
+""":obj:`int`: Number of connection pools (one per host) to cache."""
+
+POOL_MAXSIZE = 20
+""":obj:`int`: Most connections to keep open in each connection pool."""
+
+TCP_KEEPALIVE_IDLE = 60
+""":obj:`int`: Seconds a connection is idle before TCP keep-alive probes are sent."""
+
+TCP_KEEPALIVE_INTERVAL = 15
+""":obj:`int`: Seconds between TCP keep-alive probes."""
+
+TCP_KEEPALIVE_COUNT = 4
+""":obj:`int`: Number of failed TCP keep-alive probes before a connection is closed."""
+
+RETRIES = 0
+""":obj:`int`: Number of times to retry a request that failed and can be retried,
+0 to not retry unless retries is supplied."""
+
+RETRY_BACKOFF = 0.5
+""":obj:`float`: Seconds to back off before the first retry, doubled each retry."""
+
+RETRY_BACKOFF_MAX = 30
+""":obj:`int`: Most seconds to wait before a retry, including Retry-After."""
+
+RETRY_BUDGET = 100
+""":obj:`int`: Most retries to perform over the life of an Http object."""
+
+RETRY_STATUS = [429, 502, 503, 504]
+""":obj:`list` of :obj:`int`: Response codes that will be retried."""
+
+RETRY_METHODS = ["GET", "HEAD", "OPTIONS", "PUT", "DELETE"]
+""":obj:`list` of :obj:`str`: Methods that will be retried, see idempotent for others."""
+
+HISTORY_SIZE = 100
+""":obj:`int`: Number of responses to keep in history when save_history is True."""
+
+FIELDS_CACHE_TTL = 300
+""":obj:`int`: Seconds to cache the fields of users and devices for."""
+
+CACHE_PATH = os.path.join(
+    os.environ.get("XDG_CACHE_HOME", "") or os.path.join("~", ".cache"), PACKAGE_ROOT
+)
+""":obj:`str`: Directory to store disk caches in."""
+
+FIELDS_DISK_CACHE_MAX_AGE = 86400
+""":obj:`int`: Seconds to use the fields of users and devices from the disk cache for."""
+
+REGEX_CACHE_SIZE = 256
+""":obj:`int`: Number of compiled regexes to cache for field regex searches."""
+
+FIELDS_REGEX_CACHE_SIZE = 128
+""":obj:`int`: Number of field regex search results to cache per fields schema."""
+
+RESULT_CACHE_TTL = 60
+""":obj:`int`: Seconds to cache counts and pages for when fetched with cache=True."""
+
+RESULT_CACHE_SIZE = 64
+""":obj:`int`: Number of counts and pages to cache for users and for devices."""
+
+PAGE_SIZE_MIN = 10
+""":obj:`int`: Smallest page size adaptive paging will shrink to."""
+
+PAGE_TARGET = 10
+""":obj:`int`: Seconds adaptive paging tries to make each page take."""
+
+PAGE_MAX_BYTES = 100 * 1024 * 1024
+""":obj:`int`: Largest response size in bytes adaptive paging will grow a page to."""
+
+PAGE_TIMEOUT_STATUS = [504]
+""":obj:`list` of :obj:`int`: Response codes adaptive paging treats as a timeout."""
+
+PREFETCH_WAIT = 0.5
+""":obj:`float`: Seconds a prefetch thread waits for room in its queue between checks."""
+
+LOOKUP_CHUNK_SIZE = 500
+""":obj:`int`: Number of values to put in each query of a batch lookup."""
+
+LOOKUP_WORKERS = 4
+""":obj:`int`: Number of queries of a batch lookup to run at once."""
+
+SUBNET_CHUNK_SIZE = 50
+""":obj:`int`: Number of IP ranges to OR together in each query of get_by_subnet."""
+
+ASYNC_MAX_CONNECTIONS = 100
+""":obj:`int`: Maximum connections in the pool of the async HTTP client."""
+
+ASYNC_MAX_KEEPALIVE = 20
+""":obj:`int`: Maximum idle connections kept open by the async HTTP client."""
+
 GUI_PAGE_SIZES = [25, 50, 100]
 """:obj:`list` of :obj:`int`: Valid page sizes for GUI paging."""
 
@@ -17,6 +116,7 @@ LOG_REQUEST_ATTRS_BRIEF = [
     "request to {request.url!r}",
     "method={request.method!r}",
     "size={size}",
+    "size_wire={size_wire}",
 ]
 """:obj:`list` of :obj:`str`: Request attributes to log when verbose=False."""
 
@@ -25,6 +125,7 @@ LOG_REQUEST_ATTRS_VERBOSE = [
     "method={request.method!r}",
     "headers={request.headers}",
     "size={size}",
+    "size_wire={size_wire}",
 ]
 """:obj:`list` of :obj:`str`: Request attributes to log when verbose=True."""
 
@@ -33,6 +134,7 @@ LOG_RESPONSE_ATTRS_BRIEF = [
     "method={response.request.method!r}",
     "status={response.status_code!r}",
     "size={size}",
+    "size_wire={size_wire}",
 ]
 """:obj:`list` of :obj:`str`: Response attributes to log when verbose=False."""
 
@@ -44,6 +146,7 @@ LOG_RESPONSE_ATTRS_VERBOSE = [
     "reason={response.reason!r}",
     "elapsed={response.elapsed}",
     "size={size}",
+    "size_wire={size_wire}",
 ]
 """:obj:`list` of :obj:`str`: Response attributes to log when verbose=True."""
 
@@ -0,0 +1,252 @@
+# -*- coding: utf-8 -*-
+"""pandas DataFrames of assets with columns typed from the field schema.
+
+Requires python 3.6+ and pandas: pip install axonius_api_client[pandas]
+"""
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import collections
+
+from . import arrow, constants, exceptions, tools
+
+try:
+    import pandas
+except ImportError:  # pragma: no cover
+    pandas = None
+
+
+def check_installed():
+    """Check that pandas is installed.
+
+    Raises:
+        :exc:`exceptions.ToolsError`: if not installed.
+
+    """
+    if pandas is None:
+        error = "pandas is required to get DataFrames, install it with: {cmd}"
+        error = error.format(cmd="pip install axonius_api_client[pandas]")
+        raise exceptions.ToolsError(error)
+
+
+def to_type(series, type_name):
+    """Convert a series of simple values to the dtype of a field type.
+
+    Notes:
+        Values that can not be converted become missing values.
+
+    Returns:
+        :obj:`pandas.Series`
+
+    """
+    if type_name == "date-time":
+        return pandas.to_datetime(series, utc=True, errors="coerce")
+    if type_name == "integer":
+        return pandas.to_numeric(series, errors="coerce").astype("Int64")
+    if type_name == "number":
+        return pandas.to_numeric(series, errors="coerce").astype("float64")
+    if type_name == "bool":
+        return series.astype("boolean")
+    return series
+
+
+class FrameSchema(object):
+    """Column types of the fields of an asset query, for building DataFrames.
+
+    Notes:
+        The type of each column comes from the type of its field, the same way
+        as for :obj:`axonius_api_client.arrow.ArrowSchema`:
+
+        * simple fields become a column of that dtype: datetime64 in UTC for
+          fields with a format of date-time, Int64, float64, boolean, or object
+          for strings
+        * arrays, and fields that have a value per adapter (generic and adapter
+          fields), become a column of lists, unless they are exploded
+        * exploded columns have a row for each item of their lists, and arrays
+          of objects with simple sub fields become a column per sub field named
+          "field.sub_field"
+
+        Values that can not be converted to the dtype of their column become
+        missing values. Keys of rows that are not columns are not included.
+    """
+
+    def __init__(self, fields, index, explode=None):
+        """Pass.
+
+        Args:
+            fields (:obj:`list` of :obj:`str`):
+                Fully qualified names of the fields of the query.
+            index (:obj:`axonius_api_client.api.assets.FieldIndex`):
+                Index of the fields of users or devices.
+            explode (:obj:`list` of :obj:`str`, optional):
+                Fully qualified names of the fields to explode.
+
+                Defaults to: None.
+
+        """
+        check_installed()
+
+        self.fields = list(collections.OrderedDict.fromkeys(fields))
+        """:obj:`list` of :obj:`str`: Names of the fields."""
+
+        self.explode = [x for x in tools.listify(obj=explode) if x in self.fields]
+        """:obj:`list` of :obj:`str`: Names of the fields to explode."""
+
+        self._TYPES = collections.OrderedDict()
+        """:obj:`collections.OrderedDict`: field -> (type name or None, is list,
+        sub field -> type name or None)."""
+
+        for name in self.fields:
+            self._TYPES[name] = self._compile(
+                name=name, field=index.get_field(name=name)
+            )
+
+    def __str__(self):
+        """Pass."""
+        return "{c}(columns={n}, explode={e})".format(
+            c=self.__class__.__name__, n=len(self.fields), e=self.explode
+        )
+
+    def __repr__(self):
+        """Pass."""
+        return self.__str__()
+
+    def _compile(self, name, field):
+        """Pick the type of a column.
+
+        Returns:
+            :obj:`tuple` of (:obj:`str`, :obj:`bool`, :obj:`dict`)
+
+        """
+        if not field:
+            return None, False, {}
+
+        type_name, is_list = arrow.simple_type(field=field)
+
+        if type_name:
+            return type_name, is_list or name.startswith(arrow.AGGREGATED_PREFIXES), {}
+
+        sub_fields = field.get("items", {}).get("items", None)
+
+        if not (is_list and isinstance(sub_fields, list)):
+            return None, is_list, {}
+
+        sub_types = collections.OrderedDict()
+
+        for sub_field in sub_fields:
+            sub_type, sub_list = arrow.simple_type(field=sub_field)
+            sub_types[sub_field["name"]] = None if sub_list else sub_type
+
+        return None, True, sub_types
+
+    def frame(self, rows):
+        """Convert rows to a DataFrame.
+
+        Returns:
+            :obj:`pandas.DataFrame`
+
+        """
+        df = pandas.DataFrame.from_records(
+            [[row.get(x, None) for x in self.fields] for row in rows],
+            columns=self.fields,
+        )
+
+        for name, (type_name, is_list, sub_types) in self._TYPES.items():
+            if not is_list:
+                df[name] = to_type(series=df[name], type_name=type_name)
+                continue
+
+            df[name] = [arrow.to_list(value=x) for x in df[name]]
+
+            if name not in self.explode:
+                continue
+
+            df = df.explode(name)
+
+            if type_name:
+                df[name] = to_type(series=df[name], type_name=type_name)
+                continue
+
+            if not sub_types:
+                continue
+
+            loc = df.columns.get_loc(name)
+            items = df.pop(name).tolist()
+
+            for pos, (sub_name, sub_type) in enumerate(sub_types.items()):
+                sub_values = [
+                    x.get(sub_name, None) if isinstance(x, dict) else None for x in items
+                ]
+                sub_series = pandas.Series(sub_values, index=df.index, dtype=object)
+                df.insert(
+                    loc + pos,
+                    "{}.{}".format(name, sub_name),
+                    to_type(series=sub_series, type_name=sub_type),
+                )
+
+        return df.reset_index(drop=True)
+
+
+def get_dataframe(apiobj, explode=None, batch_size=None, **kwargs):
+    """Get the rows of a query as a DataFrame, built a page at a time.
+
+    Args:
+        apiobj (:obj:`axonius_api_client.api.assets.AssetMixin`):
+            Users or devices API object.
+        explode (:obj:`str` or :obj:`list` of :obj:`str`, optional):
+            Fields to explode, see :obj:`FrameSchema`. Names are found the same
+            way as fields. Exploding more than one field gives a row for every
+            combination of their items.
+
+            Defaults to: None.
+        batch_size (:obj:`int`, optional):
+            Rows to convert at a time. If None, uses page_size from kwargs, or
+            :data:`constants.MAX_PAGE_SIZE`, so each page is converted as it is
+            fetched.
+
+            Defaults to: None.
+        **kwargs:
+            Passed to :meth:`axonius_api_client.api.assets.AssetMixin.get_generator`.
+
+    Returns:
+        :obj:`pandas.DataFrame`
+
+    """
+    check_installed()
+
+    all_fields = kwargs.get("all_fields", None)
+    error = kwargs.get("fields_error", True)
+
+    fields = apiobj.fields.validate(
+        fields=kwargs.pop("fields", None),
+        fields_manual=kwargs.pop("fields_manual", None),
+        fields_regex=kwargs.pop("fields_regex", None),
+        default=kwargs.pop("fields_default", True),
+        error=error,
+        all_fields=all_fields,
+    )
+    explode = apiobj.fields.validate(
+        fields=explode, default=False, error=error, all_fields=all_fields
+    )
+    index = apiobj.fields.get_index(all_fields=all_fields)
+    schema = FrameSchema(
+        fields=["internal_axon_id"] + fields, index=index, explode=explode
+    )
+
+    batch_size = batch_size or kwargs.get("page_size", None) or constants.MAX_PAGE_SIZE
+    kwargs["fields_manual"] = schema.fields
+    kwargs["fields_default"] = False
+
+    frames = []
+    rows = []
+
+    for row in apiobj.get_generator(**kwargs):
+        rows.append(row)
+
+        if len(rows) >= batch_size:
+            frames.append(schema.frame(rows=rows))
+            rows = []
+
+    if rows or not frames:
+        frames.append(schema.frame(rows=rows))
+
+    return pandas.concat(frames, ignore_index=True) if len(frames) > 1 else frames[0]
@@ -2,8 +2,14 @@
 """Axonius API HTTP client module."""
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+import collections
 import logging
+import random
+import socket
+import threading
+import time
 import warnings
+import zlib
 
 import requests
 import six
@@ -37,6 +43,21 @@ class Http(object):
         https_proxy=None,
         save_last=True,
         save_history=False,
+        history_size=constants.HISTORY_SIZE,
+        history_meta=False,
+        history_sample=1,
+        retries=constants.RETRIES,
+        retry_backoff=constants.RETRY_BACKOFF,
+        retry_backoff_max=constants.RETRY_BACKOFF_MAX,
+        retry_budget=constants.RETRY_BUDGET,
+        retry_status=constants.RETRY_STATUS,
+        pool_connections=constants.POOL_CONNECTIONS,
+        pool_maxsize=constants.POOL_MAXSIZE,
+        pool_block=False,
+        tcp_keepalive=False,
+        http_adapter=None,
+        compress=False,
+        compress_min_size=constants.COMPRESS_MIN_SIZE,
         # fmt: off
         **kwargs
         # fmt: on
@@ -89,6 +110,83 @@ class Http(object):
                 Add last response to :attr:`_HISTORY`.
 
                 Defaults to: False.
+            history_size (:obj:`int`, optional):
+                Number of entries to keep in :attr:`_HISTORY`, the oldest entries
+                are dropped once it is full. If None, keep all entries.
+
+                Defaults to: :data:`constants.HISTORY_SIZE`.
+            history_meta (:obj:`bool`, optional):
+                Add only the url, method, status code, elapsed seconds and sizes of
+                each response to :attr:`_HISTORY` instead of the response itself.
+
+                Defaults to: False.
+            history_sample (:obj:`int`, optional):
+                Add only 1 out of every N responses to :attr:`_HISTORY`.
+
+                Defaults to: 1.
+            retries (:obj:`int`, optional):
+                Number of times to retry a request if a connection error, timeout,
+                or a response code in retry_status happens. Only requests using a
+                method in :data:`constants.RETRY_METHODS` or sent with
+                idempotent=True are retried. If 0, requests are not retried.
+
+                Defaults to: :data:`constants.RETRIES`.
+            retry_backoff (:obj:`float`, optional):
+                Seconds to back off before the first retry, doubled for each retry
+                after that. A random amount of up to this is waited (full jitter).
+
+                Defaults to: :data:`constants.RETRY_BACKOFF`.
+            retry_backoff_max (:obj:`int`, optional):
+                Most seconds to wait before a retry, including when the response
+                has a Retry-After header.
+
+                Defaults to: :data:`constants.RETRY_BACKOFF_MAX`.
+            retry_budget (:obj:`int`, optional):
+                Most retries to perform over the life of this object, once it is
+                used up no more requests are retried. If None, no limit.
+
+                Defaults to: :data:`constants.RETRY_BUDGET`.
+            retry_status (:obj:`list` of :obj:`int`, optional):
+                Response codes to retry.
+
+                Defaults to: :data:`constants.RETRY_STATUS`.
+            pool_connections (:obj:`int`, optional):
+                Number of connection pools (one per host) to cache.
+
+                Defaults to: :data:`constants.POOL_CONNECTIONS`.
+            pool_maxsize (:obj:`int`, optional):
+                Most connections to keep open in each connection pool, should be
+                at least the number of threads sending requests at once.
+
+                Defaults to: :data:`constants.POOL_MAXSIZE`.
+            pool_block (:obj:`bool`, optional):
+                Wait for a connection to be free instead of opening a connection
+                that is thrown away after use when the pool is full.
+
+                Defaults to: False.
+            tcp_keepalive (:obj:`bool`, optional):
+                Enable TCP keep-alive probes on connections, see
+                :data:`constants.TCP_KEEPALIVE_IDLE`.
+
+                Defaults to: False.
+            http_adapter (:obj:`HttpAdapter`, optional):
+                Use an existing adapter, i.e. :attr:`adapter` of another Http
+                object, to share its connection pools. pool_connections,
+                pool_maxsize, pool_block, and tcp_keepalive are not used if
+                supplied.
+
+                Defaults to: None.
+            compress (:obj:`bool`, optional):
+                Gzip JSON and form request bodies of compress_min_size bytes or
+                more. If the server responds with an error to a compressed
+                request, the request is sent again without compression and if
+                that works compression is turned off for this object.
+
+                Defaults to: False.
+            compress_min_size (:obj:`int`, optional):
+                Smallest request body in bytes to compress.
+
+                Defaults to: :data:`constants.COMPRESS_MIN_SIZE`.
             kwargs:
                 log_level (:obj:`str`):
                     Control logging level of object.
@@ -139,11 +237,57 @@ class Http(object):
         self._SAVE_LAST = save_last
         """:obj:`bool`: Save requests to last_request and responses to last_response."""
 
-        self._HISTORY = []
-        """:obj:`list` of :obj:`requests.Response`: History of responses."""
+        self._HISTORY = collections.deque(maxlen=history_size)
+        """:obj:`collections.deque` of :obj:`requests.Response` or :obj:`dict`:
+        History of responses."""
 
         self._SAVE_HISTORY = save_history
-        """:obj:`bool`: Append all responses to history."""
+        """:obj:`bool`: Append responses to history."""
+
+        self._HISTORY_META = history_meta
+        """:obj:`bool`: Append response metadata to history instead of responses."""
+
+        self._HISTORY_SAMPLE = max(history_sample or 1, 1)
+        """:obj:`int`: Append 1 out of every N responses to history."""
+
+        self._HISTORY_SEEN = 0
+        """:obj:`int`: Number of responses seen while save_history is True."""
+
+        self._RETRIES = retries or 0
+        """:obj:`int`: Number of times to retry a request."""
+
+        self._RETRY_BACKOFF = retry_backoff
+        """:obj:`float`: Seconds to back off before the first retry."""
+
+        self._RETRY_BACKOFF_MAX = retry_backoff_max
+        """:obj:`int`: Most seconds to wait before a retry."""
+
+        self._RETRY_BUDGET = retry_budget
+        """:obj:`int`: Most retries to perform over the life of this object."""
+
+        self._RETRY_STATUS = retry_status or []
+        """:obj:`list` of :obj:`int`: Response codes to retry."""
+
+        self._RETRY_COUNTS = {"total": 0, "status": 0, "error": 0, "exhausted": 0}
+        """:obj:`dict`: Counters of retries performed, see :attr:`retry_counts`."""
+
+        self._COMPRESS = compress
+        """:obj:`bool`: Gzip request bodies."""
+
+        self._COMPRESS_MIN_SIZE = compress_min_size
+        """:obj:`int`: Smallest request body in bytes to compress."""
+
+        self._BYTE_COUNTS = {
+            "requests": 0,
+            "request_size": 0,
+            "request_size_wire": 0,
+            "response_size": 0,
+            "response_size_wire": 0,
+        }
+        """:obj:`dict`: Counters of bytes sent and received, see :attr:`byte_counts`."""
+
+        self._LOCK = threading.Lock()
+        """:obj:`threading.Lock`: Lock for updating counters and sampling history."""
 
         self._CONNECT_TIMEOUT = connect_timeout
         """:obj:`int`: Seconds to wait for connection to url to open."""
@@ -154,6 +298,19 @@ class Http(object):
         self.session = requests.Session()
         """:obj:`requests.Session`: Session object to use."""
 
+        if http_adapter is None:
+            http_adapter = HttpAdapter(
+                pool_connections=pool_connections,
+                pool_maxsize=pool_maxsize,
+                pool_block=pool_block,
+                tcp_keepalive=tcp_keepalive,
+            )
+
+        self.adapter = http_adapter
+        """:obj:`HttpAdapter`: Adapter with connection pools used by :attr:`session`."""
+
+        self.adapter.mount(session=self.session)
+
         self.session.verify = certpath if certpath else certverify
         self.session.proxies = {}
         self.session.proxies["https"] = https_proxy
@@ -216,6 +373,7 @@ class Http(object):
         headers=None,
         json=None,
         files=None,
+        idempotent=False,
         # fmt: off
         **kwargs
         # fmt: on
@@ -255,6 +413,11 @@ class Http(object):
                 Files to attach to request.
 
                 Defaults to: None.
+            idempotent (:obj:`bool`, optional):
+                Request can be retried even if method is not in
+                :data:`constants.RETRY_METHODS`, i.e. a POST that only reads data.
+
+                Defaults to: False.
             kwargs:
                 connect_timeout (:obj:`int`): Override object connect timeout.
                 response_timeout (:obj:`int`): Override object response timeout.
@@ -286,13 +449,6 @@ class Http(object):
         if self._SAVE_LAST:
             self._LAST_REQUEST = prepped_request
 
-        if self._LOG_REQUEST_ATTRS:
-            msg = ", ".join(self._LOG_REQUEST_ATTRS)
-            msg = msg.format(
-                request=prepped_request, size=len(prepped_request.body or "")
-            )
-            self._log.debug(msg)
-
         send_args = self.session.merge_environment_settings(
             url=prepped_request.url,
             proxies=kwargs.get("proxies", None),
@@ -312,17 +468,56 @@ class Http(object):
             msg = msg.format(body=tools.json_dump(obj=prepped_request.body, error=False))
             self._log.debug(msg)
 
-        response = self.session.send(**send_args)
+        body = self._compress_request(request=prepped_request)
+
+        if self._LOG_REQUEST_ATTRS:
+            msg = ", ".join(self._LOG_REQUEST_ATTRS)
+            msg = msg.format(
+                request=prepped_request,
+                size=prepped_request.size,
+                size_wire=prepped_request.size_wire,
+            )
+            self._log.debug(msg)
+
+        retries = 0
+        if not files and (idempotent or method.upper() in constants.RETRY_METHODS):
+            retries = self._RETRIES
+
+        response = self._send(send_args=send_args, retries=retries)
+
+        if body is not None and response.status_code >= 400:
+            reason = "{r.status_code} {r.reason}".format(r=response)
+            response.close()
+
+            del prepped_request.headers["Content-Encoding"]
+            prepped_request.headers["Content-Length"] = format(len(body))
+            prepped_request.body = body
+            prepped_request.size_wire = len(body)
+
+            response = self._send(send_args=send_args, retries=retries)
+
+            if response.status_code < 400:
+                msg = "Turning off request compression, server responded with: {r}"
+                self._log.warning(msg.format(r=reason))
+                self._COMPRESS = False
+
+        self._count_bytes(
+            request=prepped_request,
+            response=response,
+            stream=kwargs.get("stream", False),
+        )
 
         if self._SAVE_LAST:
             self._LAST_RESPONSE = response
 
         if self._SAVE_HISTORY:
-            self._HISTORY.append(response)
+            self._add_history(response=response)
 
         if self._LOG_RESPONSE_ATTRS:
             msg = ", ".join(self._LOG_RESPONSE_ATTRS)
-            msg = msg.format(response=response, size=len(response.text or ""))
+            msg = msg.format(
+                response=response, size=response.size, size_wire=response.size_wire
+            )
             self._log.debug(msg)
 
         if self._LOG_RESPONSE_BODY:
@@ -332,6 +527,259 @@ class Http(object):
 
         return response
 
+    def _compress_request(self, request):
+        """Gzip the body of a prepared request if compression is enabled.
+
+        Notes:
+            Sets size and size_wire on request to the length of the body before and
+            after compression. Only bodies with a content type in
+            :data:`constants.COMPRESS_CONTENT_TYPES` are compressed, so multipart
+            bodies from files are always sent as is.
+
+        Args:
+            request (:obj:`requests.PreparedRequest`):
+                Request to compress the body of.
+
+        Returns:
+            :obj:`bytes`: body before compression, or None if it was not compressed.
+
+        """
+        body = request.body
+
+        if isinstance(body, six.text_type):
+            body = body.encode("utf-8")
+
+        size = len(body) if isinstance(body, six.binary_type) else None
+        request.size = request.size_wire = size
+
+        content_type = request.headers.get("Content-Type", "").split(";")[0].strip()
+
+        if (
+            not self._COMPRESS
+            or size is None
+            or size < self._COMPRESS_MIN_SIZE
+            or "Content-Encoding" in request.headers
+            or content_type.lower() not in constants.COMPRESS_CONTENT_TYPES
+        ):
+            return None
+
+        compressor = zlib.compressobj(constants.COMPRESS_LEVEL, zlib.DEFLATED, 31)
+        request.body = compressor.compress(body) + compressor.flush()
+        request.headers["Content-Encoding"] = "gzip"
+        request.headers["Content-Length"] = format(len(request.body))
+        request.size_wire = len(request.body)
+        return body
+
+    def _count_bytes(self, request, response, stream=False):
+        """Set the sizes of a response and add them to :attr:`_BYTE_COUNTS`.
+
+        Notes:
+            Sets size and size_wire on response to the length of the body after and
+            before decompression. Both are None if stream is True, since the body
+            has not been read.
+
+        Args:
+            request (:obj:`requests.PreparedRequest`):
+                Request that was sent.
+            response (:obj:`requests.Response`):
+                Response that was received.
+            stream (:obj:`bool`, optional):
+                Body of response has not been read.
+
+                Defaults to: False.
+
+        """
+        response.size = response.size_wire = None
+
+        if not stream:
+            response.size = len(response.content or b"")
+            try:
+                response.size_wire = response.raw.tell()
+            except Exception:
+                response.size_wire = response.size
+
+        with self._LOCK:
+            counts = self._BYTE_COUNTS
+            counts["requests"] += 1
+            counts["request_size"] += request.size or 0
+            counts["request_size_wire"] += request.size_wire or 0
+            counts["response_size"] += response.size or 0
+            counts["response_size_wire"] += response.size_wire or 0
+
+    @property
+    def byte_counts(self):
+        """Get the counters of bytes sent and received.
+
+        Notes:
+            size is the length of bodies before compression and size_wire is the
+            length of bodies as sent or received, i.e. compressed. Responses with
+            stream=True are not counted.
+
+        Returns:
+            :obj:`dict`
+
+        """
+        with self._LOCK:
+            return dict(self._BYTE_COUNTS)
+
+    @property
+    def retry_counts(self):
+        """Get the counters of retries performed.
+
+        Notes:
+            total is the number of retries, status is how many were due to a
+            response code in retry_status, error is how many were due to a
+            connection error or timeout, and exhausted is how many requests ran
+            out of retries or hit the retry budget.
+
+        Returns:
+            :obj:`dict`
+
+        """
+        with self._LOCK:
+            return dict(self._RETRY_COUNTS)
+
+    def _send(self, send_args, retries=0):
+        """Send a request using :attr:`session`, retrying it if it fails.
+
+        Args:
+            send_args (:obj:`dict`):
+                Arguments for :meth:`requests.Session.send`.
+            retries (:obj:`int`, optional):
+                Number of times to retry the request.
+
+                Defaults to: 0.
+
+        Raises:
+            :exc:`requests.exceptions.ConnectionError`:
+                If a connection error or timeout happened and there are no retries
+                left.
+
+        Returns:
+            :obj:`requests.Response`
+
+        """
+        attempt = 0
+
+        while True:
+            try:
+                response = self.session.send(**send_args)
+            except (
+                requests.exceptions.ConnectionError,
+                requests.exceptions.Timeout,
+            ) as exc:
+                if not self._retry_check(attempt=attempt, retries=retries, kind="error"):
+                    raise
+
+                reason = exc
+                retry_after = None
+            else:
+                if response.status_code not in self._RETRY_STATUS:
+                    return response
+
+                if not self._retry_check(
+                    attempt=attempt, retries=retries, kind="status"
+                ):
+                    return response
+
+                reason = "{r.status_code} {r.reason}".format(r=response)
+                retry_after = response.headers.get("Retry-After")
+                response.close()
+
+            attempt += 1
+            delay = self._retry_delay(attempt=attempt, retry_after=retry_after)
+
+            msg = "Retry {a} of {r} for {u} in {d:.2f} seconds after: {e}"
+            msg = msg.format(
+                a=attempt, r=retries, u=send_args["request"].url, d=delay, e=reason
+            )
+            self._log.warning(msg)
+
+            time.sleep(delay)
+
+    def _retry_check(self, attempt, retries, kind):
+        """Check if a request can be retried and count it if so.
+
+        Returns:
+            :obj:`bool`
+
+        """
+        with self._LOCK:
+            counts = self._RETRY_COUNTS
+            budget_left = self._RETRY_BUDGET is None or (
+                counts["total"] < self._RETRY_BUDGET
+            )
+
+            if attempt >= retries or not budget_left:
+                if retries:
+                    counts["exhausted"] += 1
+                return False
+
+            counts["total"] += 1
+            counts[kind] += 1
+            return True
+
+    def _retry_delay(self, attempt, retry_after=None):
+        """Get the seconds to wait before a retry.
+
+        Args:
+            attempt (:obj:`int`):
+                Retry number, starting at 1.
+            retry_after (:obj:`str`, optional):
+                Value of Retry-After header from response, either seconds or a
+                HTTP date.
+
+                Defaults to: None.
+
+        Returns:
+            :obj:`float`
+
+        """
+        if retry_after:
+            try:
+                delay = float(retry_after)
+            except ValueError:
+                try:
+                    delay = -tools.dt_sec_ago(obj=retry_after, exact=True)
+                except Exception:
+                    delay = None
+
+            if delay is not None:
+                return min(max(delay, 0), self._RETRY_BACKOFF_MAX)
+
+        backoff = self._RETRY_BACKOFF * (2 ** (attempt - 1))
+        return random.uniform(0, min(backoff, self._RETRY_BACKOFF_MAX))
+
+    def _add_history(self, response):
+        """Add a response, or its metadata, to :attr:`_HISTORY`.
+
+        Args:
+            response (:obj:`requests.Response`):
+                Response to add.
+
+        """
+        with self._LOCK:
+            self._HISTORY_SEEN += 1
+            skip = (self._HISTORY_SEEN - 1) % self._HISTORY_SAMPLE
+
+        if skip:
+            return
+
+        if not self._HISTORY_META:
+            self._HISTORY.append(response)
+            return
+
+        self._HISTORY.append(
+            {
+                "url": format(response.url),
+                "method": response.request.method,
+                "status_code": response.status_code,
+                "elapsed": response.elapsed.total_seconds(),
+                "size": response.size,
+                "size_wire": response.size_wire,
+            }
+        )
+
     def __str__(self):
         """Show object info.
 
@@ -366,6 +814,142 @@ class Http(object):
         )
 
 
+class HttpAdapter(requests.adapters.HTTPAdapter):
+    """Transport adapter with configurable connection pools and TCP keep-alive.
+
+    Notes:
+        An adapter can be mounted on more than one :obj:`requests.Session` to
+        share its connection pools, using the http_adapter argument of
+        :obj:`Http`. The connection pools are only closed once every session
+        it was mounted on with :meth:`mount` has been closed.
+    """
+
+    PREFIXES = ["https://", "http://"]
+    """:obj:`list` of :obj:`str`: URL prefixes to mount the adapter on."""
+
+    def __init__(
+        self,
+        pool_connections=constants.POOL_CONNECTIONS,
+        pool_maxsize=constants.POOL_MAXSIZE,
+        pool_block=False,
+        tcp_keepalive=False,
+        # fmt: off
+        **kwargs
+        # fmt: on
+    ):
+        """Pass.
+
+        Args:
+            pool_connections (:obj:`int`, optional):
+                Number of connection pools (one per host) to cache.
+
+                Defaults to: :data:`constants.POOL_CONNECTIONS`.
+            pool_maxsize (:obj:`int`, optional):
+                Most connections to keep open in each connection pool.
+
+                Defaults to: :data:`constants.POOL_MAXSIZE`.
+            pool_block (:obj:`bool`, optional):
+                Wait for a connection to be free when the pool is full.
+
+                Defaults to: False.
+            tcp_keepalive (:obj:`bool`, optional):
+                Enable TCP keep-alive probes on connections.
+
+                Defaults to: False.
+
+        """
+        self._TCP_KEEPALIVE = tcp_keepalive
+        """:obj:`bool`: Enable TCP keep-alive probes on connections."""
+
+        self._mounts = 0
+        """:obj:`int`: Number of session prefixes this adapter is mounted on."""
+
+        self._mounts_lock = threading.Lock()
+        """:obj:`threading.Lock`: Lock for :attr:`_mounts`."""
+
+        super(HttpAdapter, self).__init__(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            # fmt: off
+            **kwargs
+            # fmt: on
+        )
+
+    def __getstate__(self):
+        """Pass."""
+        state = super(HttpAdapter, self).__getstate__()
+        state["_TCP_KEEPALIVE"] = self._TCP_KEEPALIVE
+        return state
+
+    def __setstate__(self, state):
+        """Pass."""
+        self._mounts = 0
+        self._mounts_lock = threading.Lock()
+        super(HttpAdapter, self).__setstate__(state)
+
+    def mount(self, session):
+        """Mount this adapter on all of :attr:`PREFIXES` of a session.
+
+        Args:
+            session (:obj:`requests.Session`): session to mount this adapter on
+
+        """
+        with self._mounts_lock:
+            for prefix in self.PREFIXES:
+                session.mount(prefix, self)
+                self._mounts += 1
+
+    def close(self):
+        """Close the connection pools once no session is using them.
+
+        Notes:
+            :meth:`requests.Session.close` calls this once for each prefix the
+            adapter is mounted on, so each call releases one mount from
+            :meth:`mount`.
+        """
+        with self._mounts_lock:
+            self._mounts = max(self._mounts - 1, 0)
+            if self._mounts:
+                return
+
+        super(HttpAdapter, self).close()
+
+    @property
+    def socket_options(self):
+        """Get the socket options to use for new connections.
+
+        Returns:
+            :obj:`list` of :obj:`tuple`
+
+        """
+        options = list(requests.urllib3.connection.HTTPConnection.default_socket_options)
+
+        if self._TCP_KEEPALIVE:
+            options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+
+            tcp_options = [
+                ("TCP_KEEPIDLE", constants.TCP_KEEPALIVE_IDLE),
+                ("TCP_KEEPINTVL", constants.TCP_KEEPALIVE_INTERVAL),
+                ("TCP_KEEPCNT", constants.TCP_KEEPALIVE_COUNT),
+            ]
+            for name, value in tcp_options:
+                if hasattr(socket, name):
+                    options.append((socket.IPPROTO_TCP, getattr(socket, name), value))
+
+        return options
+
+    def init_poolmanager(self, *args, **kwargs):
+        """Pass."""
+        kwargs.setdefault("socket_options", self.socket_options)
+        return super(HttpAdapter, self).init_poolmanager(*args, **kwargs)
+
+    def proxy_manager_for(self, *args, **kwargs):
+        """Pass."""
+        kwargs.setdefault("socket_options", self.socket_options)
+        return super(HttpAdapter, self).proxy_manager_for(*args, **kwargs)
+
+
 class ParserUrl(object):
     """Parse a URL and ensure it has the neccessary bits."""
 
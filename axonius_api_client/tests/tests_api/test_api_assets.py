@@ -120,6 +120,23 @@ class TestBoth(Base):
         data = apiobj.count()
         assert isinstance(data, tools.INT)
 
+    def test_count_cache(self, apiobj):
+        """Pass."""
+        apiobj.result_cache.clear()
+        data = apiobj.count(cache=True)
+        hits = apiobj.result_cache.stats["hits"]
+        assert apiobj.count(cache=True) == data
+        assert apiobj.result_cache.stats["hits"] == hits + 1
+
+    def test_get_cache(self, apiobj):
+        """Pass."""
+        apiobj.result_cache.clear()
+        data = apiobj.get(max_rows=2, page_size=1, cache=True)
+        data[0]["badwolf"] = True
+        hits = apiobj.result_cache.stats["hits"]
+        assert apiobj.get(max_rows=2, page_size=1, cache=True) != data
+        assert apiobj.result_cache.stats["hits"] == hits + 2
+
     def test_get(self, apiobj):
         """Pass."""
         data = apiobj.get(generator=False, max_rows=1)
@@ -136,12 +153,101 @@ class TestBoth(Base):
         assert isinstance(data2, tools.LIST)
         assert len(data2) == 1
 
+    def test_get_dataframe(self, apiobj):
+        """Pass."""
+        pytest.importorskip("pandas")
+        rows = apiobj.get(max_rows=3, page_size=2)
+        df = apiobj.get_dataframe(max_rows=3, page_size=2)
+        assert len(df) == 3
+        assert df["internal_axon_id"].tolist() == [x["internal_axon_id"] for x in rows]
+        assert list(df.columns)[1:] == apiobj._default_fields
+
     def test_get_maxpages(self, apiobj):
         """Pass."""
         data = apiobj.get(max_rows=22, max_pages=1)
         assert isinstance(data, tools.LIST)
         assert len(data) == 22
 
+    def test_get_workers(self, apiobj):
+        """Pass."""
+        data = apiobj.get(max_rows=30, page_size=7)
+        data_workers = apiobj.get(max_rows=30, page_size=7, workers=3)
+        assert isinstance(data_workers, tools.LIST)
+        assert len(data_workers) == 30
+        assert [x["internal_axon_id"] for x in data_workers] == [
+            x["internal_axon_id"] for x in data
+        ]
+
+    def test_get_workers_maxpages(self, apiobj):
+        """Pass."""
+        data = apiobj.get(max_pages=2, page_size=5, workers=4)
+        assert isinstance(data, tools.LIST)
+        assert len(data) == 10
+
+    def test_get_prefetch(self, apiobj):
+        """Pass."""
+        data = apiobj.get(max_rows=30, page_size=7)
+        data_prefetch = apiobj.get(max_rows=30, page_size=7, prefetch=2)
+        assert isinstance(data_prefetch, tools.LIST)
+        assert len(data_prefetch) == 30
+        assert [x["internal_axon_id"] for x in data_prefetch] == [
+            x["internal_axon_id"] for x in data
+        ]
+
+    def test_get_page_adaptive(self, apiobj):
+        """Pass."""
+        data = apiobj.get(max_rows=30, page_size=7)
+        data_adaptive = apiobj.get(
+            max_rows=30, page_size=7, page_adaptive=True, page_target=60
+        )
+        assert isinstance(data_adaptive, tools.LIST)
+        assert len(data_adaptive) == 30
+        assert [x["internal_axon_id"] for x in data_adaptive] == [
+            x["internal_axon_id"] for x in data
+        ]
+
+    def test_get_checkpoint(self, apiobj, tmp_path):
+        """Pass."""
+        path = tmp_path / "checkpoint.json"
+        data = apiobj.get(max_rows=30, page_size=7)
+
+        checkpoint = axonapi.api.assets.Checkpoint(path=path)
+        checkpoint.start(query=None, fields=apiobj.fields.validate())
+        checkpoint.skip = 14
+        checkpoint.save()
+
+        data_resumed = apiobj.get(max_rows=16, page_size=7, checkpoint=path)
+        assert [x["internal_axon_id"] for x in data_resumed] == [
+            x["internal_axon_id"] for x in data[14:]
+        ]
+        # stopped by max_rows, so the checkpoint is kept to resume from
+        assert path.is_file()
+        assert axonapi.api.assets.Checkpoint(path=path).skip == 30
+
+    def test_get_checkpoint_mismatch(self, apiobj, tmp_path):
+        """Pass."""
+        path = tmp_path / "checkpoint.json"
+
+        checkpoint = axonapi.api.assets.Checkpoint(path=path)
+        checkpoint.start(query="badwolf", fields=["badwolf"])
+        checkpoint.skip = 14
+        checkpoint.save()
+
+        with pytest.raises(exceptions.ApiError):
+            apiobj.get(max_rows=30, page_size=7, checkpoint=checkpoint)
+
+    def test_adapt_page_size(self, apiobj):
+        """Pass."""
+        grow = apiobj._adapt_page_size(
+            page_size=100, page_took=1, page_bytes=1000, page_target=10
+        )
+        assert grow == 200
+        shrink = apiobj._adapt_page_size(
+            page_size=100, page_took=100, page_bytes=1000, page_target=10
+        )
+        assert shrink == 50
+        assert apiobj._shrink_page_size(page_size=100, exc=None) == 50
+
     def test_get_id(self, apiobj):
         """Pass."""
         asset = self.get_single_asset(apiobj=apiobj, fields=apiobj._default_fields)
@@ -163,6 +269,19 @@ class TestBoth(Base):
         data = apiobj.count_by_saved_query(name=sq_name)
         assert isinstance(data, tools.INT)
 
+    def test_counts(self, apiobj):
+        """Pass."""
+        sqs = apiobj.saved_query.get()
+        sq_name = sqs[0]["name"]
+        data = apiobj.counts(queries={"all": None}, saved_queries=[sq_name], workers=2)
+        assert list(data) == ["all", sq_name]
+        assert data["all"]["count"] == apiobj.count()
+        assert data[sq_name]["count"] == apiobj.count_by_saved_query(name=sq_name)
+        assert isinstance(data[sq_name]["took"], float)
+
+        with pytest.raises(exceptions.ValueNotFound):
+            apiobj.counts(saved_queries=["badwolf_8675309"])
+
     def test_get_by_saved_query(self, apiobj):
         """Pass."""
         sqs = apiobj.saved_query.get()
@@ -236,6 +355,38 @@ class TestBoth(Base):
         assert isinstance(found, tools.LIST)
         assert len(found) == count - 1
 
+    def test_get_by_values(self, apiobj):
+        """Pass."""
+        rows = apiobj.get(fields=apiobj._default_fields, max_rows=5)
+        field = apiobj.TEST_DATA["single_field"]["exp"]
+        values = [tools.listify(x[field])[0] for x in rows if x.get(field)]
+        values.append("BaDWoLf_8675309")
+
+        result = apiobj.get_by_values(
+            values=values, field=field, chunk_size=2, workers=2
+        )
+        assert isinstance(result, axonapi.api.assets.BatchResult)
+        assert not result.errors
+        assert result.missing == ["BaDWoLf_8675309"]
+        assert sorted(result.found) == sorted(values[:-1])
+
+        ids = [x["internal_axon_id"] for x in result.rows]
+        assert len(ids) == len(set(ids))
+
+    def test_get_by_ids(self, apiobj):
+        """Pass."""
+        rows = apiobj.get(max_rows=5)
+        ids = [x["internal_axon_id"] for x in rows] + ["badwolf"]
+
+        result = apiobj.get_by_ids(ids=ids, workers=2, ordered=True)
+        assert [x["internal_axon_id"] for x in result.rows] == ids[:-1]
+        assert result.missing == ["badwolf"]
+        assert not result.errors
+
+        result = apiobj.get_by_ids(ids=ids, fields=apiobj._default_fields)
+        assert sorted(x["internal_axon_id"] for x in result.rows) == sorted(ids[:-1])
+        assert result.missing == ["badwolf"]
+
     def test_get_by_field_value_match_error(self, apiobj):
         """Pass."""
         field = apiobj.TEST_DATA["single_field"]["exp"]
@@ -323,6 +474,26 @@ class TestDevices(Single):
         found_value = tools.listify(obj=found[0][findfield])[0]
         assert found_value == tools.listify(obj=asset[findfield], dictkeys=False)[0]
 
+    def test_get_by_subnet_list(self, apiobj):
+        """Pass."""
+        specfield = "specific_data.data.network_interfaces.subnets"
+        findfield = "specific_data.data.network_interfaces.ips"
+        withfields = [findfield, specfield]
+        asset = self.get_single_asset(
+            apiobj=apiobj, with_fields=withfields, fields=withfields
+        )
+        value = tools.listify(obj=asset[specfield])[0]
+
+        found = apiobj.get_by_subnet(value=value, fields=findfield)
+        found_list = apiobj.get_by_subnet(
+            value=[value, value, "192.0.2.0/24"], fields=findfield, chunk_size=1
+        )
+
+        ids = [x["internal_axon_id"] for x in found]
+        ids_list = [x["internal_axon_id"] for x in found_list]
+        assert len(ids_list) == len(set(ids_list))
+        assert set(ids).issubset(ids_list)
+
     def test_get_by_subnet_not(self, apiobj):
         """Pass."""
         specfield = "specific_data.data.network_interfaces.subnets"
@@ -389,6 +560,69 @@ class TestFields(Base):
         assert isinstance(fields, dict)
         assert isinstance(fields["generic"], dict)
 
+    def test_get_cache(self, apiobj):
+        """Pass."""
+        fields = apiobj.fields.get(refresh=True)
+        misses = apiobj.fields.cache.stats["misses"]
+        hits = apiobj.fields.cache.stats["hits"]
+
+        assert apiobj.fields.get() is fields
+        assert apiobj.fields.cache.stats["hits"] == hits + 1
+
+        assert apiobj.fields.get(refresh=True) is not fields
+        assert apiobj.fields.cache.stats["misses"] == misses + 1
+
+    def test_get_disk_cache(self, apiobj, tmp_path):
+        """Pass."""
+        disk_cache = axonapi.cache.DiskCache(path=tmp_path)
+        orig_disk_cache = apiobj.fields.disk_cache
+        apiobj.fields.disk_cache = disk_cache
+
+        try:
+            fields = apiobj.fields.get(refresh=True)
+            apiobj.fields.cache.clear()
+            assert apiobj.fields.get() == fields
+            assert disk_cache.stats == {"hits": 1, "misses": 0}
+        finally:
+            apiobj.fields.disk_cache = orig_disk_cache
+            apiobj.fields.cache.clear()
+
+    def test_get_disk_cache_no_build(self, apiobj, tmp_path, monkeypatch):
+        """Pass."""
+        disk_cache = axonapi.cache.DiskCache(path=tmp_path)
+        orig_disk_cache = apiobj.fields.disk_cache
+        apiobj.fields.disk_cache = disk_cache
+
+        def get_build():
+            return None
+
+        monkeypatch.setattr(apiobj.fields, "_get_build", get_build)
+
+        try:
+            fields = apiobj.fields.get(refresh=True)
+            assert isinstance(fields["generic"], dict)
+            assert disk_cache.stats == {"hits": 0, "misses": 0}
+        finally:
+            apiobj.fields.disk_cache = orig_disk_cache
+            apiobj.fields.cache.clear()
+
+    def test_get_index(self, apiobj):
+        """Pass."""
+        index = apiobj.fields.get_index(all_fields=apiobj.ALL_FIELDS)
+        assert apiobj.fields.get_index(all_fields=apiobj.ALL_FIELDS) is index
+        assert isinstance(index, axonapi.api.assets.FieldIndex)
+        assert index.find_adapter(adapter="GENERAL") == "generic"
+        assert index.find_adapter(adapter="badwolf") is None
+        assert index.find_field(adapter="generic", field="*") == "specific_data"
+        assert index.find_field(adapter="generic", field="badwolf") is None
+        assert index.get_field(name="badwolf") is None
+
+        for adapter, adapter_fields in apiobj.ALL_FIELDS.items():
+            for field_name, field in adapter_fields.items():
+                assert index.has_name(name=field["name"])
+                assert index.get_field(name=field["name"])["name"] == field["name"]
+                assert index.find_field(adapter=adapter, field=field_name)
+
     def test_find_adapter(self, apiobj):
         """Pass."""
         for info in apiobj.TEST_DATA["adapters"]:
@@ -451,6 +685,28 @@ class TestFields(Base):
         assert all([single in x for x in found])
         assert all(["specific_data.data" in x for x in found])
 
+    def test_find_re_cache(self, apiobj):
+        """Pass."""
+        single = apiobj.TEST_DATA["single_field"]["search"]
+        index = apiobj.fields.get_index(all_fields=apiobj.ALL_FIELDS)
+
+        found = apiobj.fields.find_regex(
+            field="generic:^" + single, all_fields=apiobj.ALL_FIELDS
+        )
+        assert found
+        hits = index.regex_cache.stats["hits"]
+
+        found_re = apiobj.fields.find_regex(
+            field="generic:^(" + single + ")", all_fields=apiobj.ALL_FIELDS
+        )
+        assert found_re == found
+
+        found_cache = apiobj.fields.find_regex(
+            field="generic:^" + single, all_fields=apiobj.ALL_FIELDS
+        )
+        assert found_cache == found
+        assert index.regex_cache.stats["hits"] == hits + 1
+
     def test_find(self, apiobj):
         """Pass."""
         for info in apiobj.TEST_DATA["fields"]:
@@ -1140,6 +1396,20 @@ class TestParsedFields(Base):
             for fname, finfo in afields.items():
                 self.val_field(fname, finfo, aname)
 
+    def test_fields_lazy(self, apiobj):
+        """Pass."""
+        raw = apiobj.fields._get()
+        parser = axonapi.api.assets.ParserFields(raw=raw, parent=apiobj)
+        fields = parser.parse()
+        assert fields.parsed == []
+        assert "generic" in fields
+
+        assert isinstance(fields["generic"], dict)
+        assert fields.parsed == ["generic"]
+
+        assert tools.json_load(tools.json_dump(fields)) == fields
+        assert sorted(fields.parsed) == sorted(fields)
+
     def val_field(self, fname, finfo, aname):
         """Pass."""
         assert isinstance(finfo, dict)
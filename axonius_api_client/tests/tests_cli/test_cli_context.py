@@ -90,6 +90,72 @@ class TestCliContext(object):
         assert stderr[0].startswith("** Exported file")
         assert "created" in stderr[0]
 
+    def test_export_stream_stdout(self, capsys):
+        """Pass."""
+        obj = cli.context.Context()
+        count = obj.export_stream(
+            rows=iter([{"a": 1}, {"b": 2}]), formatter=cli.serial.stream_ndjson
+        )
+        assert count == 2
+
+        captured = capsys.readouterr()
+
+        stderr = captured.err.splitlines()
+        assert not stderr
+
+        stdout = captured.out.splitlines()
+        assert stdout == ['{"a": 1}', '{"b": 2}']
+
+    def test_export_stream_file(self, capsys):
+        """Pass."""
+        runner = CliRunner(mix_stderr=False)
+        obj = cli.context.Context()
+
+        with runner.isolated_filesystem():
+            count = obj.export_stream(
+                rows=iter([{"a": 1}]),
+                formatter=cli.serial.stream_json,
+                export_file="badwolf.test",
+            )
+            assert count == 1
+
+            with open("badwolf.test") as fh:
+                assert fh.read() == '[\n  {\n    "a": 1\n  }\n]\n'
+
+        captured = capsys.readouterr()
+
+        stderr = captured.err.splitlines()
+        assert len(stderr) == 1
+
+        stdout = captured.out.splitlines()
+        assert not stdout
+
+        assert stderr[0].startswith("** Exported 1 rows to file")
+        assert "created" in stderr[0]
+
+    def test_export_stream_file_error(self, capsys, tmp_path):
+        """Pass."""
+        obj = cli.context.Context()
+
+        def rows():
+            yield {"a": 1}
+            raise utils.MockError("badwolf")
+
+        with pytest.raises(SystemExit):
+            obj.export_stream(
+                rows=rows(),
+                formatter=cli.serial.stream_json,
+                export_file="badwolf.test",
+                export_path=format(tmp_path),
+            )
+
+        assert not list(tmp_path.iterdir())
+
+        captured = capsys.readouterr()
+
+        stderr = captured.err.splitlines()
+        assert stderr[-1] == "badwolf"
+
     def test_export_file_exists(self, capsys):
         """Pass."""
         runner = CliRunner(mix_stderr=False)
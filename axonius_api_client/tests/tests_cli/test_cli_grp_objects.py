@@ -442,6 +442,38 @@ class TestCmdGet(object):
         csv_cols1 = ["internal_axon_id"]
         utils.check_csv_cols(stdout1, csv_cols1)
 
+    def test_parquet(self, request, monkeypatch, cmd):
+        """Pass."""
+        parquet = pytest.importorskip("pyarrow.parquet")
+        runner = utils.load_clirunner(request, monkeypatch)
+        args1 = [
+            cmd,
+            "get",
+            "--query",
+            "(adapters > size(0))",
+            "--export-format",
+            "parquet",
+            "--export-file",
+            "badwolf.parquet",
+            "--max-rows",
+            "1",
+        ]
+
+        with runner.isolated_filesystem():
+            result1 = runner.invoke(cli=cli.cli, args=args1)
+            table1 = parquet.read_table("badwolf.parquet")
+
+        exit_code1 = result1.exit_code
+        stdout1 = result1.stdout
+        stderr1 = result1.stderr
+
+        assert not stdout1
+        assert stderr1
+        assert exit_code1 == 0
+
+        assert table1.num_rows == 1
+        assert "internal_axon_id" in table1.column_names
+
 
 class TestCmdGetBySubnet(object):
     """Pass."""
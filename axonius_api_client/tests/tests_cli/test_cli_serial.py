@@ -19,6 +19,71 @@ def to_json(ctx, raw_data, **kwargs):
     return tools.json_dump(obj=raw_data, **kwargs)
 
 
+class FakeIndex(object):
+    """Pass."""
+
+    def __init__(self, fields):
+        """Pass."""
+        self.fields = fields
+
+    def get_field(self, name):
+        """Pass."""
+        return self.fields.get(name, None)
+
+
+FLATTEN_FIELDS = {
+    "hostname": {"name": "hostname", "type": "array", "items": {"type": "string"}},
+    "os": {"name": "os", "type": "string"},
+    "nics": {
+        "name": "nics",
+        "type": "array",
+        "items": {
+            "type": "array",
+            "items": [
+                {"name": "mac", "type": "string"},
+                {"name": "ips", "type": "array", "items": {"type": "string"}},
+            ],
+        },
+    },
+    "nested": {
+        "name": "nested",
+        "type": "array",
+        "items": {
+            "type": "array",
+            "items": [
+                {"name": "x", "type": "array", "items": {"type": "array", "items": []}}
+            ],
+        },
+    },
+    "all": {"name": "all", "type": "array"},
+}
+
+FLATTEN_ROWS = [
+    {
+        "hostname": ["a", "b"],
+        "os": "linux",
+        "nics": [{"mac": "m1", "ips": ["1", "2"]}, {"ips": ["3"], "other": None}],
+        "nested": [{"x": [{"y": "z"}]}],
+        "all": [{"a": {"b": "c"}}],
+        "unknown": 1,
+    },
+    {"hostname": [], "os": None, "nics": [], "nested": [], "all": None},
+    {"hostname": "c", "nics": None, "os": {"a": "b"}, "unknown": [{"a": "b"}]},
+    {"hostname": ["x" * 40000], "nics": [{"mac": ["y" * 40000]}]},
+]
+
+FLATTEN_ROWS_UNEXPECTED = [
+    {"nics": [{"mac": {"a": "b"}, "ips": ["1"]}]},
+    {"nics": [{"mac": "m1", "ips": [{"a": "b"}]}]},
+    {"nics": [{"mac": "m1"}, "m2"]},
+    {"nics": {"mac": "m1"}},
+    {"hostname": [{"a": "b"}, {"a": "c"}]},
+    {"hostname": ["a", ["b"]]},
+    {"os": [{"a": "b"}]},
+    {"os": ("a", "b")},
+]
+
+
 class TestCliJoins(object):
     """Pass."""
 
@@ -55,6 +120,41 @@ class TestCliToJson(object):
         assert x == "[]"
 
 
+class TestCliToNdjson(object):
+    """Pass."""
+
+    def test_default(self):
+        """Pass."""
+        x = cli.serial.to_ndjson(ctx=None, raw_data=[{"a": 1}, {"b": [2]}])
+        assert x == '{"a": 1}\n{"b": [2]}'
+
+
+class TestCliStreamJson(object):
+    """Pass."""
+
+    @pytest.mark.parametrize(
+        "rows", [[], [{}], [{"a": 1, "b": [1, 2]}, {"c": {"d": "e"}}]]
+    )
+    def test_default(self, rows):
+        """Pass."""
+        stream = tools.six.StringIO()
+        count = cli.serial.stream_json(ctx=None, rows=iter(rows), stream=stream)
+        assert count == len(rows)
+        assert stream.getvalue() == cli.serial.to_json(ctx=None, raw_data=rows) + "\n"
+
+
+class TestCliStreamNdjson(object):
+    """Pass."""
+
+    def test_default(self):
+        """Pass."""
+        rows = [{"a": 1}, {"b": [2]}]
+        stream = tools.six.StringIO()
+        count = cli.serial.stream_ndjson(ctx=None, rows=iter(rows), stream=stream)
+        assert count == 2
+        assert stream.getvalue() == '{"a": 1}\n{"b": [2]}\n'
+
+
 class TestCliJsonToRows(object):
     """Pass."""
 
@@ -225,6 +325,70 @@ class TestCliObjToCsv(object):
         assert x == exp
 
 
+class TestCliSpoolCsv(object):
+    """Pass."""
+
+    def test_default(self):
+        """Pass."""
+        rows = [{"x": "1"}, {"y": "2", "x": "3"}]
+        stream = tools.six.StringIO()
+        count = cli.serial.spool_csv(rows=iter(rows), stream=stream)
+        assert count == 2
+        assert stream.getvalue() == cli.serial.dictwriter(rows=rows)
+
+
+class TestCliStreamCsv(object):
+    """Pass."""
+
+    def test_default(self):
+        """Pass."""
+        ctx = utils.get_mockctx()
+        rows = [{"cnx": [{"id": "1"}]}, {"id": "2"}, {"cnx": {"id": "3"}}]
+        stream = tools.six.StringIO()
+        count = cli.serial.stream_csv(ctx=ctx, rows=iter(rows), stream=stream)
+        assert count == 3
+        assert stream.getvalue() == cli.serial.obj_to_csv(ctx=ctx, raw_data=rows)
+
+
+class TestCliRowFlattener(object):
+    """Pass."""
+
+    @pytest.mark.parametrize("index", [None, FakeIndex(fields=FLATTEN_FIELDS)])
+    def test_same_as_compress_row(self, index):
+        """Pass."""
+        flattener = cli.serial.RowFlattener(index=index, joiner="|")
+
+        for raw_row in FLATTEN_ROWS + FLATTEN_ROWS:
+            row = flattener.flatten(raw_row=raw_row)
+            exp = cli.serial.compress_row(raw_row=raw_row, joiner="|")
+            assert row == exp
+            assert list(row) == list(exp)
+
+    def test_unexpected_shapes(self):
+        """Pass."""
+        flattener = cli.serial.RowFlattener(index=FakeIndex(fields=FLATTEN_FIELDS))
+
+        for raw_row in FLATTEN_ROWS + FLATTEN_ROWS_UNEXPECTED:
+            row = flattener.flatten(raw_row=raw_row)
+            exp = cli.serial.compress_row(raw_row=raw_row)
+            assert row == exp
+            assert list(row) == list(exp)
+
+    def test_plans(self):
+        """Pass."""
+        flattener = cli.serial.RowFlattener(index=FakeIndex(fields=FLATTEN_FIELDS))
+        flattener.flatten(raw_row=FLATTEN_ROWS[0])
+        plans = {k: getattr(v, "func", v).__name__ for k, v in flattener._PLANS.items()}
+        assert plans == {
+            "hostname": "_flatten_simple",
+            "os": "_flatten_simple",
+            "nics": "_flatten_complex",
+            "nested": "_flatten_any",
+            "all": "_flatten_any",
+            "unknown": "_flatten_any",
+        }
+
+
 class TestCliObjToTable(object):
     """Pass."""
 
@@ -0,0 +1,270 @@
+# -*- coding: utf-8 -*-
+"""Test suite for axonius_api_client.aio."""
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import asyncio
+
+import pytest
+
+from axonius_api_client import exceptions, tools
+from axonius_api_client.api import assets
+
+from .. import utils
+
+httpx = pytest.importorskip("httpx")
+
+from axonius_api_client import aio  # noqa: E402
+
+BAD_CRED = "tardis"
+
+AS_IS = [
+    "count",
+    "get_by_hostname",
+    "get_by_ip",
+    "get_by_mac",
+    "get_by_mail",
+    "get_by_username",
+]
+
+
+def run(coro):
+    """Pass."""
+    return asyncio.new_event_loop().run_until_complete(coro)
+
+
+def get_client(request):
+    """Pass."""
+    return aio.AsyncConnect(
+        url=utils.get_url(request), certwarn=False, **utils.get_key_creds(request)
+    )
+
+
+class TestAsyncHttp(object):
+    """Pass."""
+
+    def test_unsupported(self):
+        """Pass."""
+        with pytest.raises(exceptions.HttpError) as exc:
+            aio.AsyncHttp(url="https://127.0.0.1:1", retries=2, compress=False)
+
+        assert "retries=2" in format(exc.value)
+        assert "compress" not in format(exc.value)
+
+
+class TestNotAsync(object):
+    """Pass."""
+
+    @pytest.mark.parametrize(
+        "cls,async_cls",
+        [(assets.Users, aio.AsyncUsers), (assets.Devices, aio.AsyncDevices)],
+    )
+    def test_methods(self, cls, async_cls):
+        """Make sure new methods of the sync classes are made async or NotAsync."""
+        mro = async_cls.__mro__[: async_cls.__mro__.index(cls)]
+
+        for name in dir(cls):
+            if name.startswith("_") or not callable(getattr(cls, name)):
+                continue
+
+            found = [vars(x)[name] for x in mro if name in vars(x)]
+            assert found or name in AS_IS, name
+
+    def test_raises(self):
+        """Pass."""
+        obj = object.__new__(aio.AsyncDevices)
+
+        with pytest.raises(exceptions.ApiError) as exc:
+            obj.get_by_subnet
+
+        assert "'get_by_subnet' is not available in AsyncDevices" in format(exc.value)
+
+
+class TestAsyncConnect(object):
+    """Pass."""
+
+    def test_not_started(self, request):
+        """Pass."""
+        c = get_client(request)
+
+        with pytest.raises(exceptions.ConnectError):
+            c.devices
+
+    def test_not_async(self, request):
+        """Pass."""
+        c = get_client(request)
+
+        with pytest.raises(exceptions.ApiError):
+            c.adapters
+
+    def test_connect_error(self):
+        """Pass."""
+
+        async def go():
+            c = aio.AsyncConnect(
+                url="https://127.0.0.1:3919", key=BAD_CRED, secret=BAD_CRED
+            )
+            try:
+                await c.start()
+            finally:
+                await c.close()
+
+        with pytest.raises(exceptions.ConnectError) as exc:
+            run(go())
+
+        assert isinstance(exc.value.exc, httpx.TransportError)
+
+    def test_invalid_creds(self, request):
+        """Pass."""
+
+        async def go():
+            c = aio.AsyncConnect(
+                url=utils.get_url(request), key=BAD_CRED, secret=BAD_CRED
+            )
+            try:
+                await c.start()
+            finally:
+                await c.close()
+
+        with pytest.raises(exceptions.ConnectError) as exc:
+            run(go())
+
+        assert isinstance(exc.value.exc, exceptions.InvalidCredentials)
+
+
+@pytest.mark.parametrize("apiname", ["users", "devices"])
+class TestAsyncAssets(object):
+    """Pass."""
+
+    def test_count_get(self, request, apiname):
+        """Pass."""
+
+        async def go():
+            async with get_client(request) as c:
+                apiobj = getattr(c, apiname)
+                count = await apiobj.count()
+                rows = await apiobj.get(max_rows=5)
+                rows_workers = await apiobj.get(max_rows=5, page_size=2, workers=2)
+                return count, rows, rows_workers
+
+        count, rows, rows_workers = run(go())
+        assert isinstance(count, tools.INT)
+        assert isinstance(rows, tools.LIST)
+        assert len(rows) == 5
+        assert [x["internal_axon_id"] for x in rows] == [
+            x["internal_axon_id"] for x in rows_workers
+        ]
+
+    def test_get_generator(self, request, apiname):
+        """Pass."""
+
+        async def go():
+            async with get_client(request) as c:
+                apiobj = getattr(c, apiname)
+                return [x async for x in apiobj.get_generator(max_rows=3)]
+
+        rows = run(go())
+        assert len(rows) == 3
+
+    def test_get_by_value_concurrent(self, request, apiname):
+        """Pass."""
+
+        async def go():
+            async with get_client(request) as c:
+                apiobj = getattr(c, apiname)
+                rows = await apiobj.get(max_rows=3)
+                ids = [x["internal_axon_id"] for x in rows]
+                found = await asyncio.gather(
+                    *[
+                        apiobj.get_by_value(value=x, field="internal_axon_id")
+                        for x in ids
+                    ]
+                )
+                return ids, found
+
+        ids, found = run(go())
+        assert [x["internal_axon_id"] for x in found] == ids
+
+    def test_fields_get_concurrent(self, request, apiname):
+        """Pass."""
+
+        async def go():
+            async with get_client(request) as c:
+                apiobj = getattr(c, apiname)
+                fetched = []
+                fetch = apiobj.fields._get
+
+                def counted():
+                    fetched.append(True)
+                    return fetch()
+
+                apiobj.fields._get = counted
+                found = await asyncio.gather(*[apiobj.fields.get() for _ in range(5)])
+                return fetched, found
+
+        fetched, found = run(go())
+        assert len(fetched) == 1
+        assert all(x is found[0] for x in found)
+
+    def test_labels_saved_query(self, request, apiname):
+        """Pass."""
+
+        async def go():
+            async with get_client(request) as c:
+                apiobj = getattr(c, apiname)
+                labels = await apiobj.labels.get()
+                sqs = await apiobj.saved_query.get()
+                return labels, sqs
+
+        labels, sqs = run(go())
+        assert isinstance(labels, tools.LIST)
+        assert isinstance(sqs, tools.LIST)
+
+    @pytest.mark.parametrize(
+        "method,kwargs",
+        [
+            ("get_by_values", {"values": ["x"], "field": "internal_axon_id"}),
+            ("get_by_values_generator", {"values": ["x"], "field": "internal_axon_id"}),
+            ("get_by_ids", {"ids": ["x"]}),
+            ("get_by_ids_generator", {"ids": ["x"]}),
+            ("counts", {"queries": ["x"]}),
+            ("get_dataframe", {"fields": ["internal_axon_id"]}),
+            ("adapters", {}),
+        ],
+    )
+    def test_not_async(self, request, apiname, method, kwargs):
+        """Pass."""
+
+        async def go():
+            async with get_client(request) as c:
+                apiobj = getattr(c, apiname)
+                getattr(apiobj, method)(**kwargs)
+
+        with pytest.raises(exceptions.ApiError) as exc:
+            run(go())
+
+        assert method in format(exc.value)
+
+    def test_fields_required(self, request, apiname):
+        """Pass."""
+
+        async def go():
+            async with get_client(request) as c:
+                apiobj = getattr(c, apiname)
+                apiobj.fields.find(field="generic:id")
+
+        with pytest.raises(exceptions.ApiError):
+            run(go())
+
+
+class TestAsyncDevices(object):
+    """Pass."""
+
+    def test_get_by_subnet(self, request):
+        """Pass."""
+
+        async def go():
+            async with get_client(request) as c:
+                c.devices.get_by_subnet(value="10.0.0.0/8")
+
+        with pytest.raises(exceptions.ApiError):
+            run(go())
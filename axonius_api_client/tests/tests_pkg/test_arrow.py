@@ -0,0 +1,209 @@
+# -*- coding: utf-8 -*-
+"""Test suite for axonius_api_client.arrow."""
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import datetime
+
+import pytest
+
+from axonius_api_client import exceptions
+from axonius_api_client.api import assets
+
+pyarrow = pytest.importorskip("pyarrow")
+
+from axonius_api_client import arrow  # noqa: E402
+
+FIELDS = {
+    "generic": {
+        "id": {"name": "internal_axon_id", "type": "string"},
+        "count": {"name": "adapter_list_length", "type": "integer"},
+        "hostname": {
+            "name": "specific_data.data.hostname",
+            "type": "array",
+            "items": {"type": "string"},
+        },
+        "last_seen": {
+            "name": "specific_data.data.last_seen",
+            "type": "string",
+            "format": "date-time",
+        },
+        "nics": {
+            "name": "specific_data.data.nics",
+            "type": "array",
+            "items": {
+                "type": "array",
+                "items": [
+                    {"name": "mac", "type": "string"},
+                    {"name": "ips", "type": "array", "items": {"type": "string"}},
+                ],
+            },
+        },
+        "all": {"name": "specific_data", "type": "array"},
+    }
+}
+
+
+class FakeFields(object):
+    """Pass."""
+
+    def validate(self, fields=None, **kwargs):
+        """Pass."""
+        return fields
+
+    def get_index(self, **kwargs):
+        """Pass."""
+        return assets.FieldIndex(all_fields=FIELDS, generic_alts=[], all_alts=[])
+
+
+class FakeApi(object):
+    """Pass."""
+
+    def __init__(self, rows):
+        """Pass."""
+        self.fields = FakeFields()
+        self.rows = rows
+
+    def get_generator(self, **kwargs):
+        """Pass."""
+        for row in self.rows:
+            if isinstance(row, Exception):
+                raise row
+            yield row
+
+
+def get_schema(fields=None):
+    """Pass."""
+    index = assets.FieldIndex(all_fields=FIELDS, generic_alts=[], all_alts=[])
+    fields = fields or [x["name"] for x in FIELDS["generic"].values()]
+    return arrow.ArrowSchema(fields=fields + ["badwolf"], index=index)
+
+
+class TestArrowSchema(object):
+    """Pass."""
+
+    def test_types(self):
+        """Pass."""
+        schema = get_schema()
+        types = {x.name: x.type for x in schema.schema}
+        nics = pyarrow.struct(
+            [
+                pyarrow.field("mac", pyarrow.string()),
+                pyarrow.field("ips", pyarrow.list_(pyarrow.string())),
+            ]
+        )
+        assert types == {
+            "internal_axon_id": pyarrow.string(),
+            "adapter_list_length": pyarrow.int64(),
+            "specific_data.data.hostname": pyarrow.list_(pyarrow.string()),
+            "specific_data.data.last_seen": pyarrow.list_(
+                pyarrow.timestamp("us", tz="UTC")
+            ),
+            "specific_data.data.nics": pyarrow.list_(nics),
+            "specific_data": pyarrow.string(),
+            "badwolf": pyarrow.string(),
+        }
+
+    def test_batch(self):
+        """Pass."""
+        schema = get_schema()
+        rows = [
+            {
+                "internal_axon_id": "x",
+                "adapter_list_length": 2,
+                "specific_data.data.hostname": ["a", ["b", "c"]],
+                "specific_data.data.last_seen": "2020-01-02 03:04:05",
+                "specific_data.data.nics": [
+                    {"mac": "m", "ips": ["1", "2"], "other": "o"},
+                    {"ips": "3"},
+                ],
+                "specific_data": [{"a": 1}],
+                "badwolf": "bw",
+                "extra": "e",
+            },
+            {"internal_axon_id": "y", "adapter_list_length": [1], "badwolf": [1]},
+        ]
+        batch = schema.batch(rows=rows)
+        assert batch.num_rows == 2
+        assert batch.schema == schema.schema
+
+        data = batch.to_pydict()
+        assert data["internal_axon_id"] == ["x", "y"]
+        assert data["adapter_list_length"] == [2, 1]
+        assert data["specific_data.data.hostname"] == [["a", "b", "c"], None]
+        seen = data["specific_data.data.last_seen"][0][0]
+        assert seen.replace(tzinfo=None) == datetime.datetime(2020, 1, 2, 3, 4, 5)
+        assert seen.utcoffset() == datetime.timedelta(0)
+        assert data["specific_data.data.nics"] == [
+            [{"mac": "m", "ips": ["1", "2"]}, {"mac": None, "ips": ["3"]}],
+            None,
+        ]
+        assert data["specific_data"] == ['[{"a": 1}]', None]
+        assert data["badwolf"] == ["bw", "[1]"]
+        assert "extra" not in data
+
+    def test_batch_many_values(self):
+        """Pass."""
+        schema = get_schema()
+        rows = [
+            {"internal_axon_id": ["x", "y"], "adapter_list_length": [None, [2, 3]]},
+            {"internal_axon_id": [], "adapter_list_length": [None]},
+        ]
+        data = schema.batch(rows=rows).to_pydict()
+        assert data["internal_axon_id"] == ["x", None]
+        assert data["adapter_list_length"] == [2, None]
+
+    @pytest.mark.parametrize("file_format", arrow.FILE_FORMATS)
+    def test_export(self, tmp_path, file_format):
+        """Pass."""
+        pytest.importorskip("pyarrow.parquet")
+        path = tmp_path / "x.out"
+        rows = [{"internal_axon_id": "x"}, {"internal_axon_id": "y"}]
+        count = arrow.export(
+            apiobj=FakeApi(rows=rows),
+            path=path,
+            file_format=file_format,
+            fields=["internal_axon_id"],
+            batch_size=1,
+        )
+        assert count == 2
+        assert [x.name for x in tmp_path.iterdir()] == ["x.out"]
+
+        if file_format == "arrow":
+            table = pyarrow.ipc.open_file(format(path)).read_all()
+        else:
+            table = arrow.parquet.read_table(format(path))
+        assert table.to_pydict()["internal_axon_id"] == ["x", "y"]
+
+    @pytest.mark.parametrize("file_format", arrow.FILE_FORMATS)
+    def test_export_error(self, tmp_path, file_format):
+        """Pass."""
+        pytest.importorskip("pyarrow.parquet")
+        path = tmp_path / "x.out"
+        path.write_text("x")
+        rows = [{"internal_axon_id": "x"}, exceptions.ApiError("badwolf")]
+
+        with pytest.raises(exceptions.ApiError):
+            arrow.export(
+                apiobj=FakeApi(rows=rows),
+                path=path,
+                file_format=file_format,
+                fields=["internal_axon_id"],
+                batch_size=1,
+                overwrite=True,
+            )
+
+        assert [x.name for x in tmp_path.iterdir()] == ["x.out"]
+        assert path.read_text() == "x"
+
+    def test_export_invalid_format(self, tmp_path):
+        """Pass."""
+        with pytest.raises(exceptions.ToolsError):
+            arrow.export(apiobj=None, path=tmp_path / "x.csv", file_format="csv")
+
+    def test_export_exists(self, tmp_path):
+        """Pass."""
+        path = tmp_path / "x.arrow"
+        path.write_text("x")
+
+        with pytest.raises(exceptions.ToolsError):
+            arrow.export(apiobj=None, path=path, file_format="arrow")
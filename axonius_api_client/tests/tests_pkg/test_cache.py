@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+"""Test suite for axonius_api_client.cache."""
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import threading
+import time
+
+from axonius_api_client import cache
+
+
+class TestCache(object):
+    """Test axonius_api_client.cache.Cache."""
+
+    def test_get_set(self):
+        """Pass."""
+        obj = cache.Cache()
+        assert obj.get(key="a") is None
+        obj.set(key="a", value=1)
+        assert obj.get(key="a") == 1
+        assert "a" in obj
+        assert obj.stats == {"hits": 1, "misses": 1, "evictions": 0, "size": 1}
+
+    def test_ttl(self):
+        """Pass."""
+        obj = cache.Cache(ttl=0.05)
+        obj.set(key="a", value=1)
+        assert obj.get(key="a") == 1
+        time.sleep(0.1)
+        assert obj.get(key="a", default=2) == 2
+        assert len(obj) == 0
+
+    def test_max_size(self):
+        """Pass."""
+        obj = cache.Cache(max_size=2)
+        obj.set(key="a", value=1)
+        obj.set(key="b", value=2)
+        obj.get(key="a")
+        obj.set(key="c", value=3)
+        assert "a" in obj
+        assert "b" not in obj
+        assert "c" in obj
+        assert obj.stats["evictions"] == 1
+
+    def test_pop_clear(self):
+        """Pass."""
+        obj = cache.Cache()
+        obj.set(key="a", value=1)
+        obj.set(key="b", value=2)
+        assert obj.pop(key="a") is True
+        assert obj.pop(key="a") is False
+        obj.clear()
+        assert len(obj) == 0
+
+    def test_get_or_set(self):
+        """Pass."""
+        obj = cache.Cache()
+        calls = []
+
+        def func():
+            calls.append(1)
+            time.sleep(0.05)
+            return "value"
+
+        threads = [
+            threading.Thread(target=obj.get_or_set, kwargs={"key": "a", "func": func})
+            for _ in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert obj.get_or_set(key="a", func=func) == "value"
+        assert len(calls) == 1
+        assert obj.stats["misses"] == 1
+        assert obj.stats["hits"] == 5
+
+
+class TestDiskCache(object):
+    """Test axonius_api_client.cache.DiskCache."""
+
+    def test_get_set(self, tmp_path):
+        """Pass."""
+        obj = cache.DiskCache(path=tmp_path)
+        assert obj.get(key="a") is None
+        obj.set(key="a", value={"x": [1]}, version="1")
+        assert obj.get(key="a", version="1") == {"x": [1]}
+        assert cache.DiskCache(path=tmp_path).get(key="a", version="1") == {"x": [1]}
+        assert obj.stats == {"hits": 1, "misses": 1}
+
+    def test_version(self, tmp_path):
+        """Pass."""
+        obj = cache.DiskCache(path=tmp_path)
+        obj.set(key="a", value=1, version="1")
+        assert obj.get(key="a", version="2", default=2) == 2
+
+    def test_max_age(self, tmp_path):
+        """Pass."""
+        obj = cache.DiskCache(path=tmp_path, max_age=0.05)
+        obj.set(key="a", value=1)
+        assert obj.get(key="a") == 1
+        time.sleep(0.1)
+        assert obj.get(key="a") is None
+
+    def test_pop_corrupt(self, tmp_path):
+        """Pass."""
+        obj = cache.DiskCache(path=tmp_path)
+        obj.set(key="a", value=1)
+        obj._entry_path(key="a").write_text("{{bad")
+        assert obj.get(key="a") is None
+        assert obj.pop(key="a") is True
+        assert obj.pop(key="a") is False
@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+"""Test suite for axonius_api_client.dataframe."""
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import pytest
+
+from axonius_api_client.api import assets
+
+pandas = pytest.importorskip("pandas")
+
+from axonius_api_client import dataframe  # noqa: E402
+
+FIELDS = {
+    "generic": {
+        "id": {"name": "internal_axon_id", "type": "string"},
+        "count": {"name": "adapter_list_length", "type": "integer"},
+        "hostname": {
+            "name": "specific_data.data.hostname",
+            "type": "array",
+            "items": {"type": "string"},
+        },
+        "fetch_time": {
+            "name": "specific_data.data.fetch_time",
+            "type": "string",
+            "format": "date-time",
+        },
+        "software_cves": {
+            "name": "specific_data.data.software_cves",
+            "type": "array",
+            "items": {
+                "type": "array",
+                "items": [
+                    {"name": "cve_id", "type": "string"},
+                    {"name": "cvss", "type": "number"},
+                ],
+            },
+        },
+    }
+}
+
+ROWS = [
+    {
+        "internal_axon_id": "x",
+        "adapter_list_length": 2,
+        "specific_data.data.hostname": ["a", "b"],
+        "specific_data.data.fetch_time": ["2020-01-02 03:04:05", "badwolf"],
+        "specific_data.data.software_cves": [
+            {"cve_id": "CVE-1", "cvss": 9.8},
+            {"cve_id": "CVE-2", "cvss": 4.3},
+        ],
+        "extra": "e",
+    },
+    {"internal_axon_id": "y", "adapter_list_length": "1"},
+]
+
+
+def get_schema(explode=None):
+    """Pass."""
+    index = assets.FieldIndex(all_fields=FIELDS, generic_alts=[], all_alts=[])
+    fields = [x["name"] for x in FIELDS["generic"].values()]
+    return dataframe.FrameSchema(fields=fields, index=index, explode=explode)
+
+
+class TestFrameSchema(object):
+    """Pass."""
+
+    def test_frame(self):
+        """Pass."""
+        df = get_schema().frame(rows=ROWS)
+        assert list(df.columns) == get_schema().fields
+        assert df["internal_axon_id"].tolist() == ["x", "y"]
+        assert df["adapter_list_length"].dtype.name == "Int64"
+        assert df["adapter_list_length"].tolist() == [2, 1]
+        assert df["specific_data.data.hostname"].tolist() == [["a", "b"], None]
+        assert df["specific_data.data.software_cves"][0][0]["cve_id"] == "CVE-1"
+
+    def test_frame_empty(self):
+        """Pass."""
+        df = get_schema().frame(rows=[])
+        assert list(df.columns) == get_schema().fields
+        assert df.empty
+
+    def test_explode_simple(self):
+        """Pass."""
+        df = get_schema(explode=["specific_data.data.fetch_time"]).frame(rows=ROWS)
+        times = df["specific_data.data.fetch_time"]
+        assert df["internal_axon_id"].tolist() == ["x", "x", "y"]
+        assert str(times.dtype).startswith("datetime64")
+        assert str(times.dt.tz) == "UTC"
+        assert times[0] == pandas.Timestamp("2020-01-02 03:04:05", tz="UTC")
+        assert times[1:].isna().all()
+
+    def test_explode_complex(self):
+        """Pass."""
+        name = "specific_data.data.software_cves"
+        df = get_schema(explode=[name]).frame(rows=ROWS)
+        assert list(df.columns)[-2:] == [name + ".cve_id", name + ".cvss"]
+        assert df["internal_axon_id"].tolist() == ["x", "x", "y"]
+        assert df[name + ".cve_id"].tolist()[:2] == ["CVE-1", "CVE-2"]
+        assert df[name + ".cvss"].dtype.name == "float64"
+
+        high = df[df[name + ".cvss"].between(6.0, 10.0)]
+        assert high["internal_axon_id"].tolist() == ["x"]
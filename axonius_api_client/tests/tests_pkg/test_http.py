@@ -2,8 +2,12 @@
 """Test suite for axonius_api_client.http."""
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+import io
 import logging
+import socket
 import sys
+import threading
+import zlib
 
 import pytest
 import requests
@@ -182,6 +186,222 @@ class TestHttp(object):
 
         assert response in http._HISTORY
 
+    def test_retry_status(self, request, httpbin):
+        """Test retries for response codes in retry_status."""
+        http = axonapi.Http(url=httpbin.url, retries=2, retry_backoff=0)
+
+        response = http(path="status/503")
+        assert response.status_code == 503
+        assert http.retry_counts == {"total": 2, "status": 2, "error": 0, "exhausted": 1}
+
+        response = http(path="status/503", method="post")
+        assert http.retry_counts["total"] == 2
+
+        response = http(path="status/503", method="post", idempotent=True)
+        assert http.retry_counts["total"] == 4
+
+    def test_retry_budget(self, request, httpbin):
+        """Test no retries are performed once retry_budget is used up."""
+        http = axonapi.Http(url=httpbin.url, retries=2, retry_backoff=0, retry_budget=3)
+
+        http(path="status/502")
+        http(path="status/502")
+        assert http.retry_counts["total"] == 3
+        assert http.retry_counts["exhausted"] == 2
+
+    def test_retry_error(self, request):
+        """Test retries for connection errors."""
+        http = axonapi.Http(url="https://127.0.0.1:1", retries=2, retry_backoff=0)
+
+        with pytest.raises(requests.exceptions.ConnectionError):
+            http()
+
+        assert http.retry_counts["error"] == 2
+
+    def test_retry_default(self, request):
+        """Test requests are not retried unless retries is supplied."""
+        http = axonapi.Http(url="https://127.0.0.1:1")
+
+        with pytest.raises(requests.exceptions.ConnectionError):
+            http()
+
+        assert http.retry_counts["total"] == 0
+
+    def test_retry_delay(self, request):
+        """Test Retry-After is honored and capped."""
+        http = axonapi.Http(url="https://127.0.0.1:1", retry_backoff_max=10)
+
+        assert http._retry_delay(attempt=1, retry_after="3") == 3
+        assert http._retry_delay(attempt=1, retry_after="300") == 10
+        assert 0 <= http._retry_delay(attempt=3) <= 10
+
+    def test_http_adapter(self, request):
+        """Test pool options and tcp_keepalive are used by the adapter."""
+        ax_url = utils.get_url(request)
+
+        http = axonapi.Http(
+            url=ax_url, pool_maxsize=5, pool_block=True, tcp_keepalive=True
+        )
+
+        assert isinstance(http.adapter, axonapi.http.HttpAdapter)
+        assert http.session.get_adapter(http.url) is http.adapter
+
+        pool_kw = http.adapter.poolmanager.connection_pool_kw
+        assert pool_kw["maxsize"] == 5
+        assert pool_kw["block"] is True
+        assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) in pool_kw["socket_options"]
+
+    def test_http_adapter_shared(self, request):
+        """Test an adapter can be shared between Http objects."""
+        ax_url = utils.get_url(request)
+
+        http1 = axonapi.Http(url=ax_url)
+        http2 = axonapi.Http(url=ax_url, http_adapter=http1.adapter)
+
+        assert http2.adapter is http1.adapter
+        assert http2.session.get_adapter(http2.url) is http1.adapter
+
+        pools = http1.adapter.poolmanager.pools
+        http1.adapter.poolmanager.connection_from_url(http1.url)
+        assert len(pools) == 1
+
+        http1.session.close()
+        assert len(pools) == 1
+
+        http2.session.close()
+        assert len(pools) == 0
+
+    def test_compress(self, request, httpbin):
+        """Test request bodies are compressed and sizes are counted."""
+        http = axonapi.Http(url=httpbin.url, compress=True, compress_min_size=10)
+
+        response = http(method="post", path="anything", json={"x": "x" * 1000})
+        assert response.request.headers["Content-Encoding"] == "gzip"
+        assert response.request.size_wire < response.request.size
+
+        response = http(path="gzip")
+        assert response.size == len(response.content)
+        assert response.size_wire == response.raw.tell()
+
+        counts = http.byte_counts
+        assert counts["requests"] == 2
+        assert counts["response_size_wire"] > 0
+
+    def test_compress_request(self, request):
+        """Test only bodies of compress_min_size or more are compressed."""
+        ax_url = utils.get_url(request)
+
+        http = axonapi.Http(url=ax_url, compress=True, compress_min_size=100)
+
+        small = http.session.prepare_request(
+            requests.Request(method="post", url=ax_url, json={"x": "x"})
+        )
+        assert http._compress_request(request=small) is None
+        assert "Content-Encoding" not in small.headers
+        assert small.size == small.size_wire == len(small.body)
+
+        big = http.session.prepare_request(
+            requests.Request(method="post", url=ax_url, json={"x": "x" * 1000})
+        )
+        body = big.body
+        assert http._compress_request(request=big) == body
+        assert big.headers["Content-Encoding"] == "gzip"
+        assert zlib.decompress(big.body, 31) == body
+        assert big.size_wire == len(big.body) < big.size
+
+        files = http.session.prepare_request(
+            requests.Request(
+                method="post", url=ax_url, files={"file": ("x.csv", "x" * 1000)}
+            )
+        )
+        body = files.body
+        assert http._compress_request(request=files) is None
+        assert "Content-Encoding" not in files.headers
+        assert files.body == body
+
+    def test_compress_error(self, request, monkeypatch):
+        """Test a compressed request that errors is sent again uncompressed."""
+        ax_url = utils.get_url(request)
+
+        http = axonapi.Http(url=ax_url, compress=True, compress_min_size=100)
+        sent = []
+
+        def send(send_args, retries):
+            sent.append(send_args["request"].headers.get("Content-Encoding"))
+            response = requests.Response()
+            response.status_code = 400 if sent[-1] else 200
+            response.raw = io.BytesIO()
+            response.request = send_args["request"]
+            return response
+
+        monkeypatch.setattr(http, "_send", send)
+
+        response = http(method="post", json={"x": "x" * 1000})
+        assert response.status_code == 200
+        assert sent == ["gzip", None]
+        assert http._COMPRESS is False
+
+    def test_history_size(self, request):
+        """Test history keeps only the last history_size responses."""
+        ax_url = utils.get_url(request)
+
+        http = axonapi.Http(
+            url=ax_url, save_history=True, history_size=2, certwarn=False
+        )
+
+        responses = [http() for _ in range(3)]
+
+        assert list(http._HISTORY) == responses[1:]
+
+    def test_history_meta_sample(self, request):
+        """Test history with history_meta=True and history_sample=2."""
+        ax_url = utils.get_url(request)
+
+        http = axonapi.Http(
+            url=ax_url,
+            save_history=True,
+            history_meta=True,
+            history_sample=2,
+            certwarn=False,
+        )
+
+        responses = [http() for _ in range(3)]
+
+        assert len(http._HISTORY) == 2
+        entry = http._HISTORY[0]
+        assert entry["url"] == responses[0].url
+        assert entry["method"] == "GET"
+        assert entry["status_code"] == responses[0].status_code
+        assert entry["size"] == len(responses[0].content)
+        assert isinstance(entry["elapsed"], float)
+
+    def test_history_sample_threads(self, request):
+        """Test history_sample keeps 1 of every N responses added from threads."""
+        ax_url = utils.get_url(request)
+
+        http = axonapi.Http(
+            url=ax_url,
+            save_history=True,
+            history_size=None,
+            history_sample=3,
+            certwarn=False,
+        )
+
+        def add():
+            for _ in range(300):
+                http._add_history(response=object())
+
+        threads = [threading.Thread(target=add) for _ in range(10)]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        assert http._HISTORY_SEEN == 3000
+        assert len(http._HISTORY) == 1000
+
     def test_client_cert_missing_one(self, request, tmp_path):
         """Test cert or key supplied, but not the other."""
         ax_url = utils.get_url(request)
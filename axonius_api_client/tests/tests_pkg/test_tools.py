@@ -227,6 +227,54 @@ class TestJoinCr(object):
         assert r == "\n  x\n  a\n  c\n  "
 
 
+class TestJsonCodec(object):
+    """Test axonius_api_client.tools.JsonCodec."""
+
+    @pytest.mark.parametrize("name", tools.JSON_CODECS)
+    def test_codec(self, name):
+        """Pass."""
+        try:
+            codec = tools.JsonCodec(name=name)
+        except exceptions.ToolsError:
+            pytest.skip("{} is not installed".format(name))
+
+        obj = {"b": [1, 2.5, None, True], "a": "x/y"}
+        assert codec.loads(b'{"b": [1, 2.5, null, true], "a": "x/y"}') == obj
+        assert codec.loads(codec.dumps(obj)) == obj
+        assert codec.dumps(obj, indent=2, sort_keys=True) == tools.json.dumps(
+            obj, indent=2, sort_keys=True
+        )
+        assert codec.dumps({1: 2}) == '{"1": 2}'
+
+        obj = {"a": "caf\u00e9", "b": ["\u2603"]}
+        for ensure_ascii in [True, False]:
+            assert codec.dumps(
+                obj, indent=2, ensure_ascii=ensure_ascii
+            ) == tools.json.dumps(obj, indent=2, ensure_ascii=ensure_ascii)
+
+        obj = {"a": [float("nan"), None], "b": {"c": float("inf")}}
+        assert codec.dumps(obj, indent=2) == tools.json.dumps(obj, indent=2)
+
+        with pytest.raises(TypeError):
+            codec.dumps({"a": tools.dt_now()}, indent=2)
+
+    @pytest.mark.parametrize("name", tools.JSON_CODECS)
+    def test_codec_error(self, name):
+        """Pass."""
+        try:
+            codec = tools.JsonCodec(name=name)
+        except exceptions.ToolsError:
+            pytest.skip("{} is not installed".format(name))
+
+        with pytest.raises(ValueError):
+            codec.loads("{{}")
+
+    def test_not_installed(self):
+        """Pass."""
+        with pytest.raises(exceptions.ToolsError):
+            tools.JsonCodec(name="badwolf")
+
+
 class TestPath(object):
     """Test axonius_api_client.tools.path."""
 
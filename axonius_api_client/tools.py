@@ -2,7 +2,9 @@
 """Axonius API Client utility tools module."""
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+import importlib
 import json
+import math
 import sys
 from datetime import datetime, timedelta
 
@@ -30,6 +32,7 @@ INT = six.integer_types
 BYTES = six.binary_type
 SIMPLE = tuple(list(STR) + [int, bool, float])
 SIMPLE_NONE = tuple(list(SIMPLE) + [None])
+JSON_CODECS = ["orjson", "ujson", "simdjson", "json"]
 YES = [True, 1, "1", "true", "t", "yes", "y", "yas"]
 NO = [False, 0, "0", "false", "f", "no", "n", "noes"]
 
@@ -211,10 +214,163 @@ def strip_left(obj, fix):
     return obj
 
 
+class JsonCodec(object):
+    """Decode and encode JSON using the first library in JSON_CODECS installed.
+
+    Notes:
+        simdjson is only used for decoding. Encoding uses the stdlib json module
+        when not indenting, so the output is the same no matter which library is
+        used, and for objects the library can not encode. orjson can not escape
+        non-ASCII characters, so its output is only used if it is ASCII or
+        ensure_ascii is False.
+    """
+
+    def __init__(self, name=None):
+        """Pass.
+
+        Args:
+            name (:obj:`str`, optional):
+                Name of JSON library to use instead of the first one installed from
+                :data:`JSON_CODECS`.
+
+                Defaults to: None.
+
+        Raises:
+            :exc:`exceptions.ToolsError`: if name is supplied and not installed.
+
+        """
+        names = [name] if name else JSON_CODECS
+
+        for name in names:
+            try:
+                self.module = importlib.import_module(name)
+            except ImportError:
+                continue
+            self.name = name
+            break
+        else:
+            msg = "JSON library {n!r} is not installed"
+            msg = msg.format(n=names[0])
+            raise exceptions.ToolsError(msg)
+
+    def __str__(self):
+        """Pass."""
+        return "{c}(name={n!r})".format(c=self.__class__.__name__, n=self.name)
+
+    def __repr__(self):
+        """Pass."""
+        return self.__str__()
+
+    def loads(self, obj):
+        """Decode JSON from a str or bytes.
+
+        Notes:
+            If the library fails to decode obj, the stdlib json module is tried so
+            errors are the same no matter which library is used.
+
+        Returns:
+            :obj:`object`
+
+        """
+        if self.name != "json":
+            try:
+                return self.module.loads(obj)
+            except Exception:
+                pass
+
+        if isinstance(obj, BYTES):
+            obj = obj.decode("utf-8")
+        return json.loads(obj)
+
+    def dumps(self, obj, indent=None, sort_keys=False, ensure_ascii=True):
+        """Encode an object to a JSON str.
+
+        Args:
+            obj (:obj:`object`):
+                Object to encode.
+            indent (:obj:`int`, optional):
+                Number of spaces to indent with.
+
+                Defaults to: None.
+            sort_keys (:obj:`bool`, optional):
+                Sort the keys of dicts.
+
+                Defaults to: False.
+            ensure_ascii (:obj:`bool`, optional):
+                Escape non-ASCII characters, the same as :func:`json.dumps`.
+
+                Defaults to: True.
+
+        Returns:
+            :obj:`str`
+
+        """
+        if self.name == "orjson" and indent == 2:
+            option = self.module.OPT_INDENT_2
+            option |= self.module.OPT_PASSTHROUGH_DATETIME
+            option |= self.module.OPT_PASSTHROUGH_DATACLASS
+            if sort_keys:
+                option |= self.module.OPT_SORT_KEYS
+            try:
+                data = self.module.dumps(obj, option=option)
+            except TypeError:
+                pass
+            else:
+                # orjson encodes NaN and Infinity as null
+                if b"null" not in data or not has_nonfinite(obj):
+                    try:
+                        return data.decode("ascii" if ensure_ascii else "utf-8")
+                    except UnicodeDecodeError:
+                        pass
+        elif self.name == "ujson" and indent:
+            try:
+                return self.module.dumps(
+                    obj,
+                    indent=indent,
+                    sort_keys=sort_keys,
+                    ensure_ascii=ensure_ascii,
+                    escape_forward_slashes=False,
+                )
+            except (TypeError, OverflowError):
+                pass
+
+        return json.dumps(
+            obj, indent=indent, sort_keys=sort_keys, ensure_ascii=ensure_ascii
+        )
+
+
+def has_nonfinite(obj):
+    """Check if an object has a NaN or Infinity float anywhere in it.
+
+    Args:
+        obj (:obj:`object`): object to check, walking into dicts, lists, and tuples
+
+    Returns:
+        :obj:`bool`
+
+    """
+    objs = [obj]
+    while objs:
+        obj = objs.pop()
+        if isinstance(obj, float):
+            if math.isinf(obj) or math.isnan(obj):
+                return True
+        elif isinstance(obj, dict):
+            objs.extend(obj.values())
+        elif isinstance(obj, (list, tuple)):
+            objs.extend(obj)
+    return False
+
+
+JSON_CODEC = JsonCodec()
+
+
 def json_dump(obj, indent=2, sort_keys=False, error=True, **kwargs):
     """Pass."""
     try:
-        return json.dumps(obj, indent=indent, sort_keys=sort_keys, **kwargs)
+        if kwargs:
+            return json.dumps(obj, indent=indent, sort_keys=sort_keys, **kwargs)
+        return JSON_CODEC.dumps(obj, indent=indent, sort_keys=sort_keys)
     except Exception:
         if error:
             raise
@@ -224,7 +380,9 @@ def json_dump(obj, indent=2, sort_keys=False, error=True, **kwargs):
 def json_load(obj, error=True, **kwargs):
     """Pass."""
     try:
-        return json.loads(obj, **kwargs)
+        if kwargs:
+            return json.loads(obj, **kwargs)
+        return JSON_CODEC.loads(obj)
     except Exception:
         if error:
             raise
@@ -264,11 +422,12 @@ def dt_now(delta=None, tz=dateutil.tz.tzutc()):
     return datetime.now(tz)
 
 
-def dt_sec_ago(obj):
+def dt_sec_ago(obj, exact=False):
     """Pass."""
     obj = dt_parse(obj=obj)
     now = dt_now(tz=obj.tzinfo)
-    return round((now - obj).total_seconds())
+    seconds = (now - obj).total_seconds()
+    return seconds if exact else round(seconds)
 
 
 def dt_min_ago(obj):
@@ -0,0 +1,59 @@
+#!/usr/bin/env python -i
+# -*- coding: utf-8 -*-
+"""Example script for devices with vulnerable software with min/max CVSS score.
+
+The same report as cvss_filtering.py, using a DataFrame from get_dataframe so the
+filtering is done by pandas instead of looping over each device.
+"""
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+if __name__ == "__main__":
+    import os
+
+    import axonius_api_client as axonapi
+
+    tools = axonapi.tools
+    axonapi.cli.cli_constants.load_dotenv()
+
+    AX_URL = os.environ["AX_URL"]
+    AX_KEY = os.environ["AX_KEY"]
+    AX_SECRET = os.environ["AX_SECRET"]
+
+    ctx = axonapi.Connect(url=AX_URL, key=AX_KEY, secret=AX_SECRET, certwarn=False)
+
+    ctx.start()
+
+    devices = ctx.devices
+
+    QUERY = None
+    FIELDS = ["software_cves"]
+    CVSS_MIN = 6.0
+    CVSS_MAX = 10.0
+    CVES = "specific_data.data.software_cves"
+    DUMP_DVC_KEYS = [
+        "specific_data.data.hostname",
+        "specific_data.data.name",
+        "specific_data.data.network_interfaces.ips",
+        "internal_axon_id",
+    ]
+    DUMP_SW_KEYS = [
+        "cve_id",
+        "cve_severity",
+        "cvss",
+        "software_name",
+        "software_vendor",
+    ]
+
+    df = devices.get_dataframe(query=QUERY, fields=FIELDS, explode=FIELDS)
+
+    sw_keys = [CVES + "." + x for x in DUMP_SW_KEYS if CVES + "." + x in df]
+    dvc_keys = [x for x in DUMP_DVC_KEYS if x in df]
+
+    found = df[df[CVES + ".cvss"].between(CVSS_MIN, CVSS_MAX)]
+    found = found.drop_duplicates(subset=["internal_axon_id"] + sw_keys)
+    found = found.sort_values(
+        by=["internal_axon_id", CVES + ".cvss"], ascending=[True, False]
+    )
+
+    print(found.groupby("internal_axon_id")[CVES + ".cvss"].agg(["count", "max"]))
+    print(found[dvc_keys + sw_keys].to_string(index=False))
@@ -0,0 +1,106 @@
+#!/usr/bin/env python -i
+# -*- coding: utf-8 -*-
+"""Benchmark of cli.serial.RowFlattener against cli.serial.compress_row.
+
+Flattens AX_ROWS synthetic device rows with the fields of a synthetic schema, the
+way the csv and table export formats do.
+"""
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+if __name__ == "__main__":
+    import os
+    import timeit
+
+    import axonius_api_client as axonapi
+
+    serial = axonapi.cli.serial
+
+    ROWS = int(os.environ.get("AX_ROWS", "100000"))
+    REPEAT = int(os.environ.get("AX_REPEAT", "3"))
+    PREFIX = "specific_data.data"
+
+    def key(name):
+        """Build the fully qualified name of a field."""
+        return "{}.{}".format(PREFIX, name)
+
+    def simple(name, is_list=True):
+        """Build a field of simple values."""
+        field = {"name": key(name), "title": name}
+        if is_list:
+            field.update({"type": "array", "items": {"type": "string"}})
+        else:
+            field["type"] = "string"
+        return field
+
+    def objects(name, sub_names):
+        """Build a field of an array of objects."""
+        sub_fields = [
+            {"name": x, "title": x, "type": "array", "items": {"type": "string"}}
+            for x in sub_names
+        ]
+        return {
+            "name": key(name),
+            "title": name,
+            "type": "array",
+            "items": {"type": "array", "items": sub_fields},
+        }
+
+    fields = [
+        simple("hostname"),
+        simple("name"),
+        simple("os.type"),
+        simple("last_seen", is_list=False),
+        objects("network_interfaces", ["mac", "ips", "subnets"]),
+        objects("installed_software", ["name", "version", "vendor"]),
+    ]
+    all_fields = {"generic": {x["title"]: x for x in fields}}
+    index = axonapi.api.assets.FieldIndex(
+        all_fields=all_fields, generic_alts=[], all_alts=[]
+    )
+
+    def make_row(num):
+        """Build a synthetic device row."""
+        return {
+            "internal_axon_id": "{:032x}".format(num),
+            "adapters": ["aws_adapter", "crowd_strike_adapter"],
+            key("hostname"): ["host{}".format(num), "host{}.local".format(num)],
+            key("name"): ["host{}".format(num)],
+            key("os.type"): ["Windows"],
+            key("last_seen"): "2020-01-01 00:00:00",
+            key("network_interfaces"): [
+                {
+                    "mac": "00:00:00:00:{:02x}:{:02x}".format(num % 256, x),
+                    "ips": ["10.0.{}.{}".format(num % 256, x), "fe80::{}".format(x)],
+                    "subnets": ["10.0.{}.0/24".format(num % 256)],
+                }
+                for x in range(2)
+            ],
+            key("installed_software"): [
+                {"name": "app{}".format(x), "version": "1.{}".format(x), "vendor": "v"}
+                for x in range(10)
+            ],
+        }
+
+    rows = [make_row(num=x) for x in range(ROWS)]
+    print("Built {} synthetic device rows".format(len(rows)))
+
+    def run_compress_row():
+        """Flatten every row with compress_row."""
+        return [serial.compress_row(raw_row=x) for x in rows]
+
+    def run_flattener(index):
+        """Flatten every row with a RowFlattener."""
+        flattener = serial.RowFlattener(index=index)
+        return [flattener.flatten(raw_row=x) for x in rows]
+
+    assert run_compress_row() == run_flattener(index=index)
+
+    runs = [
+        ("compress_row", run_compress_row),
+        ("RowFlattener index=None", lambda: run_flattener(index=None)),
+        ("RowFlattener", lambda: run_flattener(index=index)),
+    ]
+
+    for name, func in runs:
+        took = min(timeit.repeat(func, number=1, repeat=REPEAT))
+        print("{:<24} {:.3f}s ({:.0f} rows/s)".format(name, took, ROWS / took))
@@ -0,0 +1,78 @@
+#!/usr/bin/env python -i
+# -*- coding: utf-8 -*-
+"""Benchmark of the JSON libraries supported by tools.JsonCodec on asset pages.
+
+Pages are read from the .json files in AX_PAGES_DIR. If there are none, AX_PAGES
+pages of devices are recorded there first using AX_URL, AX_KEY, and AX_SECRET.
+"""
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+if __name__ == "__main__":
+    import os
+    import timeit
+
+    import axonius_api_client as axonapi
+
+    tools = axonapi.tools
+    axonapi.cli.cli_constants.load_dotenv()
+
+    PAGES_DIR = tools.path(os.environ.get("AX_PAGES_DIR", "recorded_pages"))
+    PAGES = int(os.environ.get("AX_PAGES", "5"))
+    PAGE_SIZE = int(os.environ.get("AX_PAGE_SIZE", "2000"))
+    REPEAT = int(os.environ.get("AX_REPEAT", "5"))
+
+    def record_pages():
+        """Save the raw bodies of PAGES pages of devices to PAGES_DIR."""
+        ctx = axonapi.Connect(
+            url=os.environ["AX_URL"],
+            key=os.environ["AX_KEY"],
+            secret=os.environ["AX_SECRET"],
+            certwarn=False,
+        )
+        ctx.start()
+
+        devices = ctx.devices
+        fields = devices.fields.validate(all_fields=True)
+
+        for page_num in range(PAGES):
+            response = devices._get(
+                fields=fields,
+                row_start=page_num * PAGE_SIZE,
+                page_size=PAGE_SIZE,
+                raw=True,
+            )
+            path = PAGES_DIR / "page_{:04d}.json".format(page_num)
+            tools.path_write(obj=path, data=response.content, binary=True)
+            print("Recorded {} bytes to {}".format(len(response.content), path))
+
+    if not list(PAGES_DIR.glob("*.json")):
+        record_pages()
+
+    pages = [x.read_bytes() for x in sorted(PAGES_DIR.glob("*.json"))]
+    size = sum(len(x) for x in pages)
+    print("Loaded {} pages with {} bytes from {}".format(len(pages), size, PAGES_DIR))
+
+    for name in tools.JSON_CODECS:
+        try:
+            codec = tools.JsonCodec(name=name)
+        except axonapi.exceptions.ToolsError:
+            print("{:<10} not installed".format(name))
+            continue
+
+        objs = [codec.loads(x) for x in pages]
+
+        loads = min(
+            timeit.repeat(
+                lambda: [codec.loads(x) for x in pages], number=1, repeat=REPEAT
+            )
+        )
+        dumps = min(
+            timeit.repeat(
+                lambda: [codec.dumps(x, indent=2) for x in objs], number=1, repeat=REPEAT
+            )
+        )
+        print(
+            "{:<10} loads {:.3f}s ({:.1f} MB/s), dumps indent=2 {:.3f}s".format(
+                name, loads, size / loads / 1024 / 1024, dumps
+            )
+        )
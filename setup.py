@@ -42,9 +42,16 @@ setup(
         "python-dateutil",
         'pyreadline ; platform_system == "Windows"',
         "pathlib2 ; python_version < '3.0'",
+        "futures ; python_version < '3.0'",
         "tabulate",
         "six>=1.14.0",
     ],
+    extras_require={
+        "async": ["httpx>=0.26 ; python_version >= '3.6'"],
+        "fastjson": ["orjson ; python_version >= '3.6'"],
+        "arrow": ["pyarrow ; python_version >= '3.6'"],
+        "pandas": ["pandas ; python_version >= '3.6'"],
+    },
     keywords=["Axonius", "API Library"],
     tests_require=["pytest", "pytest-cov", "pytest-httpbin", "coverage"],
     license=ABOUT["__license__"],